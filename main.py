@@ -1,75 +1,307 @@
+import os
+import re
+import sys
+import bz2
+import csv
+import glob
+import gzip
+import json
+import heapq
+import hashlib
+import lzma
+import mmap
 import time
+import struct
+import signal
+import zipfile
+import operator
+import multiprocessing
+import queue
 import random
-from copy import deepcopy
+import shutil
+import tempfile
+import warnings
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from contextlib import ExitStack, contextmanager
+from itertools import chain, combinations, compress
+from math import comb, inf
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy este optional; fara el se folosesc doar array-uri standard
+    np = None
+
+try:
+    import resource
+except ImportError:  # indisponibil pe Windows; limita de memorie a lotului este atunci ignorata
+    resource = None
 
 limita_clauze_rezolutie = 1000000 #Limita aleasa arbitrar consuma foarte multe resurse (memorie si timp) daca este mai mare
 limita_clauze_dp = 1000000 #La fel si pentru dp
 
 
+# --- Arena de clauze (reprezentare compacta) ---
+class ArenaClauze:
+    """Formula stocata compact: toti literalii intr-un array int32 plat plus offset-urile clauzelor.
+
+    Clauza i ocupa literali[inceputuri[i]:inceputuri[i + 1]]. Iterarea intoarce cate o lista
+    per clauza, asa ca solver-ele pot citi arena direct, la fel ca o lista de liste.
+    """
+
+    def __init__(self, literali=None, inceputuri=None, numar_variabile=0):
+        self.literali = literali if literali is not None else array('i')
+        self.inceputuri = inceputuri if inceputuri is not None else array('q', [0])
+        self.numar_variabile = numar_variabile
+        self.clauza_goala = False  # Mentinut de constructori, evita o trecere separata
+
+    @classmethod
+    def din_clauze(cls, clauze, numar_variabile=0):
+        arena = cls(numar_variabile=numar_variabile)
+        for clauza in clauze:
+            if not clauza:
+                arena.clauza_goala = True
+            arena.literali.extend(clauza)
+            arena.inceputuri.append(len(arena.literali))
+        return arena
+
+    def __len__(self):
+        return len(self.inceputuri) - 1
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Indice de clauza in afara arenei")
+        return self.literali[self.inceputuri[indice]:self.inceputuri[indice + 1]].tolist()
+
+    def __iter__(self):
+        literali = self.literali
+        inceputuri = self.inceputuri
+        for indice in range(len(inceputuri) - 1):
+            yield literali[inceputuri[indice]:inceputuri[indice + 1]].tolist()
+
+    def contine_clauza_goala(self):
+        return self.clauza_goala
+
+
 # --- Parsor DIMACS ---
-def parseaza_dimacs(cale_fisier):
-    """Parseaza un fisier in format DIMACS."""
-    clauze = []
+LINIE_SPECIALA_DIMACS = re.compile(rb'^[ \t]*[cp%]', re.M)
+
+
+def tokenizeaza_bloc(bloc):
+    """Transforma un bloc de text DIMACS (fara linii speciale) in literali int32, in masa.
+
+    Cu NumPy se foloseste parserul C din np.fromstring; altfel array('i', map(int, ...)).
+    """
+    if not bloc or bloc.isspace():
+        return array('i')
+    if np is not None:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                valori = np.fromstring(bloc, dtype=np.int64, sep=' ')
+            if not len(valori) or (valori.min() >= -2 ** 31 and valori.max() < 2 ** 31):
+                return valori.astype(np.int32)
+        except (ValueError, DeprecationWarning):
+            pass
+    try:
+        jetoane = array('i', map(int, bloc.split()))
+    except (ValueError, OverflowError):
+        for jeton in bloc.split():
+            try:
+                array('i', [int(jeton)])
+            except (ValueError, OverflowError):
+                raise ValueError(f"Format invalid al literalilor: {jeton.decode(errors='replace')}")
+        raise
+    if np is not None:
+        return np.frombuffer(jetoane, dtype=np.int32)
+    return jetoane
+
+
+def citeste_arena_dimacs(flux, dimensiune_bloc=1 << 22):
+    """Citeste DIMACS dintr-un flux binar, in blocuri mari, direct intr-o ArenaClauze.
+
+    Tokenizarea se face in masa pe fiecare bloc (vezi tokenizeaza_bloc), iar limitele
+    clauzelor si intervalul literalilor sunt calculate in aceeasi trecere. Linia '%' (folosita
+    de fisierele SATLIB) incheie formula. Intoarce (arena, numar_variabile, numar_clauze_asteptat,
+    literal_minim, literal_maxim).
+    """
+    arena = ArenaClauze()
+    literali = arena.literali
+    inceputuri = arena.inceputuri
     numar_variabile = 0
     numar_clauze_asteptat = 0
-    try:
-        with open(cale_fisier, 'r') as f:
-            for linie in f:
+    literal_minim = 0
+    literal_maxim = 0
+    rest = b''
+    sfarsit = False
+
+    while not sfarsit:
+        bloc = flux.read(dimensiune_bloc)
+        if bloc:
+            bloc = rest + bloc
+            ultima_linie = bloc.rfind(b'\n')
+            if ultima_linie < 0:
+                rest = bloc
+                continue
+            rest = bloc[ultima_linie + 1:]
+            bloc = bloc[:ultima_linie + 1]
+        else:
+            bloc, rest = rest, b''
+            sfarsit = True
+
+        if (b'c' in bloc or b'p' in bloc or b'%' in bloc) and LINIE_SPECIALA_DIMACS.search(bloc):
+            pastrate = []
+            for linie in bloc.split(b'\n'):
                 linie = linie.strip()
-                if not linie or linie.startswith('c'):
+                if not linie or linie.startswith(b'c'):
                     continue
-                if linie.startswith('p cnf'):
+                if linie.startswith(b'p'):
                     parti = linie.split()
-                    if len(parti) != 4:
+                    if len(parti) != 4 or parti[1] != b'cnf':
                         raise ValueError("Format invalid pentru linia 'p'")
                     numar_variabile = int(parti[2])
                     numar_clauze_asteptat = int(parti[3])
+                elif linie.startswith(b'%'):
+                    sfarsit = True
+                    break
                 else:
-                    try:
-                        literali = list(map(int, linie.split()))
-                        if not literali or literali[-1] != 0:
-                            if literali and literali[-1] != 0:
-                                print(f"Avertisment: Linia de clauza nu se termina cu 0, se adauga implicit: {linie}")
-                            elif not literali:
-                                print(f"Avertisment: Se omite linia goala sau invalida: {linie}")
-                                continue
-
-                        continut_clauza = literali[:-1] if literali and literali[-1] == 0 else literali
-
-                        if continut_clauza:
-                            clauze.append(continut_clauza)
-                        else:
-                            print(
-                                "Avertisment: Clauza goala '0' detectata in fisierul de intrare. Formula este UNSAT.")
-                            clauze.append([])
+                    pastrate.append(linie)
+            bloc = b' '.join(pastrate)
 
-                    except ValueError:
-                        raise ValueError(f"Format invalid al literalilor in linia: {linie}")
+        jetoane = tokenizeaza_bloc(bloc)
+        if not len(jetoane):
+            continue
+
+        literal_minim = min(literal_minim, int(jetoane.min()) if np is not None else min(jetoane))
+        literal_maxim = max(literal_maxim, int(jetoane.max()) if np is not None else max(jetoane))
+
+        baza = len(literali)
+        ultimul_inceput = inceputuri[-1]
+        if np is not None:
+            zerouri = np.flatnonzero(jetoane == 0)
+            literali.frombytes(jetoane[jetoane != 0].tobytes())
+            noi = zerouri - np.arange(len(zerouri)) + baza
+            if len(noi) and (noi[0] == ultimul_inceput or np.any(noi[1:] == noi[:-1])):
+                arena.clauza_goala = True
+            inceputuri.frombytes(noi.astype(np.int64).tobytes())
+        else:
+            zerouri = list(compress(range(len(jetoane)), map(operator.not_, jetoane)))
+            literali.extend(filter(None, jetoane))
+            noi = array('q', map(operator.sub, zerouri, range(-baza, len(zerouri) - baza)))
+            if len(noi) and (noi[0] == ultimul_inceput or len(set(noi)) < len(noi)):
+                arena.clauza_goala = True
+            inceputuri.extend(noi)
+
+    if len(literali) > inceputuri[-1]:
+        print("Avertisment: Ultima clauza nu se termina cu 0, se adauga implicit.")
+        inceputuri.append(len(literali))
+
+    arena.numar_variabile = numar_variabile
+    return arena, numar_variabile, numar_clauze_asteptat, literal_minim, literal_maxim
+
+
+# --- Surse de intrare (fisiere simple, comprimate sau din arhive .zip) ---
+DECOMPRESOARE = {  # Fiecare accepta atat o cale cat si un flux deja deschis
+    '.gz': gzip.open,
+    '.xz': lzma.open,
+    '.lzma': lzma.open,
+    '.bz2': bz2.open,
+}
+
+
+def imparte_cale_zip(cale):
+    """Recunoaste 'arhiva.zip/membru' sau 'arhiva.zip::membru'. Intoarce (arhiva, membru) sau (None, None)."""
+    if '::' in cale:
+        arhiva, membru = cale.split('::', 1)
+        if arhiva.lower().endswith('.zip'):
+            return arhiva, membru
+    if os.path.exists(cale):
+        return None, None
+    parti = cale.replace(os.sep, '/').split('/')
+    for i in range(1, len(parti)):
+        arhiva = '/'.join(parti[:i])
+        if arhiva.lower().endswith('.zip') and os.path.isfile(arhiva):
+            return arhiva, '/'.join(parti[i:])
+    return None, None
+
+
+def sursa_cnf_exista(cale):
+    arhiva, membru = imparte_cale_zip(cale)
+    if arhiva is None:
+        return os.path.isfile(cale)
+    with zipfile.ZipFile(arhiva) as z:
+        return membru in z.namelist()
+
+
+@contextmanager
+def deschide_sursa_cnf(cale):
+    """Deschide o sursa CNF ca flux binar citit in blocuri, fara a o incarca integral in memorie.
+
+    Fisierele simple sunt mapate in memorie (mmap); .gz, .xz/.lzma si .bz2 sunt decomprimate
+    din mers, inclusiv cand sunt membri ai unei arhive .zip.
+    """
+    arhiva, membru = imparte_cale_zip(cale)
+    if arhiva is not None:
+        with zipfile.ZipFile(arhiva) as z:
+            try:
+                info = z.getinfo(membru)
+            except KeyError:
+                raise FileNotFoundError(f"Membrul {membru} nu exista in arhiva {arhiva}")
+            with z.open(info) as flux:
+                decompresor = DECOMPRESOARE.get(os.path.splitext(membru)[1].lower())
+                if decompresor is None:
+                    yield flux
+                else:
+                    with decompresor(flux, 'rb') as f:
+                        yield f
+        return
 
-            if numar_variabile == 0 and clauze:
-                print("Avertisment: Linia 'p cnf' nu a fost gasita sau numar_variabile este 0.")
-                toate_variabilele = set(abs(literal) for clauza in clauze for literal in clauza)
-                numar_variabile = max(toate_variabilele) if toate_variabilele else 0
-                print(f"Numar de variabile dedus: {numar_variabile}")
+    decompresor = DECOMPRESOARE.get(os.path.splitext(cale)[1].lower())
+    if decompresor is not None:
+        with decompresor(cale, 'rb') as f:
+            yield f
+        return
 
-            if numar_clauze_asteptat > 0 and len(clauze) != numar_clauze_asteptat:
-                print(
-                    f"Avertisment: Se asteptau {numar_clauze_asteptat} clauze (conform liniei 'p'), dar s-au gasit {len(clauze)} clauze efective.")
-
-            if numar_variabile > 0:
-                for clauza in clauze:
-                    for literal in clauza:
-                        if abs(literal) > numar_variabile or literal == 0:
-                            if literal == 0 and clauza:
-                                raise ValueError(f"Literalul 0 gasit intr-o clauza non-goala: {clauza}")
-                            elif abs(literal) > numar_variabile:
-                                raise ValueError(
-                                    f"Literal invalid {literal} pentru numar_variabile {numar_variabile} in clauza {clauza}")
-
-            print(f"S-au parsat {len(clauze)} clauze cu {numar_variabile} variabile din {cale_fisier}")
-            if any(not c for c in clauze):
-                print("Nota: Formula contine initial o clauza goala -> UNSAT")
-            return clauze, numar_variabile
+    with open(cale, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as harta:
+            yield harta
+
+
+def parseaza_dimacs(cale_fisier):
+    """Parseaza un fisier in format DIMACS intr-o ArenaClauze (vezi deschide_sursa_cnf pentru surse)."""
+    try:
+        with deschide_sursa_cnf(cale_fisier) as f:
+            clauze, numar_variabile, numar_clauze_asteptat, literal_minim, literal_maxim = citeste_arena_dimacs(f)
+
+        variabila_maxima = max(literal_maxim, -literal_minim)
+        if numar_variabile == 0 and len(clauze) > 0:
+            print("Avertisment: Linia 'p cnf' nu a fost gasita sau numar_variabile este 0.")
+            numar_variabile = variabila_maxima
+            clauze.numar_variabile = numar_variabile
+            print(f"Numar de variabile dedus: {numar_variabile}")
+
+        if numar_clauze_asteptat > 0 and len(clauze) != numar_clauze_asteptat:
+            print(
+                f"Avertisment: Se asteptau {numar_clauze_asteptat} clauze (conform liniei 'p'), dar s-au gasit {len(clauze)} clauze efective.")
+
+        if numar_variabile > 0 and variabila_maxima > numar_variabile:
+            for clauza in clauze:
+                for literal in clauza:
+                    if abs(literal) > numar_variabile:
+                        raise ValueError(
+                            f"Literal invalid {literal} pentru numar_variabile {numar_variabile} in clauza {clauza}")
+
+        print(f"S-au parsat {len(clauze)} clauze cu {numar_variabile} variabile din {cale_fisier}")
+        if clauze.contine_clauza_goala():
+            print("Nota: Formula contine initial o clauza goala -> UNSAT")
+        return clauze, numar_variabile
 
     except FileNotFoundError:
         print(f"Eroare: Fisierul nu a fost gasit la {cale_fisier}")
@@ -81,6 +313,216 @@ def parseaza_dimacs(cale_fisier):
         return None, 0
 
 
+# --- Cache pe disc (formule parsate si preprocesate, dupa hash-ul continutului) ---
+class CacheFormule:
+    """Cache LRU marginit, pe disc, al arenelor parsate si al formulelor preprocesate.
+
+    Cheia este hash-ul continutului sursei (fisierul asa cum e stocat, eventual comprimat, sau membrul
+    din .zip), deci redenumirea sau copierea unei instante nu invalideaza intrarea. Arena se scrie intr-un
+    format binar plat (antet + literali int32 + inceputuri int64) citit prin mmap; rezultatul
+    preprocesarii se scrie la fel, arena formulei reduse fiind urmata de stiva de reconstructie si de
+    statisticile in JSON. Numele intrarilor preprocesate contin si hash-ul codului sursei, astfel incat o
+    corectura a preprocesarii nu reutilizeaza rezultate vechi. La fiecare citire reusita data modificarii
+    fisierului este reimprospatata, iar evacuarea sterge intrarile cele mai vechi.
+    """
+
+    ANTET = struct.Struct('<8sqqqB')  # marcaj, numar_variabile, numar_clauze, numar_literali, clauza_goala
+    MARCAJ = b'CNFARN01'
+    # marcaj, numar_variabile_redus, numar_clauze, numar_literali, intrari_stiva, literali_stiva, fixate,
+    # variabile_originale (-1 = identitate), numar_variabile_original, octeti_statistici, clauza_goala
+    ANTET_PREPROCESARE = struct.Struct('<8sqqqqqqqqqB')
+    MARCAJ_PREPROCESARE = b'CNFPRP01'
+
+    def __init__(self, director='.cache_cnf', dimensiune_maxima_mb=512):
+        self.director = director
+        self.dimensiune_maxima = int(dimensiune_maxima_mb * 1024 * 1024)
+        self.statistici = {'gasite': 0, 'ratate': 0, 'scrieri': 0, 'evacuari': 0}
+        os.makedirs(director, exist_ok=True)
+        with open(__file__, 'rb') as f:
+            self.versiune_cod = hashlib.blake2b(f.read() + self.MARCAJ_PREPROCESARE, digest_size=8).hexdigest()
+
+    def cheie(self, cale):
+        """Hash-ul continutului sursei CNF (blake2b pe 128 de biti, in hex)."""
+        rezumat = hashlib.blake2b(digest_size=16)
+        arhiva, membru = imparte_cale_zip(cale)
+        with ExitStack() as stiva:
+            if arhiva is not None:
+                f = stiva.enter_context(stiva.enter_context(zipfile.ZipFile(arhiva)).open(membru))
+            else:
+                f = stiva.enter_context(open(cale, 'rb'))
+            for bloc in iter(lambda: f.read(1 << 20), b''):
+                rezumat.update(bloc)
+        return rezumat.hexdigest()
+
+    def _cale(self, nume):
+        return os.path.join(self.director, nume)
+
+    @contextmanager
+    def _mapeaza(self, nume):
+        """Continutul mapat in memorie al unei intrari (sau None); intrarea devine cea mai recent folosita."""
+        try:
+            f = open(self._cale(nume), 'rb')
+        except FileNotFoundError:
+            self.statistici['ratate'] += 1
+            yield None
+            return
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.statistici['ratate'] += 1
+                yield None
+                return
+            try:
+                os.utime(self._cale(nume))
+            except OSError:
+                pass  # doar ordinea LRU are de suferit
+            self.statistici['gasite'] += 1
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as harta, memoryview(harta) as continut:
+                yield continut
+
+    def _scrie(self, nume, parti):
+        """Scriere atomica (fisier temporar + os.replace), urmata de evacuarea LRU."""
+        temporar = self._cale(f"{nume}.{os.getpid()}.tmp")
+        try:
+            with open(temporar, 'wb') as f:
+                for parte in parti:
+                    f.write(parte)
+            os.replace(temporar, self._cale(nume))
+        except OSError as e:
+            warnings.warn(f"Intrarea {nume} nu a putut fi scrisa in cache: {e}")
+            if os.path.exists(temporar):
+                os.remove(temporar)
+            return
+        self.statistici['scrieri'] += 1
+        self.evacueaza()
+
+    def evacueaza(self):
+        """Sterge intrarile folosite cel mai demult pana cand cache-ul incape in dimensiunea maxima."""
+        intrari = []
+        for nume in os.listdir(self.director):
+            if nume.endswith('.tmp'):
+                continue  # scriere in curs in alt proces
+            try:
+                info = os.stat(self._cale(nume))
+            except FileNotFoundError:
+                continue
+            intrari.append((info.st_mtime, info.st_size, nume))
+        total = sum(dimensiune for _, dimensiune, _ in intrari)
+        for _, dimensiune, nume in sorted(intrari):
+            if total <= self.dimensiune_maxima:
+                break
+            try:
+                os.remove(self._cale(nume))
+                self.statistici['evacuari'] += 1
+            except FileNotFoundError:
+                pass
+            total -= dimensiune
+
+    def incarca_arena(self, cheie):
+        with self._mapeaza(cheie + '.arena') as continut:
+            if continut is None or len(continut) < self.ANTET.size:
+                return None
+            marcaj, numar_variabile, numar_clauze, numar_literali, clauza_goala = self.ANTET.unpack_from(continut)
+            inceput = self.ANTET.size
+            sfarsit = inceput + 4 * numar_literali
+            if marcaj != self.MARCAJ or len(continut) != sfarsit + 8 * (numar_clauze + 1):
+                return None
+            arena = ArenaClauze(numar_variabile=numar_variabile)
+            arena.literali.frombytes(continut[inceput:sfarsit])
+            arena.inceputuri = array('q')
+            arena.inceputuri.frombytes(continut[sfarsit:])
+        arena.clauza_goala = bool(clauza_goala)
+        return arena, numar_variabile
+
+    def salveaza_arena(self, cheie, arena, numar_variabile):
+        self._scrie(cheie + '.arena', (
+            self.ANTET.pack(self.MARCAJ, numar_variabile, len(arena), len(arena.literali), arena.clauza_goala),
+            arena.literali.tobytes(), arena.inceputuri.tobytes()))
+
+    def parseaza_dimacs(self, cale):
+        """Ca parseaza_dimacs, dar citeste din cache cand continutul a mai fost parsat; intoarce si cheia."""
+        try:
+            cheie = self.cheie(cale)
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return parseaza_dimacs(cale) + (None,)  # parsorul raporteaza eroarea obisnuita
+        rezultat = self.incarca_arena(cheie)
+        if rezultat is not None:
+            print(f"S-au incarcat {len(rezultat[0])} clauze cu {rezultat[1]} variabile din cache ({cale})")
+            return rezultat + (cheie,)
+        clauze, numar_variabile = parseaza_dimacs(cale)
+        if clauze is not None:
+            self.salveaza_arena(cheie, clauze, numar_variabile)
+        return clauze, numar_variabile, cheie
+
+    def incarca_preprocesare(self, nume):
+        with self._mapeaza(nume) as continut:
+            if continut is None or len(continut) < self.ANTET_PREPROCESARE.size:
+                return None
+            (marcaj, numar_variabile_redus, numar_clauze, numar_literali, numar_intrari, numar_literali_stiva,
+             numar_fixate, numar_variabile_originale, numar_variabile_original, octeti_statistici,
+             clauza_goala) = self.ANTET_PREPROCESARE.unpack_from(continut)
+            marimi = (4 * numar_literali, 8 * (numar_clauze + 1), 4 * numar_intrari, 4 * numar_literali_stiva,
+                      4 * numar_fixate, 4 * max(numar_variabile_originale, 0), octeti_statistici)
+            if marcaj != self.MARCAJ_PREPROCESARE or \
+                    len(continut) != self.ANTET_PREPROCESARE.size + sum(marimi) or min(marimi) < 0:
+                return None
+            parti, inceput = [], self.ANTET_PREPROCESARE.size
+            for marime in marimi:
+                parti.append(bytes(continut[inceput:inceput + marime]))  # copii: harta se inchide la iesire
+                inceput += marime
+            literali, inceputuri, martori, literali_stiva, fixate, variabile_originale, statistici = parti
+
+            arena = ArenaClauze(numar_variabile=numar_variabile_redus)
+            arena.literali.frombytes(literali)
+            arena.inceputuri = array('q')
+            arena.inceputuri.frombytes(inceputuri)
+            arena.clauza_goala = bool(clauza_goala)
+            stiva = StivaReconstructie()
+            clauze_stiva = despacheteaza_clauze(array('i', literali_stiva))
+            if len(clauze_stiva) != numar_intrari:
+                return None
+            stiva.intrari = list(zip(array('i', martori), clauze_stiva))
+            stiva.fixate = array('i', fixate).tolist()
+            if numar_variabile_originale >= 0:
+                stiva.variabile_originale = array('i', variabile_originale).tolist()
+            stiva.numar_variabile_original = numar_variabile_original
+            return arena, numar_variabile_redus, stiva, json.loads(statistici)
+
+    def salveaza_preprocesare(self, nume, clauze_reduse, numar_variabile_redus, stiva, statistici):
+        arena = ArenaClauze.din_clauze(clauze_reduse, numar_variabile_redus)
+        literali_stiva = impacheteaza_clauze(clauza for _, clauza in stiva.intrari)
+        variabile_originale = stiva.variabile_originale
+        statistici = json.dumps(statistici).encode()
+        self._scrie(nume, (
+            self.ANTET_PREPROCESARE.pack(
+                self.MARCAJ_PREPROCESARE, numar_variabile_redus, len(arena), len(arena.literali),
+                len(stiva.intrari), len(literali_stiva), len(stiva.fixate),
+                -1 if variabile_originale is None else len(variabile_originale), stiva.numar_variabile_original,
+                len(statistici), arena.clauza_goala),
+            arena.literali.tobytes(), arena.inceputuri.tobytes(),
+            array('i', (martor for martor, _ in stiva.intrari)).tobytes(), literali_stiva.tobytes(),
+            array('i', stiva.fixate).tobytes(), array('i', variabile_originale or ()).tobytes(), statistici))
+
+    def preproceseaza(self, cheie, clauze, numar_variabile, **optiuni):
+        """Ca preproceseaza; rezultatul este pastrat in cache separat pentru fiecare set de optiuni."""
+        if cheie is None:
+            return preproceseaza(clauze, numar_variabile, **optiuni)
+        timp_start = time.perf_counter()
+        rezumat_optiuni = hashlib.blake2b(repr(sorted(optiuni.items())).encode(), digest_size=8).hexdigest()
+        nume = f"{cheie}-{rezumat_optiuni}-{self.versiune_cod}.prep"
+        try:
+            rezultat = self.incarca_preprocesare(nume)
+        except Exception:
+            rezultat = None  # intrare corupta: se recalculeaza si se suprascrie
+        if rezultat is not None:
+            clauze_reduse, numar_variabile_redus, stiva, statistici = rezultat
+            statistici = dict(statistici, timp_original=statistici['timp'],
+                              timp=time.perf_counter() - timp_start, din_cache=True)
+            return clauze_reduse, numar_variabile_redus, stiva, statistici
+        clauze_reduse, numar_variabile_redus, stiva, statistici = preproceseaza(clauze, numar_variabile, **optiuni)
+        self.salveaza_preprocesare(nume, clauze_reduse, numar_variabile_redus, stiva, statistici)
+        return clauze_reduse, numar_variabile_redus, stiva, statistici
+
+
 # --- Generator FNC (Forma Normala Conjunctiva) ---
 def genereaza_fnc(numar_variabile, numar_clauze, k=3, asigura_satisfiabilitate=False):
     """Genereaza o formula k-FNC aleatorie."""
@@ -151,6 +593,454 @@ def genereaza_fnc(numar_variabile, numar_clauze, k=3, asigura_satisfiabilitate=F
     return clauze_finale, numar_variabile
 
 
+def loturi_fnc_aleator(numar_variabile, numar_clauze, k, asigura_satisfiabilitate, generator, dimensiune_lot):
+    """Produce matrici int32 (r x k) de clauze k-FNC distincte, trase in bloc, pana la numar_clauze in total.
+
+    Variabilele unei clauze sunt trase cu repetitie si sortate, iar randurile cu variabile repetate se
+    resping; semnele sunt biti aleatori. Clauzele deja emise sunt recunoscute dupa o cheie: literalii
+    impachetati exact intr-un int64 cand incap, altfel un hash FNV pe 64 de biti (o coliziune doar
+    respinge o clauza valida, care este inlocuita de alta).
+    """
+    n = numar_variabile
+    baza = 2 * n + 1
+    impachetare_exacta = baza ** k < 1 << 63
+    ascunsa = generator.random(n + 1) < 0.5 if asigura_satisfiabilitate else None
+    vazute = np.zeros(0, dtype=np.int64 if impachetare_exacta else np.uint64)
+    ramase = numar_clauze
+    while ramase:
+        lot = min(dimensiune_lot, 2 * ramase + 64)
+        variabile = np.sort(generator.integers(1, n + 1, size=(lot, k), dtype=np.int32), axis=1)
+        if k > 1:
+            variabile = variabile[(variabile[:, 1:] != variabile[:, :-1]).all(axis=1)]
+        literali = np.where(generator.random(variabile.shape) < 0.5, -variabile, variabile)
+        if ascunsa is not None:
+            literali = literali[(ascunsa[variabile] == (literali > 0)).any(axis=1)]
+
+        deplasati = literali.astype(np.int64) + n
+        if impachetare_exacta:
+            chei = np.zeros(len(literali), dtype=np.int64)
+            for coloana in range(k):
+                chei = chei * baza + deplasati[:, coloana]
+        else:
+            chei = np.full(len(literali), 14695981039346656037, dtype=np.uint64)
+            for coloana in range(k):
+                chei = (chei ^ deplasati[:, coloana].astype(np.uint64)) * np.uint64(1099511628211)
+        # Duplicatele din lot (prima aparitie ramane, in ordinea tragerii), apoi cele emise deja
+        chei, primele = np.unique(chei, return_index=True)
+        ordine = np.argsort(primele)
+        chei, primele = chei[ordine], primele[ordine]
+        pozitii = np.minimum(np.searchsorted(vazute, chei), max(len(vazute) - 1, 0))
+        noi = vazute[pozitii] != chei if len(vazute) else np.ones(len(chei), dtype=bool)
+        chei, primele = chei[noi][:ramase], primele[noi][:ramase]
+        if not len(chei):
+            continue
+        vazute = np.concatenate((vazute, chei))
+        vazute.sort(kind='stable')  # doua secvente sortate: timsort le interclaseaza in timp liniar
+        ramase -= len(chei)
+        yield literali[primele]
+
+
+def genereaza_fnc_vectorizat(numar_variabile, numar_clauze, k=3, asigura_satisfiabilitate=False, samanta=None,
+                             cale_iesire=None, in_memorie=True, dimensiune_lot=1 << 18):
+    """Varianta NumPy a lui genereaza_fnc pentru instante mari, reproductibila prin samanta.
+
+    Clauzele sunt trase in loturi si, daca este data cale_iesire, scrise direct in fisierul DIMACS
+    pe masura ce sunt generate. Cu in_memorie=False formula nu este pastrata (se intoarce None),
+    ceea ce permite instante mai mari decat memoria. Intoarce (ArenaClauze sau None, numar_variabile).
+    """
+    if np is None:
+        raise ImportError("genereaza_fnc_vectorizat necesita NumPy; foloseste genereaza_fnc")
+    if k > numar_variabile and numar_variabile > 0:
+        raise ValueError("k (lungimea clauzei) nu poate fi mai mare decat numar_variabile")
+    if k <= 0:
+        raise ValueError("k (lungimea clauzei) trebuie sa fie pozitiv")
+    maxim_clauze = comb(numar_variabile, k) * (2 ** k - 1 if asigura_satisfiabilitate else 2 ** k)
+    if numar_clauze > maxim_clauze:
+        raise ValueError(f"Nu se pot genera {numar_clauze} clauze distincte cu {numar_variabile} variabile "
+                         f"si k={k} (maxim {maxim_clauze}).")
+
+    samanta = random.randrange(1 << 32) if samanta is None else samanta
+    generator = np.random.default_rng(samanta)
+    fisier = open(cale_iesire, 'w') if cale_iesire is not None else None
+    loturi = []
+    try:
+        if fisier is not None:
+            fisier.write(f"c FNC-{k} generat aleatoriu, samanta {samanta}"
+                         f"{', satisfiabila (atribuire ascunsa)' if asigura_satisfiabilitate else ''}\n")
+            fisier.write(f"p cnf {numar_variabile} {numar_clauze}\n")
+        format_linie = "%d " * k + "0\n"
+        for lot in loturi_fnc_aleator(numar_variabile, numar_clauze, k, asigura_satisfiabilitate, generator,
+                                      dimensiune_lot):
+            if fisier is not None:
+                fisier.write((format_linie * len(lot)) % tuple(lot.ravel().tolist()))
+            if in_memorie:
+                loturi.append(lot)
+    finally:
+        if fisier is not None:
+            fisier.close()
+
+    print(f"S-au generat {numar_clauze} clauze cu {numar_variabile} variabile (k={k}, samanta {samanta}).")
+    if not in_memorie:
+        return None, numar_variabile
+    literali = np.concatenate(loturi) if loturi else np.zeros((0, k), dtype=np.int32)
+    arena = ArenaClauze(numar_variabile=numar_variabile)
+    arena.literali.frombytes(literali.astype(np.int32).tobytes())
+    arena.inceputuri = array('q', range(0, k * numar_clauze + 1, k))
+    return arena, numar_variabile
+
+
+# --- Guvernator de resurse (timp real, timp CPU, memorie rezidenta, oprire cooperativa) ---
+class RulareAnulata(Exception):
+    """Ridicata de bucla de cautare cand evenimentul de oprire (ex. portofoliul) a fost setat."""
+
+
+class MemorieEpuizata(MemoryError):
+    """Ridicata cand memoria rezidenta (RSS) a procesului trece de bugetul guvernatorului."""
+
+
+PAGINA_MEMORIE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def memorie_rezidenta():
+    """RSS-ul curent in octeti (din /proc/self/statm); altfel varful din getrusage, sau None."""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * PAGINA_MEMORIE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        varf = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return varf if sys.platform == 'darwin' else varf * 1024  # octeti pe macOS, KiB pe Linux
+    return None
+
+
+class GuvernatorResurse:
+    """Bugetele unei rulari (timp real, timp CPU, RSS, evenimentul de oprire), verificate din buclele interioare.
+
+    Motoarele apeleaza depasit() (care intoarce starea de raportat) sau verifica() (care ridica exceptia
+    corespunzatoare: TimeoutError, RulareAnulata, MemorieEpuizata) la fiecare pas, oricat de mic. Doar un
+    pas din `interval` citeste efectiv ceasul, iar intervalul se dubleaza / injumatateste astfel incat
+    verificarile sa cada cam la fiecare PERIOADA secunde, indiferent cat costa un pas. RSS-ul se citeste
+    cel mult o data la PERIOADA_MEMORIE. Dupa prima depasire starea ramane fixata (stare, motiv).
+    """
+
+    PERIOADA = 0.01
+    PERIOADA_MEMORIE = 0.1
+    INTERVAL_MAXIM = 1 << 20
+
+    def __init__(self, timp_maxim=None, timp_cpu_maxim=None, memorie_maxima_mb=None, oprire=None, inceput=None):
+        self.inceput = time.perf_counter() if inceput is None else inceput
+        self.termen = self.inceput + timp_maxim if timp_maxim is not None else inf
+        self.termen_cpu = time.process_time() + timp_cpu_maxim if timp_cpu_maxim is not None else None
+        self.memorie_maxima_mb = memorie_maxima_mb
+        self.memorie_maxima = int(memorie_maxima_mb * (1 << 20)) if memorie_maxima_mb else None
+        self.oprire = oprire
+        self.interval = self.pasi = 1
+        self.ultima_verificare = self.inceput
+        self.urmatoarea_citire_memorie = self.inceput
+        self.verificari = 0
+        self.varf_memorie = 0
+        self.stare = None
+        self.motiv = None  # 'timp_real', 'timp_cpu', 'memorie_rss' sau 'oprire'
+
+    def depasit(self):
+        """None cat timp bugetele sunt respectate, altfel starea ("TIMP_DEPASIT", "ANULAT", "MEMORIE_DEPASITA")."""
+        self.pasi -= 1
+        if self.pasi > 0:
+            return None
+        return self.depasit_acum()
+
+    def verifica(self):
+        """Ca depasit(), dar ridica exceptia starii (pentru buclele DPLL/CDCL, oprite prin exceptii)."""
+        self.pasi -= 1
+        if self.pasi <= 0 and self.depasit_acum() is not None:
+            self.ridica()
+
+    def depasit_acum(self):
+        """Verificare neamortizata (ex. intre runde sau eliminari)."""
+        acum = time.perf_counter()
+        durata = acum - self.ultima_verificare
+        if durata < self.PERIOADA / 2:
+            self.interval = min(2 * self.interval, self.INTERVAL_MAXIM)
+        elif durata > 2 * self.PERIOADA:
+            self.interval = max(self.interval // 2, 1)
+        self.pasi = self.interval
+        self.ultima_verificare = acum
+        self.verificari += 1
+        if self.stare is not None:
+            return self.stare
+        if acum > self.termen:
+            return self.opreste("TIMP_DEPASIT", 'timp_real')
+        if self.oprire is not None and self.oprire.is_set():
+            return self.opreste("ANULAT", 'oprire')
+        if self.termen_cpu is not None and time.process_time() > self.termen_cpu:
+            return self.opreste("TIMP_DEPASIT", 'timp_cpu')
+        if self.memorie_maxima is not None and acum >= self.urmatoarea_citire_memorie:
+            self.urmatoarea_citire_memorie = acum + self.PERIOADA_MEMORIE
+            memorie = memorie_rezidenta()
+            if memorie is not None:
+                self.varf_memorie = max(self.varf_memorie, memorie)
+                if memorie > self.memorie_maxima:
+                    return self.opreste("MEMORIE_DEPASITA", 'memorie_rss')
+        return None
+
+    def opreste(self, stare, motiv):
+        self.stare, self.motiv = stare, motiv
+        return stare
+
+    def ridica(self):
+        if self.stare == "ANULAT":
+            raise RulareAnulata("Rulare anulata")
+        if self.stare == "MEMORIE_DEPASITA":
+            raise MemorieEpuizata(f"Memoria rezidenta a depasit {self.memorie_maxima >> 20} MB")
+        raise TimeoutError(f"Timp depasit ({self.motiv})")
+
+    def limite_fragment(self, numar_fragmente=1):
+        """Bugetele ramase, transmisibile unui proces de lucru: (termen time.monotonic(), secunde CPU, MB RSS).
+
+        Timpul CPU ramas se imparte egal intre cele numar_fragmente sarcini, ca suma lor sa nu-l depaseasca;
+        RSS-ul fiecarui proces este comparat cu acelasi buget (vezi guvernator_fragment).
+        """
+        timp_cpu = None
+        if self.termen_cpu is not None:
+            timp_cpu = max(self.termen_cpu - time.process_time(), 0.0) / max(numar_fragmente, 1)
+        return termen_intre_procese(self.termen), timp_cpu, self.memorie_maxima_mb
+
+    def rezumat(self):
+        """Campurile adaugate in statisticile unei rulari oprite de guvernator."""
+        rezumat = {'motiv_oprire': self.motiv, 'verificari_resurse': self.verificari}
+        if self.varf_memorie:
+            rezumat['varf_rss_mb'] = round(self.varf_memorie / (1 << 20), 1)
+        return rezumat
+
+
+# --- Profilare (cronometre pe faze, histograme, progres in JSONL) ---
+class Profilator:
+    """Instrumentarea optionala a solverelor: timp pe faze, histograme si instantanee periodice de progres.
+
+    Solverele primesc profil=None implicit, iar fiecare punct de masurare este pazit de un singur test
+    `profil is not None`, asa ca fara profilator costul este neglijabil. Fazele sunt masurate inlantuit:
+    adauga_timp intoarce momentul curent, care devine inceputul fazei urmatoare (un singur apel de ceas
+    per faza). Instantaneele de progres si rezumatul final sunt scrise ca linii JSON in fisier (optional).
+    """
+
+    def __init__(self, fisier=None, interval=1.0):
+        self.flux = open(fisier, 'a') if isinstance(fisier, str) else fisier
+        self.interval = interval
+        self.incepe(None)
+
+    def incepe(self, motor):
+        """Reseteaza masuratorile pentru o rulare noua a motorului dat."""
+        self.motor = motor
+        self.timpi = {}  # faza -> secunde
+        self.apeluri = {}  # faza -> numar de masuratori
+        self.histograme = {}  # nume -> {valoare: numar}
+        self.timp_start = time.perf_counter()
+        self.urmatorul_instantaneu = self.timp_start + self.interval
+        self.instantanee = 0
+
+    def adauga_timp(self, faza, inceput):
+        """Adauga timpul scurs de la inceput la faza data; intoarce momentul curent."""
+        acum = time.perf_counter()
+        self.timpi[faza] = self.timpi.get(faza, 0.0) + acum - inceput
+        self.apeluri[faza] = self.apeluri.get(faza, 0) + 1
+        return acum
+
+    def inregistreaza(self, histograma, valoare):
+        valori = self.histograme.get(histograma)
+        if valori is None:
+            self.histograme[histograma] = valori = {}
+        valori[valoare] = valori.get(valoare, 0) + 1
+
+    def scrie(self, tip, **campuri):
+        if self.flux is not None:
+            self.flux.write(json.dumps(dict(tip=tip, motor=self.motor,
+                                            t=round(time.perf_counter() - self.timp_start, 6), **campuri)) + "\n")
+            self.flux.flush()
+
+    def progres(self, acum, **campuri):
+        """Instantaneu de progres; apelantul testeaza intai acum >= urmatorul_instantaneu (fara constructia dict-ului)."""
+        self.urmatorul_instantaneu = acum + self.interval
+        self.instantanee += 1
+        self.scrie('progres', **campuri)
+
+    def rezumat(self):
+        return {'timpi': {faza: round(secunde, 6) for faza, secunde in self.timpi.items()},
+                'apeluri': dict(self.apeluri),
+                'histograme': {nume: dict(sorted(valori.items())) for nume, valori in self.histograme.items()},
+                'instantanee': self.instantanee}
+
+    def ruleaza(self, motor, solver, *argumente, **optiuni):
+        """Ruleaza solver(..., profil=self) si adauga rezumatul in statisticile lui, sub cheia 'profil'."""
+        self.incepe(motor)
+        stare, atribuire, statistici_rulare = solver(*argumente, profil=self, **optiuni)
+        rezumat = self.rezumat()
+        self.scrie('rezumat', stare=stare, **rezumat)
+        statistici_rulare['profil'] = rezumat
+        return stare, atribuire, statistici_rulare
+
+    def inchide(self):
+        if self.flux is not None:
+            self.flux.close()
+            self.flux = None
+
+
+# --- Depozit de clauze cu descarcare pe disc (Rezolutie / DP peste memoria disponibila) ---
+def interclaseaza_unic(*surse):
+    """Interclaseaza fluxuri sortate de clauze (tupluri), eliminand duplicatele."""
+    precedenta = None
+    for clauza in heapq.merge(*surse):
+        if clauza != precedenta:
+            yield clauza
+            precedenta = clauza
+
+
+def diferenta_sortata(sursa, de_scazut):
+    """Clauzele din fluxul sortat sursa care lipsesc din fluxul sortat de_scazut (ambele fara duplicate)."""
+    de_scazut = iter(de_scazut)
+    curenta = next(de_scazut, None)
+    for clauza in sursa:
+        while curenta is not None and curenta < clauza:
+            curenta = next(de_scazut, None)
+        if clauza != curenta:
+            yield clauza
+
+
+class DepozitClauze:
+    """Clauze (tupluri sortate) pe partitii, cu un segment fierbinte in memorie si rulaje sortate pe disc.
+
+    Fiecare partitie are un set in memorie; cand estimarea memoriei ocupate de seturi trece de buget,
+    partitiile cele mai mari sunt sortate si scrise ca rulaje (buffere int32 impachetate, clauze terminate
+    cu 0) intr-un director temporar. Citirea unei partitii interclaseaza setul si rulajele ei (citite prin
+    mmap) si elimina duplicatele; compacteaza() inlocuieste rulajele cu unul singur. Pentru o partitie din
+    excluse, clauzele prezente deja in partitia asociata nu mai sunt scrise la descarcare. Bugetele sub
+    BUGET_MINIM sunt ridicate la acesta, altfel aproape fiecare clauza ar produce un rulaj.
+    """
+
+    OCTETI_PE_CLAUZA = 100  # Estimare pentru tuplu + intrarea in set
+    OCTETI_PE_LITERAL = 36
+    LITERALI_PE_BLOC = 1 << 16
+    MAXIM_RULAJE = 32  # Peste atatea rulaje intr-o partitie, acestea sunt interclasate intr-unul singur
+    BUGET_MINIM = 4 * 4 * LITERALI_PE_BLOC  # Patru blocuri de literali int32 (1 MiB)
+
+    def __init__(self, buget_octeti, director=None):
+        self.buget_octeti = max(buget_octeti, self.BUGET_MINIM)
+        self.director = tempfile.mkdtemp(prefix='clauze_', dir=director)
+        self.fierbinte = {}  # partitie -> set de clauze
+        self.octeti_partitie = {}
+        self.octeti_fierbinti = 0
+        self.rulaje = {}  # partitie -> [(cale, numar_clauze)]
+        self.excluse = {}  # partitie -> partitia ale carei clauze nu se mai scriu in rulajele ei
+        self.numar_fisiere = 0
+        self.statistici = {'descarcari': 0, 'rulaje_scrise': 0, 'octeti_scrisi': 0, 'interclasari': 0}
+
+    def adauga(self, clauza, partitie=0):
+        multime = self.fierbinte.get(partitie)
+        if multime is None:
+            self.fierbinte[partitie] = multime = set()
+            self.octeti_partitie[partitie] = 0
+        if clauza in multime:
+            return
+        multime.add(clauza)
+        octeti = self.OCTETI_PE_CLAUZA + self.OCTETI_PE_LITERAL * len(clauza)
+        self.octeti_partitie[partitie] += octeti
+        self.octeti_fierbinti += octeti
+        if self.octeti_fierbinti > self.buget_octeti:
+            self.descarca()
+
+    def descarca(self):
+        """Scrie pe disc partitiile cele mai mari pana cand segmentul fierbinte scade sub jumatate din buget."""
+        self.statistici['descarcari'] += 1
+        for partitie in sorted(self.fierbinte, key=self.octeti_partitie.get, reverse=True):
+            if self.octeti_fierbinti <= self.buget_octeti // 2:
+                break
+            rulaje = self.rulaje.setdefault(partitie, [])
+            clauze = iter(sorted(self.fierbinte.pop(partitie)))
+            if partitie in self.excluse:
+                clauze = diferenta_sortata(clauze, self.parcurge(self.excluse[partitie]))
+            rulaje.append(self.scrie_rulaj(clauze))
+            self.octeti_fierbinti -= self.octeti_partitie.pop(partitie)
+            if len(rulaje) > self.MAXIM_RULAJE:
+                self.statistici['interclasari'] += 1
+                rulaj = self.scrie_rulaj(interclaseaza_unic(*(self.citeste_rulaj(cale) for cale, _ in rulaje)))
+                for cale, _ in rulaje:
+                    os.remove(cale)
+                rulaje[:] = [rulaj]
+
+    def scrie_rulaj(self, clauze_sortate):
+        """Scrie un flux sortat de clauze intr-un fisier nou; intoarce (cale, numar_clauze)."""
+        self.numar_fisiere += 1
+        cale = os.path.join(self.director, f"rulaj_{self.numar_fisiere}.bin")
+        numar = 0
+        with open(cale, 'wb') as f:
+            literali = array('i')
+            for clauza in clauze_sortate:
+                literali.extend(clauza)
+                literali.append(0)
+                numar += 1
+                if len(literali) >= self.LITERALI_PE_BLOC:
+                    f.write(literali.tobytes())
+                    literali = array('i')
+            f.write(literali.tobytes())
+            self.statistici['octeti_scrisi'] += f.tell()
+        self.statistici['rulaje_scrise'] += 1
+        return cale, numar
+
+    def citeste_rulaj(self, cale):
+        """Clauzele unui rulaj, in ordine, citite prin mmap bloc cu bloc."""
+        if os.path.getsize(cale) == 0:
+            return
+        with open(cale, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as harta:
+            vedere = memoryview(harta).cast('i')
+            try:
+                curenta = []
+                for inceput in range(0, len(vedere), self.LITERALI_PE_BLOC):
+                    for literal in vedere[inceput:inceput + self.LITERALI_PE_BLOC].tolist():
+                        if literal:
+                            curenta.append(literal)
+                        else:
+                            yield tuple(curenta)
+                            curenta = []
+            finally:
+                vedere.release()
+
+    def parcurge(self, partitie=0):
+        """Clauzele partitiei, sortate si fara duplicate (segmentul fierbinte interclasat cu rulajele)."""
+        surse = [self.citeste_rulaj(cale) for cale, _ in self.rulaje.get(partitie, ())]
+        if partitie in self.fierbinte:
+            surse.append(iter(sorted(self.fierbinte[partitie])))
+        if len(surse) > 1:
+            self.statistici['interclasari'] += 1
+        return interclaseaza_unic(*surse)
+
+    def compacteaza(self, partitie=0):
+        """Inlocuieste segmentul fierbinte si rulajele partitiei cu un singur rulaj; intoarce numarul de clauze."""
+        return self.inlocuieste(partitie, self.parcurge(partitie))
+
+    def inlocuieste(self, partitie, clauze_sortate):
+        """Scrie fluxul sortat ca unic rulaj al partitiei (fluxul poate citi chiar partitia); intoarce numarul."""
+        rulaj = self.scrie_rulaj(clauze_sortate)
+        self.elimina(partitie)
+        self.rulaje[partitie] = [rulaj]
+        return rulaj[1]
+
+    def extrage(self, partitie):
+        """Clauzele partitiei (lista sortata, fara duplicate); partitia este golita."""
+        clauze = list(self.parcurge(partitie))
+        self.elimina(partitie)
+        return clauze
+
+    def elimina(self, partitie):
+        for cale, _ in self.rulaje.pop(partitie, ()):
+            os.remove(cale)
+        if partitie in self.fierbinte:
+            del self.fierbinte[partitie]
+            self.octeti_fierbinti -= self.octeti_partitie.pop(partitie)
+
+    def inchide(self):
+        shutil.rmtree(self.director, ignore_errors=True)
+
+
 # --- Algoritmul de Rezolutie ---
 def rezolva(clauza1, clauza2):
     """Efectueaza pasul de rezolutie intre doua clauze."""
@@ -175,163 +1065,1059 @@ def rezolva(clauza1, clauza2):
     return rezolventi
 
 
-def rezolva_prin_rezolutie(clauze_intrare, numar_variabile, timp_maxim):
-    """Incearca sa demonstreze nesatisfiabilitatea folosind rezolutia."""
+def indexeaza_clauza(index_aparitii, clauza):
+    """Adauga clauza (tuplu sortat) in indexul literal -> clauzele care il contin."""
+    for literal in clauza:
+        lista = index_aparitii.get(literal)
+        if lista is None:
+            index_aparitii[literal] = [clauza]
+        else:
+            lista.append(clauza)
+
+
+def semnatura_clauzei(clauza):
+    """Masca de 64 de biti a literalilor; daca A este inclusa in B atunci sem(A) & ~sem(B) == 0."""
+    semnatura = 0
+    for literal in clauza:
+        semnatura |= 1 << ((2 * abs(literal) + (literal < 0)) & 63)
+    return semnatura
+
+
+class MultimeClauze:
+    """Multime de clauze (tupluri sortate) care ramane libera de subsumari.
+
+    La adaugare se face subsumare inainte (clauza noua este respinsa daca o clauza existenta
+    o include) si inapoi (clauzele existente care o includ sunt eliminate). Clauzele care includ
+    o clauza data sunt intersectia multimilor de aparitii ale literalilor ei (calculata in C);
+    pentru subsumarea inainte se alege varianta mai ieftina dintre cautarea directa a tuturor
+    submultimilor in dictionar si parcurgerea listelor de supraveghere filtrate prin semnaturi.
+    """
+
+    OCTETI_PE_CLAUZA = 300  # Estimari masurate cu tracemalloc (dictionare, seturi de aparitii, index, tuplu)
+    OCTETI_PE_LITERAL = 80
+
+    def __init__(self):
+        self.clauze = {}  # clauza -> (semnatura, literal supravegheat)
+        self.aparitii = {}  # literal -> {clauze care il contin}
+        self.supraveghere = {}  # literal -> {clauza: semnatura}; fiecare clauza sta sub un singur literal
+        self.numar_literali = 0
+        self.subsumari_inainte = 0
+        self.subsumari_inapoi = 0
+
+    def __len__(self):
+        return len(self.clauze)
+
+    def __contains__(self, clauza):
+        return clauza in self.clauze
+
+    def __iter__(self):
+        return iter(self.clauze)
+
+    def este_subsumata(self, clauza, semnatura):
+        """True daca o clauza existenta este inclusa (strict sau nu) in clauza data."""
+        numar_candidati = sum(len(self.supraveghere.get(literal, ())) for literal in clauza)
+        if 1 << len(clauza) <= numar_candidati + 64:
+            submultimi = chain.from_iterable(combinations(clauza, k) for k in range(1, len(clauza)))
+            return not self.clauze.keys().isdisjoint(submultimi)
+        set_clauza = set(clauza)
+        # O clauza inclusa in `clauza` are si literalul supravegheat printre literalii lui `clauza`
+        for literal in clauza:
+            for alta, semnatura_alta in self.supraveghere.get(literal, {}).items():
+                if semnatura_alta & ~semnatura == 0 and set_clauza.issuperset(alta):
+                    return True
+        return False
+
+    def adauga(self, clauza):
+        """Adauga clauza daca nu e duplicat si nu e subsumata; intoarce True daca a fost adaugata."""
+        if clauza in self.clauze:
+            return False
+        semnatura = semnatura_clauzei(clauza)
+        if self.este_subsumata(clauza, semnatura):
+            self.subsumari_inainte += 1
+            return False
+
+        multimi = sorted((self.aparitii.get(literal, ()) for literal in clauza), key=len)
+        if multimi[0]:
+            candidati = multimi[0] & multimi[1] if len(multimi) > 1 else set(multimi[0])
+            for multime in multimi[2:]:
+                if not candidati:
+                    break
+                candidati &= multime
+            for alta in candidati:
+                self.elimina(alta)
+                self.subsumari_inapoi += 1
+
+        # Supravegherea pe literalul cel mai rar tine listele echilibrate
+        literal_supravegheat = min(clauza, key=lambda literal: len(self.aparitii.get(literal, ())))
+        self.clauze[clauza] = (semnatura, literal_supravegheat)
+        for literal in clauza:
+            multime = self.aparitii.get(literal)
+            if multime is None:
+                self.aparitii[literal] = {clauza}
+            else:
+                multime.add(clauza)
+        self.supraveghere.setdefault(literal_supravegheat, {})[clauza] = semnatura
+        self.numar_literali += len(clauza)
+        return True
+
+    def elimina(self, clauza):
+        _, literal_supravegheat = self.clauze.pop(clauza)
+        for literal in clauza:
+            self.aparitii[literal].discard(clauza)
+        del self.supraveghere[literal_supravegheat][clauza]
+        self.numar_literali -= len(clauza)
+
+    def octeti_estimati(self):
+        return self.OCTETI_PE_CLAUZA * len(self.clauze) + self.OCTETI_PE_LITERAL * self.numar_literali
+
+    def goleste(self):
+        """Elibereaza clauzele si indecsii (contoarele de subsumari raman)."""
+        self.clauze, self.aparitii, self.supraveghere = {}, {}, {}
+        self.numar_literali = 0
+
+
+def model_din_saturare(clauze, numar_variabile, depozit=None):
+    """Un model al unei multimi de clauze saturate prin rezolutie (fara clauza goala).
+
+    Variabilele se fixeaza crescator: x_i devine fals doar daca o clauza cu variabila maxima x_i contine
+    -x_i si are toti ceilalti literali deja falsi. Saturarea (modulo subsumare) garanteaza ca nicio clauza
+    nu cere simultan x_i adevarat, deci toate clauzele sunt satisfacute. Cu un DepozitClauze, clauzele
+    sunt grupate pe variabila maxima in partitiile lui, nu in memorie.
+    """
+    if depozit is None:
+        grupe = {}
+        for clauza in clauze:
+            grupe.setdefault(max(abs(literal) for literal in clauza), []).append(clauza)
+        extrage = lambda variabila: grupe.pop(variabila, ())
+    else:
+        for clauza in clauze:
+            depozit.adauga(clauza, ('model', max(abs(literal) for literal in clauza)))
+        extrage = lambda variabila: depozit.extrage(('model', variabila))
+    atribuire = {}
+    for variabila in range(1, numar_variabile + 1):
+        atribuire[variabila] = not any(
+            -variabila in clauza and all(atribuire[abs(literal)] != (literal > 0)
+                                         for literal in clauza if literal != -variabila)
+            for clauza in extrage(variabila))
+    return atribuire
+
+
+def saturare_pe_disc(clauze, clauze_noi, numar_variabile, guvernator, statistici, buget_octeti, director=None,
+                     profil=None):
+    """Continua saturarea prin rezolutie cu multimea de clauze pe disc (semi-naiv, fara subsumare).
+
+    clauze este multimea curenta (tupluri sortate), iar clauze_noi submultimea ei inca neimperecheata.
+    La fiecare runda clauzele noi sunt citite in blocuri cat incap in sfertul de buget, indexate dupa
+    literali, iar toate clauzele sunt citite secvential de pe disc si rezolvate cu blocul. Rezolventii
+    merg intr-un DepozitClauze; cei care lipsesc din multime devin clauzele noi ale rundei urmatoare.
+    Intoarce (stare, atribuire): "UNSAT", "SAT" la saturare (cu modelul din model_din_saturare) sau
+    starea GuvernatorResurse care a oprit rularea.
+    """
+    TOATE, NOI, GENERATE = 0, 1, 2
+    depozit = DepozitClauze(buget_octeti // 2, director)
+    depozit.excluse[GENERATE] = TOATE  # rezolventii deja cunoscuti nu ajung pe disc
+    rezolutii = statistici['rezolutii']
+
+    def rezolva_bloc(bloc):
+        nonlocal rezolutii
+        index_bloc = {}
+        for clauza in bloc:
+            set_clauza = set(clauza)
+            for literal in clauza:
+                index_bloc.setdefault(literal, []).append(set_clauza)
+        for clauza_existenta in depozit.parcurge(TOATE):
+            for pivot in clauza_existenta:
+                for set_clauza_noua in index_bloc.get(-pivot, ()):
+                    rezolutii += 1
+                    if guvernator.depasit() is not None:
+                        return guvernator.stare, None
+                    if profil is not None and rezolutii % 5000 == 0:
+                        acum = time.perf_counter()
+                        if acum >= profil.urmatorul_instantaneu:
+                            profil.progres(acum, iteratie=statistici['iteratii'], rezolutii=rezolutii,
+                                           clauze_pe_disc=statistici['clauze_pe_disc'])
+                    if any(-literal in set_clauza_noua for literal in clauza_existenta if literal != pivot):
+                        continue
+                    rezolvent = set_clauza_noua.union(clauza_existenta)
+                    rezolvent.discard(pivot)
+                    rezolvent.discard(-pivot)
+                    if not rezolvent:
+                        statistici['clauza_goala_gasita'] = True
+                        return "UNSAT", None
+                    depozit.adauga(tuple(sorted(rezolvent)), GENERATE)
+        return None, None
+
+    try:
+        for clauza in clauze:
+            depozit.adauga(clauza, TOATE)
+            if guvernator.depasit() is not None:
+                return guvernator.stare, None
+        for clauza in clauze_noi:
+            depozit.adauga(clauza, NOI)
+        statistici['clauze_pe_disc'] = depozit.compacteaza(TOATE)
+        depozit.compacteaza(NOI)
+        clauze.goleste()  # de aici multimea traieste doar pe disc
+
+        while True:
+            statistici['iteratii'] += 1
+            bloc, octeti_bloc = [], 0
+            for clauza in depozit.parcurge(NOI):
+                bloc.append(clauza)
+                octeti_bloc += MultimeClauze.OCTETI_PE_CLAUZA + MultimeClauze.OCTETI_PE_LITERAL * len(clauza)
+                if octeti_bloc >= buget_octeti // 4:
+                    rezultat = rezolva_bloc(bloc)
+                    if rezultat[0] is not None:
+                        return rezultat
+                    bloc, octeti_bloc = [], 0
+            if bloc:
+                rezultat = rezolva_bloc(bloc)
+                if rezultat[0] is not None:
+                    return rezultat
+            statistici['rezolutii'] = rezolutii
+
+            if guvernator.depasit_acum() is not None:
+                return guvernator.stare, None
+            numar_noi = depozit.inlocuieste(NOI, diferenta_sortata(depozit.parcurge(GENERATE), depozit.parcurge(TOATE)))
+            depozit.elimina(GENERATE)
+            if not numar_noi:
+                statistici['saturare_atinsa'] = True
+                depozit.elimina(NOI)
+                return "SAT", model_din_saturare(depozit.parcurge(TOATE), numar_variabile, depozit)
+            statistici['clauze_generate'] += numar_noi
+            statistici['clauze_pe_disc'] = depozit.inlocuieste(
+                TOATE, interclaseaza_unic(depozit.parcurge(TOATE), depozit.parcurge(NOI)))
+            if guvernator.depasit_acum() is not None:
+                return guvernator.stare, None
+    finally:
+        statistici['rezolutii'] = rezolutii
+        statistici['descarcare'] = dict(depozit.statistici)
+        depozit.inchide()
+
+
+def rezolva_prin_rezolutie(clauze_intrare, numar_variabile, timp_maxim, oprire=None, profil=None, numar_procese=1,
+                           prag_paralel=2000000, buget_memorie_mb=None, director_descarcare=None, timp_cpu_maxim=None,
+                           memorie_maxima_mb=None):
+    """Incearca sa demonstreze nesatisfiabilitatea folosind rezolutia.
+
+    Clauzele sunt tupluri sortate, iar un index literal -> clauze face ca fiecare clauza noua sa fie
+    confruntata doar cu clauzele care contin complementul unuia dintre literalii ei (nu cu toate).
+    Multimea de clauze este tinuta fara subsumari (vezi MultimeClauze).
+    oprire este un eveniment optional (ex. multiprocessing.Event); cand e setat rularea se
+    incheie cu starea "ANULAT", pastrand statisticile partiale.
+    Cu un Profilator, timpul se imparte in generare, subsumare si reindexare; se inregistreaza
+    histograma lungimii rezolventilor adaugati.
+    Cu numar_procese > 1 (None = os.cpu_count()), rundele cu cel putin prag_paralel perechi estimate
+    (clauze noi x clauze) sunt generate pe fragmente in procese separate (rezolventi_runda_paralel);
+    rezolventii sunt apoi adaugati, cu subsumare, in procesul principal.
+    Fara buget_memorie_mb, rularea se opreste cu "NECUNOSCUT (Explozie de clauze)" peste limita de clauze;
+    cu buget, limita devine memoria estimata a multimii, iar la depasire saturarea continua pe disc
+    (saturare_pe_disc, in director_descarcare sau in directorul temporar al sistemului).
+    Timpul, oprirea si bugetele optionale timp_cpu_maxim (secunde) si memorie_maxima_mb (RSS) sunt
+    verificate la fiecare pereche printr-un GuvernatorResurse; o depasire opreste rularea cu statisticile partiale.
+    """
     timp_start = time.perf_counter()
+    guvernator = GuvernatorResurse(timp_maxim, timp_cpu_maxim, memorie_maxima_mb, oprire, timp_start)
     statistici_rezolutie = {'rezolutii': 0, 'clauze_generate': 0, 'clauza_goala_gasita': False, 'iteratii': 0,
-                            'saturare_atinsa': False}
+                            'saturare_atinsa': False, 'subsumari_inainte': 0, 'subsumari_inapoi': 0,
+                            'rezolutii_pe_secunda': 0.0, 'runde_paralele': 0, 'clauze_pe_disc': 0}
+    numar_procese = numar_procese or os.cpu_count() or 1
+    buget_octeti = max(buget_memorie_mb * (1 << 20), 2 * DepozitClauze.BUGET_MINIM) if buget_memorie_mb else None
 
     if any(not c for c in clauze_intrare):
         statistici_rezolutie['clauza_goala_gasita'] = True
         return "UNSAT", None, statistici_rezolutie
 
-    clauze_curente = set(tuple(sorted(c)) for c in clauze_intrare if c)
-    numar_initial_clauze = len(clauze_curente)
-    derivate_recent_in_runda = set(clauze_curente)
+    clauze_unice = set()
+    for c in clauze_intrare:
+        set_clauza = set(c)
+        if not any(-literal in set_clauza for literal in set_clauza):  # tautologiile nu contribuie la refutare
+            clauze_unice.add(tuple(sorted(set_clauza)))
+    numar_variabile = max([numar_variabile] + [abs(literal) for clauza in clauze_unice for literal in clauza])
+    multime = MultimeClauze()
+    for clauza in sorted(clauze_unice, key=len):  # cele scurte intai: subsumarea inainte ajunge
+        multime.adauga(clauza)
+    limita_clauze = max(2 * len(multime) + 5000, limita_clauze_rezolutie)
+    index_aparitii = {}  # doar clauzele deja procesate, pentru imperechere
+    derivate_recent_in_runda = list(multime)
+    executor = oprire_fragmente = None  # pornit la prima runda destul de mare
+
+    def incheie(stare, atribuire=None):
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if guvernator.stare is not None:
+            statistici_rezolutie.update(guvernator.rezumat())
+        durata = time.perf_counter() - timp_start
+        statistici_rezolutie['subsumari_inainte'] = multime.subsumari_inainte
+        statistici_rezolutie['subsumari_inapoi'] = multime.subsumari_inapoi
+        statistici_rezolutie['rezolutii_pe_secunda'] = round(statistici_rezolutie['rezolutii'] / durata, 1) \
+            if durata > 0 else 0.0
+        if profil is not None:  # generarea perechilor este restul timpului, fara subsumare si reindexare
+            profil.timpi['generare'] = durata - profil.timpi.get('subsumare', 0.0) - profil.timpi.get('reindexare', 0.0)
+        return stare, atribuire, statistici_rezolutie
+
+    def multime_prea_mare():
+        if buget_octeti is None:
+            return len(multime) > limita_clauze
+        return multime.octeti_estimati() > buget_octeti
+
+    def la_depasire():
+        if buget_octeti is None:
+            print(f"Avertisment: Setul de clauze al rezolutiei a depasit limita ({limita_clauze}). Oprire.")
+            return incheie("NECUNOSCUT (Explozie de clauze)")
+        print(f"Setul de clauze al rezolutiei ({len(multime)}) depaseste bugetul de {buget_memorie_mb} MB; "
+              f"saturarea continua pe disc.")
+        # Perechile dintre clauzele deja indexate au fost rezolvate; restul raman de imperecheat
+        indexate = set(chain.from_iterable(index_aparitii.values()))
+        index_aparitii.clear()
+        clauze_noi = [clauza for clauza in multime if clauza not in indexate]
+        indexate = None
+        return incheie(*saturare_pe_disc(multime, clauze_noi, numar_variabile, guvernator, statistici_rezolutie,
+                                         buget_octeti, director_descarcare, profil))
 
     iteratie = 0
     while True:
         iteratie += 1
         statistici_rezolutie['iteratii'] = iteratie
 
-        if time.perf_counter() - timp_start > timp_maxim:
-            statistici_rezolutie['clauze_generate'] = len(clauze_curente) - numar_initial_clauze
-            return "TIMP_DEPASIT", None, statistici_rezolutie
-
-        derivate_in_aceasta_iteratie = set()
-        clauze_de_confruntat = list(clauze_curente)
-        clauze_noi_de_procesat = list(derivate_recent_in_runda)
+        if guvernator.depasit_acum() is not None:
+            return incheie(guvernator.stare)
+
+        # Clauzele noi ale rundei sunt confruntate cu cele vechi si intre ele; o clauza noua intra in index
+        # abia dupa ce a fost procesata, astfel incat fiecare pereche este rezolvata o singura data.
+        derivate_in_aceasta_iteratie = []
+        rezolutii = statistici_rezolutie['rezolutii']
+        clauze_noi = None
+        if numar_procese > 1 and len(derivate_recent_in_runda) * len(multime) >= prag_paralel:
+            clauze_noi = sorted((c for c in derivate_recent_in_runda if c in multime), key=lambda c: (len(c), c))
+        if clauze_noi:  # daca toate au fost subsumate intre timp nu ramane nimic de impartit pe fragmente
+            if executor is None:
+                executor, oprire_fragmente = porneste_executor_rezolventi(numar_procese)
+            set_noi = set(clauze_noi)
+            stare_runda, rezolventi, numar_rezolutii = rezolventi_runda_paralel(
+                executor, oprire_fragmente, 4 * numar_procese, [c for c in multime if c not in set_noi], clauze_noi,
+                guvernator)
+            rezolutii += numar_rezolutii
+            statistici_rezolutie['rezolutii'] = rezolutii
+            statistici_rezolutie['runde_paralele'] += 1
+            if stare_runda == 'gol':
+                statistici_rezolutie['clauza_goala_gasita'] = True
+                return incheie("UNSAT")
+            if stare_runda != 'ok':
+                return incheie(stare_runda)
+            if profil is not None:
+                inceput_subsumare = time.perf_counter()
+            for tuplu_rez in sorted(rezolventi, key=lambda c: (len(c), c)):
+                if guvernator.depasit() is not None:
+                    return incheie(guvernator.stare)
+                if multime.adauga(tuplu_rez):
+                    derivate_in_aceasta_iteratie.append(tuplu_rez)
+                    statistici_rezolutie['clauze_generate'] += 1
+                    if profil is not None:
+                        profil.inregistreaza('lungime_rezolvent', len(tuplu_rez))
+                    if multime_prea_mare():
+                        return la_depasire()
+            if profil is not None:
+                profil.adauga_timp('subsumare', inceput_subsumare)
+            for clauza_noua in clauze_noi:
+                if clauza_noua in multime:
+                    indexeaza_clauza(index_aparitii, clauza_noua)
+        else:
+            for clauza_noua in sorted(derivate_recent_in_runda, key=lambda c: (len(c), c)):
+                if clauza_noua not in multime:
+                    continue  # subsumata intre timp
+                set_clauza_noua = set(clauza_noua)
+                for pivot in clauza_noua:
+                    for clauza_existenta in index_aparitii.get(-pivot, ()):
+                        if clauza_existenta not in multime:
+                            continue
+                        rezolutii += 1
+                        if guvernator.depasit() is not None:
+                            statistici_rezolutie['rezolutii'] = rezolutii
+                            return incheie(guvernator.stare)
+                        if profil is not None and rezolutii % 5000 == 0:
+                            acum = time.perf_counter()
+                            if acum >= profil.urmatorul_instantaneu:
+                                profil.progres(acum, iteratie=iteratie, rezolutii=rezolutii, clauze=len(multime),
+                                               clauze_generate=statistici_rezolutie['clauze_generate'])
+
+                        # Un al doilea literal complementar face rezolventul tautologie
+                        if any(-literal in set_clauza_noua for literal in clauza_existenta if literal != -pivot):
+                            continue
+                        rezolvent = set_clauza_noua.union(clauza_existenta)
+                        rezolvent.discard(pivot)
+                        rezolvent.discard(-pivot)
+                        if not rezolvent:
+                            statistici_rezolutie['rezolutii'] = rezolutii
+                            statistici_rezolutie['clauza_goala_gasita'] = True
+                            return incheie("UNSAT")
+
+                        tuplu_rez = tuple(sorted(rezolvent))
+                        if profil is not None:
+                            inceput_subsumare = time.perf_counter()
+                            adaugat = multime.adauga(tuplu_rez)
+                            profil.adauga_timp('subsumare', inceput_subsumare)
+                            if adaugat:
+                                profil.inregistreaza('lungime_rezolvent', len(tuplu_rez))
+                        else:
+                            adaugat = multime.adauga(tuplu_rez)
+                        if adaugat:
+                            derivate_in_aceasta_iteratie.append(tuplu_rez)
+                            statistici_rezolutie['clauze_generate'] += 1
+                            if multime_prea_mare():
+                                statistici_rezolutie['rezolutii'] = rezolutii
+                                return la_depasire()
+                    if clauza_noua not in multime:
+                        break  # un rezolvent a subsumat-o; perechile ramase ar da rezolventi subsumati
+                else:
+                    indexeaza_clauza(index_aparitii, clauza_noua)
+        statistici_rezolutie['rezolutii'] = rezolutii
 
-        if not clauze_noi_de_procesat:
+        if not derivate_in_aceasta_iteratie:
             break
 
-        perechi_procesate_iteratie_curenta = 0
-        max_perechi_per_iteratie = 100000
-        # Limita aleasa arbitrar, poate fi modificata insa nu ar face mare diferenta pe rezolutie ca oricum crapa repede
+        derivate_recent_in_runda = derivate_in_aceasta_iteratie
+        if profil is not None:
+            inceput_reindexare = time.perf_counter()
+        for literal in list(index_aparitii):
+            index_aparitii[literal] = [c for c in index_aparitii[literal] if c in multime]
+        if profil is not None:
+            profil.adauga_timp('reindexare', inceput_reindexare)
+
+    # Toate perechile cu literali complementari au fost rezolvate fara a obtine clauza goala; cum
+    # rezolutia este completa pentru refutare, multimea saturata este satisfiabila, iar un model se
+    # construieste direct din ea
+    statistici_rezolutie['saturare_atinsa'] = True
+    return incheie("SAT", model_din_saturare(multime, numar_variabile))
 
-        for tuplu_clauza_noua in clauze_noi_de_procesat:
-            if perechi_procesate_iteratie_curenta > max_perechi_per_iteratie: break
-            lista_clauza_noua = list(tuplu_clauza_noua)
 
-            for tuplu_clauza_existenta in clauze_de_confruntat:
-                if perechi_procesate_iteratie_curenta > max_perechi_per_iteratie: break
-                if tuplu_clauza_noua == tuplu_clauza_existenta: continue
+# --- Algoritmul Davis-Putnam (Original) ---
+class StivaReconstructie:
+    """Stiva de extindere a modelului pentru clauzele scoase din formula (eliminare, preprocesare).
 
-                if perechi_procesate_iteratie_curenta % 5000 == 0 and time.perf_counter() - timp_start > timp_maxim:
-                    statistici_rezolutie['clauze_generate'] = len(clauze_curente) - numar_initial_clauze
-                    return "TIMP_DEPASIT", None, statistici_rezolutie
+    Fiecare intrare este (literal_martor, clauza): la reconstructie, parcurse in ordine inversa,
+    clauzele nesatisfacute sunt reparate facand martorul adevarat. Pentru eliminarea unei variabile
+    martorul este literalul ei din clauza; rezolventii satisfacuti garanteaza ca reparatiile nu se
+    contrazic. Preprocesarea mai inregistreaza literalii fixati la nivelul 0 si renumerotarea
+    variabilelor formulei reduse (vezi extinde_model).
+    """
 
-                lista_clauza_existenta = list(tuplu_clauza_existenta)
-                rezolventi = rezolva(lista_clauza_noua, lista_clauza_existenta)
-                statistici_rezolutie['rezolutii'] += 1
-                perechi_procesate_iteratie_curenta += 1
+    def __init__(self):
+        self.intrari = []
+        self.fixate = []  # literali adevarati in orice model (unitati, literali esuati)
+        self.variabile_originale = None  # variabila redusa -> variabila originala (None = identitate)
+        self.numar_variabile_original = 0
 
-                for tuplu_rez in rezolventi:
-                    if not tuplu_rez:
-                        statistici_rezolutie['clauza_goala_gasita'] = True
-                        statistici_rezolutie['clauze_generate'] = len(
-                            clauze_curente | derivate_in_aceasta_iteratie) - numar_initial_clauze
-                        return "UNSAT", None, statistici_rezolutie
+    def __len__(self):
+        return len(self.intrari)
 
-                    if tuplu_rez not in clauze_curente and tuplu_rez not in derivate_in_aceasta_iteratie:
-                        derivate_in_aceasta_iteratie.add(tuplu_rez)
+    def adauga_eliminare(self, variabila, clauze_cu_pozitiv, clauze_cu_negativ):
+        self.intrari.extend((variabila, clauza) for clauza in clauze_cu_pozitiv)
+        self.intrari.extend((-variabila, clauza) for clauza in clauze_cu_negativ)
 
-        if not derivate_in_aceasta_iteratie:
-            statistici_rezolutie['saturare_atinsa'] = True
-            statistici_rezolutie['clauze_generate'] = len(clauze_curente) - numar_initial_clauze
-            return "NECUNOSCUT (Rezolutie saturata)", None, statistici_rezolutie
+    def adauga_clauza(self, literal_martor, clauza):
+        self.intrari.append((literal_martor, clauza))
 
-        derivate_recent_in_runda = derivate_in_aceasta_iteratie
-        clauze_curente.update(derivate_in_aceasta_iteratie)
+    def reconstruieste(self, atribuire):
+        """Completeaza/corecteaza atribuirea (dict variabila -> bool) pe loc si o intoarce."""
+        for literal_martor, clauza in reversed(self.intrari):
+            if not any(atribuire.get(abs(literal), False) == (literal > 0) for literal in clauza):
+                atribuire[abs(literal_martor)] = literal_martor > 0
+        return atribuire
 
-        limita_clauze = max(2 * numar_initial_clauze + 5000, limita_clauze_rezolutie)
-        if len(clauze_curente) > limita_clauze:
-            print(f"Avertisment: Setul de clauze al rezolutiei a depasit limita ({limita_clauze}). Oprire.")
-            statistici_rezolutie['clauze_generate'] = len(clauze_curente) - numar_initial_clauze
-            return "NECUNOSCUT (Explozie de clauze)", None, statistici_rezolutie
+    def extinde_model(self, atribuire_redusa):
+        """Traduce un model al formulei reduse intr-un model al formulei originale."""
+        atribuire = {variabila: True for variabila in range(1, self.numar_variabile_original + 1)}
+        for variabila, valoare in atribuire_redusa.items():
+            atribuire[self.variabile_originale[variabila] if self.variabile_originale else variabila] = valoare
+        for literal in self.fixate:
+            atribuire[abs(literal)] = literal > 0
+        return self.reconstruieste(atribuire)
 
 
-# --- Algoritmul Davis-Putnam (Original) ---
-def dp_elimina_variabila(clauze, variabila_de_eliminat):
-    """Elimina o variabila folosind rezolutia, conform algoritmului DP original."""
-    clauze_cu_pozitiv = []
-    clauze_cu_negativ = []
-    alte_clauze = []
+class FormulaDp:
+    """Clauzele DP (tupluri sortate, fara duplicate si tautologii) cu liste de aparitii.
+
+    aparitii[literal] contine id-urile clauzelor cu acel literal, astfel incat eliminarea unei
+    variabile atinge doar clauzele ei, fara repartitionarea intregii formule.
+    """
+
+    OCTETI_PE_CLAUZA = 250  # Estimari masurate cu tracemalloc (dictionarele de id-uri, seturi de aparitii, tuplu)
+    OCTETI_PE_LITERAL = 60
+
+    def __init__(self):
+        self.clauze = {}  # id -> clauza
+        self.id_clauza = {}  # clauza -> id
+        self.aparitii = {}  # literal -> {id}
+        self.urmatorul_id = 0
+        self.numar_literali = 0
+
+    def __len__(self):
+        return len(self.clauze)
+
+    def adauga(self, clauza):
+        """Adauga clauza daca nu exista deja; intoarce True daca a fost adaugata."""
+        if clauza in self.id_clauza:
+            return False
+        id_nou = self.urmatorul_id
+        self.urmatorul_id += 1
+        self.clauze[id_nou] = clauza
+        self.id_clauza[clauza] = id_nou
+        for literal in clauza:
+            multime = self.aparitii.get(literal)
+            if multime is None:
+                self.aparitii[literal] = {id_nou}
+            else:
+                multime.add(id_nou)
+        self.numar_literali += len(clauza)
+        return True
+
+    def elimina(self, id_clauza):
+        clauza = self.clauze.pop(id_clauza)
+        del self.id_clauza[clauza]
+        for literal in clauza:
+            self.aparitii[literal].discard(id_clauza)
+        self.numar_literali -= len(clauza)
+        return clauza
+
+    def octeti_estimati(self):
+        return self.OCTETI_PE_CLAUZA * len(self.clauze) + self.OCTETI_PE_LITERAL * self.numar_literali
+
+    def numar_aparitii(self, literal):
+        return len(self.aparitii.get(literal, ()))
 
-    for clauza in clauze:
-        set_clauza = set(clauza)
-        if variabila_de_eliminat in set_clauza:
-            clauze_cu_pozitiv.append(clauza)
-        elif -variabila_de_eliminat in set_clauza:
-            clauze_cu_negativ.append(clauza)
-        else:
-            alte_clauze.append(clauza)
 
-    if not clauze_cu_pozitiv or not clauze_cu_negativ:
-        return alte_clauze + clauze_cu_pozitiv + clauze_cu_negativ, 0
+def dp_elimina_variabila(clauze_cu_pozitiv, clauze_cu_negativ, variabila_de_eliminat, limita_rezolventi=None,
+                         guvernator=None):
+    """Rezolventii ne-tautologici ai tuturor perechilor (pozitiva, negativa) pe variabila data.
 
-    clauze_noi_din_rezolutie = set()
+    Intoarce (rezolventi, rezolutii_efectuate); rezolventi contine tuplul gol daca s-a derivat
+    clauza goala (caz in care generarea se opreste imediat) si este None daca s-ar depasi
+    limita_rezolventi. Un GuvernatorResurse este verificat la fiecare pereche si ridica exceptia starii lui.
+    """
+    rezolventi = set()
     rezolutii_efectuate = 0
 
     for clauza_poz in clauze_cu_pozitiv:
+        set_poz = set(clauza_poz)
+        set_poz.discard(variabila_de_eliminat)
+        if limita_rezolventi is not None and len(rezolventi) > limita_rezolventi:
+            return None, rezolutii_efectuate
         for clauza_neg in clauze_cu_negativ:
-            set_rezolvent = (set(clauza_poz) - {variabila_de_eliminat}).union(
-                set(clauza_neg) - {-variabila_de_eliminat})
+            rezolutii_efectuate += 1
+            if guvernator is not None:
+                guvernator.verifica()
+            # Un al doilea literal complementar face rezolventul tautologie
+            if any(-literal in set_poz for literal in clauza_neg if literal != -variabila_de_eliminat):
+                continue
+            set_rezolvent = set_poz.union(clauza_neg)
+            set_rezolvent.discard(-variabila_de_eliminat)
+            if not set_rezolvent:
+                return {()}, rezolutii_efectuate
+            rezolventi.add(tuple(sorted(set_rezolvent)))
 
-            este_tautologie = False
-            for literal in set_rezolvent:
-                if -literal in set_rezolvent:
-                    este_tautologie = True
-                    break
+    return rezolventi, rezolutii_efectuate
 
-            if not set_rezolvent:
-                return [[]], 1
 
-            if not este_tautologie:
-                clauze_noi_din_rezolutie.add(tuple(sorted(list(set_rezolvent))))
+ORDINI_ELIMINARE_DP = ('secventiala', 'min_produs', 'min_crestere')
 
-            rezolutii_efectuate += 1
 
-    clauze_finale = alte_clauze + [list(c) for c in clauze_noi_din_rezolutie]
-    return clauze_finale, rezolutii_efectuate
+def cost_eliminare_dp(formula, variabila, ordine):
+    """Costul estimat al eliminarii: |poz|*|neg| sau cresterea maxima |poz|*|neg| - |poz| - |neg|."""
+    numar_pozitive = formula.numar_aparitii(variabila)
+    numar_negative = formula.numar_aparitii(-variabila)
+    if ordine == 'min_produs':
+        return numar_pozitive * numar_negative
+    return numar_pozitive * numar_negative - numar_pozitive - numar_negative
 
 
-def rezolva_dp(clauze_intrare, numar_variabile, timp_maxim):
-    """Incearca sa rezolve SAT folosind eliminarea variabilelor (Davis-Putnam original)."""
-    timp_start = time.perf_counter()
-    statistici_dp = {'variabile_eliminate': 0, 'rezolutii': 0, 'max_clauze': len(clauze_intrare)}
+def dp_pe_galeti(clauze, ordine_variabile, numar_variabile, guvernator, statistici, buget_octeti, director=None):
+    """Eliminare pe galeti (bucket elimination) cu clauzele intr-un DepozitClauze, pentru formule peste buget.
+
+    Ordinea variabilelor este fixata la intrare; fiecare clauza sta in galeata primei ei variabile in
+    aceasta ordine, deci eliminarea unei variabile citeste doar galeata ei, iar rezolventii (care contin
+    doar variabile ulterioare) sunt trimisi in galetile lor, pe disc daca nu incap in buget. Galetile
+    procesate sunt scrise ca rulaje, din care modelul se reface in ordinea inversa a eliminarilor.
+    Intoarce (stare, atribuire); la depasirea unui buget al guvernatorului, starea acestuia.
+    """
+    pozitie = {variabila: i for i, variabila in enumerate(ordine_variabile)}
+
+    def galeata(clauza):
+        return min(pozitie[abs(literal)] for literal in clauza)
 
+    depozit = DepozitClauze(buget_octeti, director)
+    eliminate = []  # (variabila, rulajul galetii ei)
+    rezolutii = statistici['rezolutii']
+    try:
+        for clauza in clauze:
+            depozit.adauga(clauza, galeata(clauza))
+        for i, variabila in enumerate(ordine_variabile):
+            if guvernator.depasit_acum() is not None:
+                return guvernator.stare, None
+            clauze_galeata = depozit.extrage(i)
+            if not clauze_galeata:
+                continue
+            eliminate.append((variabila, depozit.scrie_rulaj(clauze_galeata)[0]))
+            clauze_cu_pozitiv = [clauza for clauza in clauze_galeata if variabila in clauza]
+            clauze_cu_negativ = [clauza for clauza in clauze_galeata if -variabila in clauza]
+            clauze_galeata = None
+            statistici['variabile_eliminate'] += 1
+            statistici['eliminari_pe_disc'] += 1
+            for clauza_poz in clauze_cu_pozitiv:
+                set_poz = set(clauza_poz)
+                set_poz.discard(variabila)
+                for clauza_neg in clauze_cu_negativ:
+                    rezolutii += 1
+                    if guvernator.depasit() is not None:
+                        return guvernator.stare, None
+                    if any(-literal in set_poz for literal in clauza_neg if literal != -variabila):
+                        continue
+                    set_rezolvent = set_poz.union(clauza_neg)
+                    set_rezolvent.discard(-variabila)
+                    if not set_rezolvent:
+                        return "UNSAT", None
+                    rezolvent = tuple(sorted(set_rezolvent))
+                    depozit.adauga(rezolvent, galeata(rezolvent))
+
+        atribuire = {variabila: True for variabila in range(1, numar_variabile + 1)}
+        for variabila, cale in reversed(eliminate):
+            for clauza in depozit.citeste_rulaj(cale):
+                if not any(atribuire[abs(literal)] == (literal > 0) for literal in clauza):
+                    atribuire[variabila] = variabila in clauza
+        return "SAT", atribuire
+    finally:
+        statistici['rezolutii'] = rezolutii
+        statistici['descarcare'] = dict(depozit.statistici)
+        depozit.inchide()
+
+
+def rezolva_dp(clauze_intrare, numar_variabile, timp_maxim, oprire=None, ordine='min_crestere', profil=None,
+               numar_procese=1, prag_paralel=200000, buget_memorie_mb=None, director_descarcare=None,
+               timp_cpu_maxim=None, memorie_maxima_mb=None):
+    """Incearca sa rezolve SAT folosind eliminarea variabilelor (Davis-Putnam original).
+
+    ordine alege urmatoarea variabila eliminata: 'secventiala' (1..n, ca in algoritmul original),
+    'min_produs' sau 'min_crestere'; pentru ultimele doua costurile stau intr-un heap indexat,
+    actualizat doar pentru variabilele clauzelor atinse de fiecare eliminare.
+    Clauzele eliminate sunt pastrate intr-o StivaReconstructie, din care se reface un model la SAT.
+    Evenimentul oprire este verificat intre eliminari, ca si limita de timp.
+    Cu un Profilator, fiecare eliminare se imparte in selectie, rezolventi si actualizare, cu
+    histogramele lungimii rezolventilor si ale numarului de rezolventi per eliminare.
+    Cu numar_procese > 1 (None = os.cpu_count()), eliminarile cu cel putin prag_paralel perechi
+    |poz|*|neg| sunt generate pe fragmente in procese separate (dp_elimina_variabila_paralel).
+    Cu buget_memorie_mb, limita de clauze devine memoria estimata a formulei; cand o eliminare ar
+    depasi-o, variabilele ramase (in ordinea curenta a heap-ului) sunt eliminate pe galeti cu
+    descarcare pe disc (dp_pe_galeti), in loc de oprirea cu "NECUNOSCUT (Explozie de clauze)".
+    Timpul, oprirea, timp_cpu_maxim si memorie_maxima_mb (RSS) sunt verificate printr-un GuvernatorResurse
+    si in interiorul unei eliminari, la fiecare pereche de clauze, nu doar intre eliminari.
+    """
+    guvernator = GuvernatorResurse(timp_maxim, timp_cpu_maxim, memorie_maxima_mb, oprire)
+    statistici_dp = {'variabile_eliminate': 0, 'rezolutii': 0, 'max_clauze': len(clauze_intrare),
+                     'ordine_eliminare': ordine, 'eliminari_paralele': 0, 'eliminari_pe_disc': 0}
+    numar_procese = numar_procese or os.cpu_count() or 1
+    buget_octeti = max(buget_memorie_mb * (1 << 20), DepozitClauze.BUGET_MINIM) if buget_memorie_mb else None
+
+    if ordine not in ORDINI_ELIMINARE_DP:
+        raise ValueError(f"Ordine de eliminare necunoscuta: {ordine} (disponibile: {', '.join(ORDINI_ELIMINARE_DP)})")
     if any(not c for c in clauze_intrare):
         return "UNSAT", None, statistici_dp
 
-    clauze_curente = deepcopy(clauze_intrare)
-    variabile = list(range(1, numar_variabile + 1))
+    formula = FormulaDp()
+    for c in clauze_intrare:
+        set_clauza = set(c)
+        if not any(-literal in set_clauza for literal in set_clauza):
+            formula.adauga(tuple(sorted(set_clauza)))
+    numar_variabile = max([numar_variabile] + [abs(literal) for literal in formula.aparitii])
 
-    for index_var, variabila in enumerate(variabile):
-        if time.perf_counter() - timp_start > timp_maxim:
-            return "TIMP_DEPASIT", None, statistici_dp
+    if ordine == 'secventiala':
+        heap = None
+        ramase = list(range(numar_variabile, 0, -1))
+    else:
+        scoruri = [0] * (numar_variabile + 1)  # -cost, deoarece HeapVariabile este max-heap
+        heap = HeapVariabile(scoruri, numar_variabile)
+        for variabila in range(1, numar_variabile + 1):
+            scoruri[variabila] = -cost_eliminare_dp(formula, variabila, ordine)
+            heap.insereaza(variabila)
+
+    stiva = StivaReconstructie()
+    limita_clauze = max(2 * len(clauze_intrare) + 5000, limita_clauze_dp)
+    executor = oprire_fragmente = None  # pornit la prima eliminare destul de mare
+
+    def rezolventi_permisi():
+        if buget_octeti is None:
+            return limita_clauze - len(formula)
+        lungime_medie = formula.numar_literali / len(formula) if formula else 3
+        cost_clauza = FormulaDp.OCTETI_PE_CLAUZA + FormulaDp.OCTETI_PE_LITERAL * lungime_medie
+        return max(0, int((buget_octeti - formula.octeti_estimati()) / cost_clauza))
+
+    def continua_pe_galeti(clauze_ramase, urmatoarele):
+        print(f"Formula DP depaseste bugetul de {buget_memorie_mb} MB; eliminarea continua pe galeti, pe disc.")
+        if heap is not None:
+            while heap:
+                urmatoarele.append(heap.extrage_max())
+        else:
+            urmatoarele.extend(reversed(ramase))
+        inceput = time.perf_counter()
+        stare, atribuire = dp_pe_galeti(clauze_ramase, urmatoarele, numar_variabile, guvernator, statistici_dp,
+                                        buget_octeti, director_descarcare)
+        if profil is not None:
+            inceput = profil.adauga_timp('galeti', inceput)
+        if stare == "SAT":
+            atribuire = stiva.reconstruieste(atribuire)
+            if profil is not None:
+                profil.adauga_timp('reconstructie', inceput)
+        return stare, atribuire, statistici_dp
 
-        clauze_curente, numar_rezolutii = dp_elimina_variabila(clauze_curente, variabila)
-        statistici_dp['rezolutii'] += numar_rezolutii
-        statistici_dp['variabile_eliminate'] += 1
-        statistici_dp['max_clauze'] = max(statistici_dp['max_clauze'], len(clauze_curente))
+    try:
+        while heap or (heap is None and ramase):
+            if guvernator.depasit_acum() is not None:
+                return guvernator.stare, None, statistici_dp
+            acum = time.perf_counter()
+            if profil is not None and acum >= profil.urmatorul_instantaneu:
+                profil.progres(acum, variabile_eliminate=statistici_dp['variabile_eliminate'],
+                               rezolutii=statistici_dp['rezolutii'], clauze=len(formula))
+
+            variabila = heap.extrage_max() if heap is not None else ramase.pop()
+            clauze_cu_pozitiv = [formula.elimina(i) for i in list(formula.aparitii.get(variabila, ()))]
+            clauze_cu_negativ = [formula.elimina(i) for i in list(formula.aparitii.get(-variabila, ()))]
+            if profil is not None:
+                acum = profil.adauga_timp('selectie', acum)
+            try:
+                if numar_procese > 1 and clauze_cu_pozitiv and clauze_cu_negativ and \
+                        len(clauze_cu_pozitiv) * len(clauze_cu_negativ) >= prag_paralel:
+                    if executor is None:
+                        executor, oprire_fragmente = porneste_executor_rezolventi(numar_procese)
+                    statistici_dp['eliminari_paralele'] += 1
+                    rezolventi, numar_rezolutii = dp_elimina_variabila_paralel(
+                        executor, oprire_fragmente, 4 * numar_procese, clauze_cu_pozitiv, clauze_cu_negativ,
+                        variabila, rezolventi_permisi(), guvernator)
+                else:
+                    rezolventi, numar_rezolutii = dp_elimina_variabila(clauze_cu_pozitiv, clauze_cu_negativ,
+                                                                       variabila, rezolventi_permisi(),
+                                                                       guvernator=guvernator)
+            except (TimeoutError, RulareAnulata, MemorieEpuizata):
+                return guvernator.stare, None, statistici_dp
+            if profil is not None:
+                acum = profil.adauga_timp('rezolventi', acum)
+                if rezolventi is not None:
+                    profil.inregistreaza('rezolventi_pe_eliminare', len(rezolventi))
+                    for rezolvent in rezolventi:
+                        profil.inregistreaza('lungime_rezolvent', len(rezolvent))
+            statistici_dp['rezolutii'] += numar_rezolutii
+            if rezolventi is None:
+                if buget_octeti is not None:
+                    clauze_ramase = list(chain(formula.clauze.values(), clauze_cu_pozitiv, clauze_cu_negativ))
+                    clauze_cu_pozitiv = clauze_cu_negativ = formula = None
+                    return continua_pe_galeti(clauze_ramase, [variabila])
+                print(f"Avertisment: Eliminarea lui x{variabila} ar depasi limita de clauze DP ({limita_clauze}). Oprire.")
+                return "NECUNOSCUT (Explozie de clauze)", None, statistici_dp
+            statistici_dp['variabile_eliminate'] += 1
+            if () in rezolventi:
+                return "UNSAT", None, statistici_dp
+            stiva.adauga_eliminare(variabila, clauze_cu_pozitiv, clauze_cu_negativ)
+            for rezolvent in rezolventi:
+                formula.adauga(rezolvent)
+            statistici_dp['max_clauze'] = max(statistici_dp['max_clauze'], len(formula))
+
+            if heap is not None:
+                atinse = {abs(literal) for clauza in chain(clauze_cu_pozitiv, clauze_cu_negativ) for literal in clauza}
+                atinse.discard(variabila)
+                for alta in atinse:
+                    if heap.contine(alta):
+                        scoruri[alta] = -cost_eliminare_dp(formula, alta, ordine)
+                        heap.actualizeaza(alta)
+            if profil is not None:
+                profil.adauga_timp('actualizare', acum)
+
+            if buget_octeti is not None and formula.octeti_estimati() > buget_octeti:
+                clauze_ramase = list(formula.clauze.values())
+                formula = None
+                return continua_pe_galeti(clauze_ramase, [])
+            if buget_octeti is None and len(formula) > limita_clauze:
+                print(
+                    f"Avertisment: Setul de clauze DP a crescut prea mult ({len(formula)} clauze, limita {limita_clauze}). Oprire.")
+                return "NECUNOSCUT (Explozie de clauze)", None, statistici_dp
+
+        # Fiecare clauza ramasa ar contine o variabila neeliminata, deci formula este goala; modelul
+        # se reface pornind de la o atribuire arbitrara, in ordinea inversa a eliminarilor
+        inceput_reconstructie = time.perf_counter()
+        atribuire = stiva.reconstruieste({variabila: True for variabila in range(1, numar_variabile + 1)})
+        if profil is not None:
+            profil.adauga_timp('reconstructie', inceput_reconstructie)
+        return "SAT", atribuire, statistici_dp
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if guvernator.stare is not None:
+            statistici_dp.update(guvernator.rezumat())
+
+
+# --- Generare paralela a rezolventilor (fragmente in procese, clauze in memorie partajata) ---
+# Clauzele circula intre procese ca buffere int32 impachetate (literalii fiecarei clauze urmati de 0):
+# procesul principal publica o singura data setul de clauze intr-un bloc SharedMemory, fiecare fragment
+# il citeste de acolo si isi publica rezolventii (deduplicati local) intr-un bloc propriu, pe care
+# procesul principal il citeste, il elibereaza si il interclaseaza cu ceilalti.
+def impacheteaza_clauze(clauze):
+    literali = array('i')
+    for clauza in clauze:
+        literali.extend(clauza)
+        literali.append(0)
+    return literali
 
-        if clauze_curente == [[]] or any(not c for c in clauze_curente):
-            return "UNSAT", None, statistici_dp
 
-        limita_clauze = max(2 * len(clauze_intrare) + 5000, limita_clauze_dp)
-        if len(clauze_curente) > limita_clauze:
-            print(
-                f"Avertisment: Setul de clauze DP a crescut prea mult ({len(clauze_curente)} clauze, limita {limita_clauze}). Oprire.")
-            return "NECUNOSCUT (Explozie de clauze)", None, statistici_dp
+def despacheteaza_clauze(literali):
+    """Lista de tupluri dintr-un buffer impachetat (literali separati prin 0)."""
+    clauze = []
+    inceput = 0
+    for indice, literal in enumerate(literali):
+        if literal == 0:
+            clauze.append(tuple(literali[inceput:indice]))
+            inceput = indice + 1
+    return clauze
 
-    if not clauze_curente:
-        return "SAT", None, statistici_dp
-    elif any(not c for c in clauze_curente):
-        return "UNSAT", None, statistici_dp
-    else:
-        print(f"Avertisment: DP s-a incheiat cu clauze non-goale ramase: {clauze_curente}. Se presupune SAT.")
-        return "SAT", None, statistici_dp
+
+def publica_literali(literali):
+    """Copiaza bufferul intr-un bloc SharedMemory nou; apelantul il inchide (si il elibereaza cu unlink)."""
+    bloc = shared_memory.SharedMemory(create=True, size=max(4 * len(literali), 4))
+    bloc.buf[:4 * len(literali)] = literali.tobytes()
+    return bloc
+
+
+def citeste_literali(nume, inceput, sfarsit, elibereaza=False):
+    """Literalii [inceput, sfarsit) dintr-un bloc SharedMemory existent, ca list de int."""
+    bloc = shared_memory.SharedMemory(name=nume)
+    try:
+        literali = array('i')
+        literali.frombytes(bloc.buf[4 * inceput:4 * sfarsit])
+    finally:
+        bloc.close()
+        if elibereaza:
+            bloc.unlink()
+    return literali.tolist()
+
+
+def publica_rezolventi(rezolventi):
+    """(nume_bloc, numar_literali) pentru rezolventii unui fragment; (None, 0) daca nu exista."""
+    if not rezolventi:
+        return None, 0
+    literali = impacheteaza_clauze(rezolventi)
+    bloc = publica_literali(literali)
+    bloc.close()
+    return bloc.name, len(literali)
+
+
+def termen_intre_procese(termen):
+    """Traduce un termen time.perf_counter() local in time.monotonic(), comparabil intre procese.
+
+    Un termen relativ (timp ramas) ar fi numarat de la pornirea fragmentului, deci fragmentele care
+    asteapta in coada executorului ar depasi termenul global.
+    """
+    return time.monotonic() + (termen - time.perf_counter()) if termen is not None else None
+
+
+def termen_local(termen_monotonic):
+    return time.perf_counter() + (termen_monotonic - time.monotonic()) if termen_monotonic is not None else None
+
+
+def preia_rezolventi(nume, numar_literali):
+    if nume is None:
+        return []
+    return despacheteaza_clauze(citeste_literali(nume, 0, numar_literali, elibereaza=True))
+
+
+_oprire_rezolventi = None
+
+
+def initializeaza_proces_rezolventi(oprire):
+    """Evenimentul de oprire al fragmentelor ajunge in procese la pornire (nu poate fi argument al unei sarcini)."""
+    global _oprire_rezolventi
+    _oprire_rezolventi = oprire
+
+
+def porneste_executor_rezolventi(numar_procese):
+    """Pool-ul fragmentelor si evenimentul prin care procesul principal le opreste."""
+    oprire_fragmente = multiprocessing.Event()
+    executor = ProcessPoolExecutor(max_workers=numar_procese, initializer=initializeaza_proces_rezolventi,
+                                   initargs=(oprire_fragmente,))
+    return executor, oprire_fragmente
+
+
+def guvernator_fragment(limite):
+    """GuvernatorResurse al unui fragment, din bugetele ramase ale procesului principal (limite_fragment)."""
+    termen, timp_cpu_maxim, memorie_maxima_mb = limite
+    inceput = time.perf_counter()
+    return GuvernatorResurse(termen_local(termen) - inceput, timp_cpu_maxim, memorie_maxima_mb, _oprire_rezolventi,
+                             inceput)
+
+
+def asteapta_fragmente(viitoare, guvernator, oprire_fragmente):
+    """Rezultatele fragmentelor, in ordine, verificand guvernatorul procesului principal intre asteptari.
+
+    La o depasire fragmentele sunt oprite prin eveniment si asteptate in continuare (se opresc la
+    urmatoarea verificare), ca blocurile de rezolventi publicate de ele sa poata fi eliberate.
+    """
+    ramase = set(viitoare)
+    while ramase:
+        _, ramase = wait(ramase, timeout=GuvernatorResurse.PERIOADA)
+        if ramase and guvernator.depasit_acum() is not None:
+            oprire_fragmente.set()
+            wait(ramase)
+            break
+    return [viitor.result() for viitor in viitoare]
+
+
+def stare_fragmente(rezultate, guvernator):
+    """'gol' daca un fragment a derivat clauza goala, starea de oprire (fixata si in guvernator) sau None."""
+    stari = {rezultat[0] for rezultat in rezultate}
+    if 'gol' in stari:
+        return 'gol'
+    if guvernator.stare is not None:
+        return guvernator.stare
+    for stare, _, _, _, motiv in rezultate:
+        if stare not in ('ok', 'limita'):
+            return guvernator.opreste(stare, motiv)
+    return None
+
+
+def rezolventi_dp_fragment(nume, limite_negative, limite_pozitive, variabila, limita_rezolventi, limite):
+    """Fragment din produsul |poz| x |neg| al eliminarii DP: clauzele pozitive din limite_pozitive cu toate negativele.
+
+    Intoarce (stare, nume_bloc, numar_literali, rezolutii, motiv) cu stare 'ok', 'gol' (clauza goala),
+    'limita' (limita_rezolventi depasita) sau starea guvernatorului fragmentului care l-a oprit.
+    """
+    guvernator = guvernator_fragment(limite)
+    clauze_cu_negativ = despacheteaza_clauze(citeste_literali(nume, *limite_negative))
+    clauze_cu_pozitiv = despacheteaza_clauze(citeste_literali(nume, *limite_pozitive))
+    try:
+        rezolventi, rezolutii = dp_elimina_variabila(clauze_cu_pozitiv, clauze_cu_negativ, variabila,
+                                                     limita_rezolventi, guvernator)
+    except (TimeoutError, RulareAnulata, MemorieEpuizata):
+        return guvernator.stare, None, 0, 0, guvernator.motiv
+    if rezolventi is None:
+        return 'limita', None, 0, rezolutii, None
+    if () in rezolventi:
+        return 'gol', None, 0, rezolutii, None
+    return ('ok',) + publica_rezolventi(rezolventi) + (rezolutii, None)
+
+
+def dp_elimina_variabila_paralel(executor, oprire_fragmente, numar_fragmente, clauze_cu_pozitiv, clauze_cu_negativ,
+                                 variabila_de_eliminat, limita_rezolventi, guvernator):
+    """Ca dp_elimina_variabila, dar clauzele pozitive sunt impartite in fragmente rezolvate in executor.
+
+    Aceleasi valori intoarse: (rezolventi, rezolutii_efectuate), cu {()} la clauza goala si None
+    peste limita_rezolventi. Fragmentele isi verifica bugetele la fiecare pereche; la oprirea lor sau
+    a procesului principal se ridica exceptia starii guvernatorului.
+    """
+    literali = impacheteaza_clauze(clauze_cu_negativ)
+    limite_negative = (0, len(literali))
+    limite_pozitive = []
+    marime = max(-(-len(clauze_cu_pozitiv) // max(numar_fragmente, 1)), 1)
+    for inceput in range(0, len(clauze_cu_pozitiv), marime):
+        inceput_literali = len(literali)
+        for clauza in clauze_cu_pozitiv[inceput:inceput + marime]:
+            literali.extend(clauza)
+            literali.append(0)
+        limite_pozitive.append((inceput_literali, len(literali)))
+
+    bloc = publica_literali(literali)
+    try:
+        limite = guvernator.limite_fragment(len(limite_pozitive))
+        viitoare = [executor.submit(rezolventi_dp_fragment, bloc.name, limite_negative, limite_pozitiv,
+                                    variabila_de_eliminat, limita_rezolventi, limite)
+                    for limite_pozitiv in limite_pozitive]
+        rezultate = asteapta_fragmente(viitoare, guvernator, oprire_fragmente)
+    finally:
+        bloc.close()
+        bloc.unlink()
+
+    rezolventi = set()
+    for _, nume, numar_literali, _, _ in rezultate:
+        rezolventi.update(preia_rezolventi(nume, numar_literali))  # eliberat si cand rezultatul e ignorat
+    rezolutii_efectuate = sum(rezultat[3] for rezultat in rezultate)
+    stare = stare_fragmente(rezultate, guvernator)
+    if stare == 'gol':
+        return {()}, rezolutii_efectuate
+    if stare is not None:
+        guvernator.ridica()
+    if any(rezultat[0] == 'limita' for rezultat in rezultate) or \
+            (limita_rezolventi is not None and len(rezolventi) > limita_rezolventi):
+        return None, rezolutii_efectuate
+    return rezolventi, rezolutii_efectuate
+
+
+def rezolventi_runda_fragment(nume, numar_vechi, numar_literali, inceput_fragment, sfarsit_fragment, limite):
+    """Rezolventii clauzelor noi [inceput_fragment, sfarsit_fragment) dintr-o runda de rezolutie.
+
+    Blocul contine clauzele vechi urmate de cele noi (sortate); clauza noua i este rezolvata cu toate
+    clauzele vechi si cu clauzele noi j < i, astfel incat fiecare pereche apare intr-un singur fragment.
+    Intoarce (stare, nume_bloc, numar_literali, rezolutii, motiv) cu stare 'ok', 'gol' sau starea
+    guvernatorului fragmentului care l-a oprit.
+    """
+    guvernator = guvernator_fragment(limite)
+    clauze = despacheteaza_clauze(citeste_literali(nume, 0, numar_literali))
+    index_aparitii = {}  # literal -> id-uri crescatoare (vechile intai)
+    for id_clauza, clauza in enumerate(clauze[:numar_vechi + sfarsit_fragment]):
+        for literal in clauza:
+            index_aparitii.setdefault(literal, []).append(id_clauza)
+
+    rezolventi = set()
+    rezolutii = 0
+    for id_nou in range(numar_vechi + inceput_fragment, numar_vechi + sfarsit_fragment):
+        clauza_noua = clauze[id_nou]
+        set_clauza_noua = set(clauza_noua)
+        for pivot in clauza_noua:
+            for id_existent in index_aparitii.get(-pivot, ()):
+                if id_existent >= id_nou:
+                    break
+                clauza_existenta = clauze[id_existent]
+                rezolutii += 1
+                if guvernator.depasit() is not None:
+                    return guvernator.stare, None, 0, rezolutii, guvernator.motiv
+                if any(-literal in set_clauza_noua for literal in clauza_existenta if literal != -pivot):
+                    continue
+                rezolvent = set_clauza_noua.union(clauza_existenta)
+                rezolvent.discard(pivot)
+                rezolvent.discard(-pivot)
+                if not rezolvent:
+                    return 'gol', None, 0, rezolutii, None
+                rezolventi.add(tuple(sorted(rezolvent)))
+    return ('ok',) + publica_rezolventi(rezolventi) + (rezolutii, None)
+
+
+def rezolventi_runda_paralel(executor, oprire_fragmente, numar_fragmente, clauze_vechi, clauze_noi, guvernator):
+    """Toti rezolventii unei runde (noi x vechi si noi x noi), generati pe fragmente in executor.
+
+    Intoarce (stare, rezolventi, rezolutii), stare fiind 'ok', 'gol' sau starea guvernatorului
+    (al procesului principal ori al unui fragment) care a oprit runda.
+    """
+    literali = impacheteaza_clauze(clauze_vechi)
+    for clauza in clauze_noi:
+        literali.extend(clauza)
+        literali.append(0)
+    # Clauza noua i are i + |vechi| parteneri, deci fragmentele egale ca numar de perechi se strang spre final
+    total = len(clauze_vechi) * len(clauze_noi) + len(clauze_noi) ** 2 / 2
+    limite, inceput, cumulat = [], 0, 0.0
+    for i in range(len(clauze_noi)):
+        cumulat += len(clauze_vechi) + i
+        if cumulat >= total * (len(limite) + 1) / numar_fragmente or i == len(clauze_noi) - 1:
+            limite.append((inceput, i + 1))
+            inceput = i + 1
+
+    bloc = publica_literali(literali)
+    try:
+        limite_bugete = guvernator.limite_fragment(len(limite))
+        viitoare = [executor.submit(rezolventi_runda_fragment, bloc.name, len(clauze_vechi), len(literali),
+                                    inceput_fragment, sfarsit_fragment, limite_bugete)
+                    for inceput_fragment, sfarsit_fragment in limite]
+        rezultate = asteapta_fragmente(viitoare, guvernator, oprire_fragmente)
+    finally:
+        bloc.close()
+        bloc.unlink()
+
+    rezolventi = set()
+    for _, nume, numar_literali, _, _ in rezultate:
+        rezolventi.update(preia_rezolventi(nume, numar_literali))
+    rezolutii = sum(rezultat[3] for rezultat in rezultate)
+    return stare_fragmente(rezultate, guvernator) or 'ok', rezolventi, rezolutii
 
 
 # --- Algoritmul DPLL ---
@@ -342,6 +2128,243 @@ class StatisticiDpll:
         self.decizii = 0
         self.propagari_unitare = 0
         self.reveniri = 0  # Backtracks
+        self.restarturi = 0
+        self.euristica = None
+        self.politica_restart = None
+
+
+class MotorPropagare:
+    """Propagare unitara cu doi literali urmariti (two-watched-literals) si urma (trail) de atribuiri.
+
+    Valorile literalilor sunt tinute intr-o lista indexata cu literal + numar_variabile
+    (1 = adevarat, -1 = fals, 0 = neatribuit). Fiecare clauza cu cel putin doi literali
+    este urmarita de primii ei doi literali; cand un literal devine fals sunt vizitate
+    doar clauzele din lista lui de urmarire.
+    """
+
+    def __init__(self, clauze, numar_variabile, statistici):
+        self.numar_variabile = numar_variabile
+        self.statistici = statistici
+        self.clauze = []
+        self.ceasuri = [[] for _ in range(2 * numar_variabile + 1)]
+        self.valoare = [0] * (2 * numar_variabile + 1)
+        self.nivel = [0] * (numar_variabile + 1)
+        self.motiv = [None] * (numar_variabile + 1)
+        self.urma = []
+        self.limite_nivel = []
+        self.cap_propagare = 0
+        self.conflict_initial = False
+        self.invatate = []  # Indicii clauzelor invatate (CDCL)
+        self.lbd = {}
+        self.euristica = None  # Notificata la revenire, vezi EuristicaRamificare
+        self.salvare_faza = False
+        self.faza = [True] * (numar_variabile + 1)  # Ultima valoare a fiecarei variabile (phase saving)
+        self.nucleu = None  # Asumptiile responsabile de UNSAT, dupa o cautare cu asumptii
+
+        for clauza in clauze:
+            self.adauga_clauza(clauza)
+
+    def adauga_clauza(self, clauza):
+        """Adauga o clauza la nivelul 0; unitatile sunt puse direct pe urma."""
+        n = self.numar_variabile
+        valoare = self.valoare
+        literali = []
+        vazuti = set()
+        for literal in clauza:
+            if literal in vazuti:
+                continue
+            if -literal in vazuti or valoare[literal + n] == 1:
+                return None  # Tautologie sau clauza deja satisfacuta la nivelul 0
+            vazuti.add(literal)
+            if valoare[literal + n] == 0:
+                literali.append(literal)
+
+        if not literali:
+            self.conflict_initial = True
+            return None
+        if len(literali) == 1:
+            self.atribuie(literali[0], None)
+            self.statistici.propagari_unitare += 1
+            return None
+
+        indice = len(self.clauze)
+        self.clauze.append(literali)
+        self.ceasuri[literali[0] + n].append(indice)
+        self.ceasuri[literali[1] + n].append(indice)
+        return indice
+
+    def mareste(self, numar_variabile):
+        """Mareste numarul de variabile (doar la nivelul 0).
+
+        Listele indexate cu literal + n sunt bordate cu aceeasi cantitate la ambele capete,
+        astfel incat indicii vechi se deplaseaza exact cu diferenta de variabile.
+        """
+        diferenta = numar_variabile - self.numar_variabile
+        if diferenta <= 0:
+            return
+        self.valoare = [0] * diferenta + self.valoare + [0] * diferenta
+        self.ceasuri = [[] for _ in range(diferenta)] + self.ceasuri + [[] for _ in range(diferenta)]
+        self.nivel.extend([0] * diferenta)
+        self.motiv.extend([None] * diferenta)
+        self.faza.extend([True] * diferenta)
+        self.numar_variabile = numar_variabile
+
+    def adauga_clauza_invatata(self, clauza, lbd):
+        """Adauga o clauza invatata dupa salt: clauza[0] este literalul asertiv, clauza[1] are nivelul maxim."""
+        if len(clauza) == 1:
+            self.atribuie(clauza[0], None)
+            return None
+        n = self.numar_variabile
+        indice = len(self.clauze)
+        self.clauze.append(clauza)
+        self.ceasuri[clauza[0] + n].append(indice)
+        self.ceasuri[clauza[1] + n].append(indice)
+        self.invatate.append(indice)
+        self.lbd[indice] = lbd
+        self.atribuie(clauza[0], indice)
+        return indice
+
+    def reduce_clauze_invatate(self):
+        """Sterge jumatate din clauzele invatate (cele cu LBD mare), pastrand motivele active si clauzele 'glue'."""
+        n = self.numar_variabile
+        clauze = self.clauze
+        blocate = set()
+        for literal in self.urma:
+            motiv = self.motiv[abs(literal)]
+            if motiv is not None:
+                blocate.add(motiv)
+
+        candidate = [i for i in self.invatate if self.lbd[i] > 2 and i not in blocate]
+        candidate.sort(key=lambda i: (self.lbd[i], len(clauze[i])), reverse=True)
+        de_sters = set(candidate[:len(candidate) // 2])
+        if not de_sters:
+            return 0
+
+        for indice in de_sters:
+            clauze[indice] = None
+            del self.lbd[indice]
+        self.invatate = [i for i in self.invatate if i not in de_sters]
+
+        ceasuri = [[] for _ in range(2 * n + 1)]
+        for indice, clauza in enumerate(clauze):
+            if clauza is not None:
+                ceasuri[clauza[0] + n].append(indice)
+                ceasuri[clauza[1] + n].append(indice)
+        self.ceasuri = ceasuri
+        return len(de_sters)
+
+    def nivel_decizie(self):
+        return len(self.limite_nivel)
+
+    def atribuie(self, literal, motiv):
+        n = self.numar_variabile
+        variabila = abs(literal)
+        self.valoare[literal + n] = 1
+        self.valoare[-literal + n] = -1
+        self.nivel[variabila] = len(self.limite_nivel)
+        self.motiv[variabila] = motiv
+        self.urma.append(literal)
+
+    def decide(self, literal):
+        """Deschide un nivel de decizie nou si atribuie literalul ales."""
+        self.limite_nivel.append(len(self.urma))
+        self.atribuie(literal, None)
+
+    def anuleaza_pana_la(self, nivel):
+        """Revine la nivelul de decizie dat, anuland atribuirile de pe urma."""
+        if len(self.limite_nivel) <= nivel:
+            return
+        n = self.numar_variabile
+        valoare = self.valoare
+        motiv = self.motiv
+        urma = self.urma
+        inceput = self.limite_nivel[nivel]
+        if self.euristica is not None:
+            self.euristica.la_revenire(inceput)
+        if self.salvare_faza:
+            faza = self.faza
+            for indice in range(inceput, len(urma)):
+                literal = urma[indice]
+                faza[abs(literal)] = literal > 0
+        for indice in range(len(urma) - 1, inceput - 1, -1):
+            literal = urma[indice]
+            valoare[literal + n] = 0
+            valoare[-literal + n] = 0
+            motiv[abs(literal)] = None
+        del urma[inceput:]
+        del self.limite_nivel[nivel:]
+        self.cap_propagare = min(self.cap_propagare, inceput)
+
+    def propaga(self):
+        """Propaga atribuirile de pe urma. Intoarce indicele clauzei in conflict sau None."""
+        n = self.numar_variabile
+        valoare = self.valoare
+        ceasuri = self.ceasuri
+        clauze = self.clauze
+        urma = self.urma
+        nivel = self.nivel
+        motiv = self.motiv
+        propagari = 0
+
+        while self.cap_propagare < len(urma):
+            fals = -urma[self.cap_propagare]
+            self.cap_propagare += 1
+            lista = ceasuri[fals + n]
+            nivel_curent = len(self.limite_nivel)
+            i = j = 0
+            lungime = len(lista)
+
+            while i < lungime:
+                indice = lista[i]
+                i += 1
+                clauza = clauze[indice]
+                if clauza[0] == fals:
+                    clauza[0] = clauza[1]
+                    clauza[1] = fals
+                primul = clauza[0]
+                if valoare[primul + n] == 1:
+                    lista[j] = indice
+                    j += 1
+                    continue
+
+                for k in range(2, len(clauza)):
+                    literal = clauza[k]
+                    if valoare[literal + n] != -1:
+                        clauza[1] = literal
+                        clauza[k] = fals
+                        ceasuri[literal + n].append(indice)
+                        break
+                else:
+                    lista[j] = indice
+                    j += 1
+                    if valoare[primul + n] == -1:
+                        while i < lungime:
+                            lista[j] = lista[i]
+                            j += 1
+                            i += 1
+                        del lista[j:]
+                        self.cap_propagare = len(urma)
+                        self.statistici.propagari_unitare += propagari
+                        return indice
+
+                    variabila = abs(primul)
+                    valoare[primul + n] = 1
+                    valoare[-primul + n] = -1
+                    nivel[variabila] = nivel_curent
+                    motiv[variabila] = indice
+                    urma.append(primul)
+                    propagari += 1
+
+            del lista[j:]
+
+        self.statistici.propagari_unitare += propagari
+        return None
+
+    def model(self):
+        """Intoarce atribuirea curenta; variabilele neatribuite primesc True."""
+        n = self.numar_variabile
+        valoare = self.valoare
+        return {variabila: valoare[variabila + n] != -1 for variabila in range(1, n + 1)}
 
 
 def simplifica_clauzele(clauze, atribuire):
@@ -373,65 +2396,6 @@ def simplifica_clauzele(clauze, atribuire):
     return clauze_simplificate, False
 
 
-def propaga_unitar(clauze, atribuire, statistici):
-    """Efectueaza propagarea unitara (Boolean Constraint Propagation - BCP)."""
-    while True:
-        literali_unitari_gasiti_iteratie = []
-
-        for clauza in clauze:
-            literal_neatribuit = None
-            numar_neatribuiti = 0
-            este_satisfacuta = False
-            este_falsificata = True
-
-            for literal in clauza:
-                variabila = abs(literal)
-                este_negat = literal < 0
-
-                if variabila in atribuire:
-                    valoare_atribuita = atribuire[variabila]
-                    if (not este_negat and valoare_atribuita is True) or \
-                            (este_negat and valoare_atribuita is False):
-                        este_satisfacuta = True
-                        break
-                else:
-                    numar_neatribuiti += 1
-                    literal_neatribuit = literal
-                    este_falsificata = False
-
-            if este_satisfacuta:
-                continue
-
-            if not este_falsificata and numar_neatribuiti == 1:
-                literali_unitari_gasiti_iteratie.append(literal_neatribuit)
-            elif este_falsificata and numar_neatribuiti == 0:
-                return [], True
-
-        if not literali_unitari_gasiti_iteratie:
-            break
-
-        atribuire_facuta_iteratie = False
-        for literal in literali_unitari_gasiti_iteratie:
-            variabila = abs(literal)
-            valoare = literal > 0
-
-            if variabila not in atribuire:
-                atribuire[variabila] = valoare
-                statistici.propagari_unitare += 1
-                atribuire_facuta_iteratie = True
-            elif atribuire[variabila] != valoare:
-                return [], True
-
-        if not atribuire_facuta_iteratie:
-            break
-
-        clauze, conflict = simplifica_clauzele(clauze, atribuire)
-        if conflict:
-            return clauze, True
-
-    return clauze, False
-
-
 def atribuie_literal_pur(clauze, atribuire, statistici):
     """Gaseste si atribuie literali puri (apar doar cu o singura polaritate)."""
     polaritate_literal = {}
@@ -474,105 +2438,598 @@ def atribuie_literal_pur(clauze, atribuire, statistici):
     return clauze, False
 
 
-def selecteaza_variabila_ramificare(atribuire, numar_variabile):
-    """Selecteaza urmatoarea variabila neatribuita pentru ramificare."""
-    for variabila in range(1, numar_variabile + 1):
-        if variabila not in atribuire:
-            return variabila
-    return None
-
-
-def dpll_recursiv(clauze, atribuire, numar_variabile, statistici, timp_start, timp_maxim):
-    """Functia recursiva a solver-ului DPLL."""
-    timp_curent = time.perf_counter()
-    if timp_curent - timp_start > timp_maxim:
-        raise TimeoutError("DPLL Timp depasit")
+# --- Euristici de ramificare ---
+class HeapVariabile:
+    """Max-heap binar indexat peste variabile, ordonat dupa o lista de scoruri partajata."""
+
+    def __init__(self, scoruri, numar_variabile):
+        self.scoruri = scoruri
+        self.heap = []
+        self.pozitie = [-1] * (numar_variabile + 1)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def contine(self, variabila):
+        return self.pozitie[variabila] >= 0
+
+    def insereaza(self, variabila):
+        self.pozitie[variabila] = len(self.heap)
+        self.heap.append(variabila)
+        self.urca(self.pozitie[variabila])
+
+    def extrage_max(self):
+        heap = self.heap
+        varf = heap[0]
+        ultima = heap.pop()
+        self.pozitie[varf] = -1
+        if heap:
+            heap[0] = ultima
+            self.pozitie[ultima] = 0
+            self.coboara(0)
+        return varf
+
+    def actualizeaza(self, variabila):
+        """Repozitioneaza variabila dupa ce scorul ei s-a schimbat (in orice sens)."""
+        if self.pozitie[variabila] >= 0:
+            self.urca(self.pozitie[variabila])
+            self.coboara(self.pozitie[variabila])
+
+    def urca(self, i):
+        heap, pozitie, scoruri = self.heap, self.pozitie, self.scoruri
+        variabila = heap[i]
+        scor = scoruri[variabila]
+        while i > 0:
+            parinte = (i - 1) >> 1
+            if scoruri[heap[parinte]] >= scor:
+                break
+            heap[i] = heap[parinte]
+            pozitie[heap[i]] = i
+            i = parinte
+        heap[i] = variabila
+        pozitie[variabila] = i
+
+    def coboara(self, i):
+        heap, pozitie, scoruri = self.heap, self.pozitie, self.scoruri
+        variabila = heap[i]
+        scor = scoruri[variabila]
+        lungime = len(heap)
+        while True:
+            copil = 2 * i + 1
+            if copil >= lungime:
+                break
+            if copil + 1 < lungime and scoruri[heap[copil + 1]] > scoruri[heap[copil]]:
+                copil += 1
+            if scoruri[heap[copil]] <= scor:
+                break
+            heap[i] = heap[copil]
+            pozitie[heap[i]] = i
+            i = copil
+        heap[i] = variabila
+        pozitie[variabila] = i
+
+
+class EuristicaRamificare:
+    """Interfata pentru euristicile de ramificare folosite de DPLL si CDCL.
+
+    selecteaza() intoarce literalul de decis (sau None cand toate variabilele sunt atribuite),
+    la_revenire() este apelata de motor inainte de a trunchia urma, iar la_conflict()
+    primeste variabilele implicate intr-un conflict. Euristicile care aleg doar variabila
+    iau polaritatea din motor.faza (True implicit, ultima valoare cu salvarea fazei activa).
+    """
+
+    nume = None
+
+    def __init__(self, motor):
+        self.motor = motor
+        self.numar_variabile = motor.numar_variabile
+
+    def selecteaza(self):
+        raise NotImplementedError
+
+    def la_revenire(self, inceput_urma):
+        pass
+
+    def la_conflict(self, variabile):
+        pass
+
+
+class EuristicaOrdine(EuristicaRamificare):
+    """Prima variabila neatribuita in ordinea indicilor (comportamentul original), cu cursor amortizat."""
+
+    nume = 'ordine'
+
+    def __init__(self, motor):
+        super().__init__(motor)
+        self.urmatoarea = 1
+
+    def selecteaza(self):
+        n = self.numar_variabile
+        valoare = self.motor.valoare
+        while self.urmatoarea <= n and valoare[self.urmatoarea + n] != 0:
+            self.urmatoarea += 1
+        if self.urmatoarea > n:
+            return None
+        return self.urmatoarea if self.motor.faza[self.urmatoarea] else -self.urmatoarea
+
+    def la_revenire(self, inceput_urma):
+        urma = self.motor.urma
+        for indice in range(inceput_urma, len(urma)):
+            variabila = abs(urma[indice])
+            if variabila < self.urmatoarea:
+                self.urmatoarea = variabila
+
+
+class EuristicaVsids(EuristicaRamificare):
+    """VSIDS: activitati crescute la conflict, cu decadere exponentiala, tinute intr-un heap."""
+
+    nume = 'vsids'
+
+    def __init__(self, motor, factor_decadere=0.95):
+        super().__init__(motor)
+        self.activitate = [0.0] * (self.numar_variabile + 1)
+        self.increment = 1.0
+        self.factor_decadere = factor_decadere
+        self.heap = HeapVariabile(self.activitate, self.numar_variabile)
+        for variabila in range(1, self.numar_variabile + 1):
+            self.heap.insereaza(variabila)
+
+    def selecteaza(self):
+        n = self.numar_variabile
+        valoare = self.motor.valoare
+        heap = self.heap
+        while len(heap):
+            variabila = heap.extrage_max()
+            if valoare[variabila + n] == 0:
+                return variabila if self.motor.faza[variabila] else -variabila
+        return None
 
-    clauze_dupa_bcp, conflict = propaga_unitar(clauze, atribuire, statistici)
-    if conflict:
+    def la_revenire(self, inceput_urma):
+        urma = self.motor.urma
+        heap = self.heap
+        for indice in range(inceput_urma, len(urma)):
+            variabila = abs(urma[indice])
+            if not heap.contine(variabila):
+                heap.insereaza(variabila)
+
+    def la_conflict(self, variabile):
+        activitate = self.activitate
+        for variabila in variabile:
+            activitate[variabila] += self.increment
+            if activitate[variabila] > 1e100:
+                for v in range(1, self.numar_variabile + 1):
+                    activitate[v] *= 1e-100
+                self.increment *= 1e-100
+            self.heap.actualizeaza(variabila)
+        self.increment /= self.factor_decadere
+
+
+class EuristicaNumarare(EuristicaRamificare):
+    """Baza pentru DLIS/MOMs: tine incremental, pe baza urmei motorului, starea clauzelor originale.
+
+    Atribuirile sunt aplicate lenes (la selectie) si anulate in la_revenire, astfel incat
+    propagarea nu plateste nimic in plus. Clauzele invatate nu sunt luate in calcul.
+    """
+
+    def __init__(self, motor):
+        super().__init__(motor)
+        n = self.numar_variabile
+        self.clauze = [tuple(c) for c in motor.clauze if c is not None]
+        self.aparitii = [[] for _ in range(2 * n + 1)]
+        for indice, clauza in enumerate(self.clauze):
+            for literal in clauza:
+                self.aparitii[literal + n].append(indice)
+        self.adevarati = [0] * len(self.clauze)
+        self.neatribuiti = [len(c) for c in self.clauze]
+        self.aplicat = 0
+
+    def sincronizeaza(self):
+        urma = self.motor.urma
+        while self.aplicat < len(urma):
+            self.aplica(urma[self.aplicat])
+            self.aplicat += 1
+
+    def la_revenire(self, inceput_urma):
+        urma = self.motor.urma
+        while self.aplicat > inceput_urma:
+            self.aplicat -= 1
+            self.anuleaza(urma[self.aplicat])
+
+    def aplica(self, literal):
+        n = self.numar_variabile
+        adevarati = self.adevarati
+        neatribuiti = self.neatribuiti
+        for indice in self.aparitii[literal + n]:
+            adevarati[indice] += 1
+            if adevarati[indice] == 1:
+                self.la_satisfacere(indice)
+        for indice in self.aparitii[-literal + n]:
+            neatribuiti[indice] -= 1
+            if adevarati[indice] == 0:
+                self.la_scurtare(indice, neatribuiti[indice] + 1)
+
+    def anuleaza(self, literal):
+        n = self.numar_variabile
+        adevarati = self.adevarati
+        neatribuiti = self.neatribuiti
+        for indice in self.aparitii[-literal + n]:
+            neatribuiti[indice] += 1
+            if adevarati[indice] == 0:
+                self.la_scurtare(indice, neatribuiti[indice] - 1)
+        for indice in self.aparitii[literal + n]:
+            adevarati[indice] -= 1
+            if adevarati[indice] == 0:
+                self.la_nesatisfacere(indice)
+
+    def la_satisfacere(self, indice):
+        pass
+
+    def la_nesatisfacere(self, indice):
+        pass
+
+    def la_scurtare(self, indice, dimensiune_veche):
+        pass
+
+
+class EuristicaDlis(EuristicaNumarare):
+    """DLIS: literalul care apare in cele mai multe clauze inca nesatisfacute."""
+
+    nume = 'dlis'
+
+    def __init__(self, motor):
+        super().__init__(motor)
+        n = self.numar_variabile
+        self.numar_aparitii = [len(lista) for lista in self.aparitii]
+        self.scor = [0] * (n + 1)
+        self.heap = HeapVariabile(self.scor, n)
+        for variabila in range(1, n + 1):
+            self.scor[variabila] = max(self.numar_aparitii[variabila + n], self.numar_aparitii[-variabila + n])
+            self.heap.insereaza(variabila)
+
+    def modifica_aparitii(self, indice, delta):
+        n = self.numar_variabile
+        numar_aparitii = self.numar_aparitii
+        for literal in self.clauze[indice]:
+            numar_aparitii[literal + n] += delta
+            variabila = abs(literal)
+            self.scor[variabila] = max(numar_aparitii[variabila + n], numar_aparitii[-variabila + n])
+            self.heap.actualizeaza(variabila)
+
+    def la_satisfacere(self, indice):
+        self.modifica_aparitii(indice, -1)
+
+    def la_nesatisfacere(self, indice):
+        self.modifica_aparitii(indice, 1)
+
+    def selecteaza(self):
+        self.sincronizeaza()
+        n = self.numar_variabile
+        valoare = self.motor.valoare
+        while len(self.heap):
+            variabila = self.heap.extrage_max()
+            if valoare[variabila + n] == 0:
+                if self.numar_aparitii[variabila + n] >= self.numar_aparitii[-variabila + n]:
+                    return variabila
+                return -variabila
         return None
 
-    clauze_simplificate = clauze_dupa_bcp
+    def la_revenire(self, inceput_urma):
+        super().la_revenire(inceput_urma)
+        urma = self.motor.urma
+        for indice in range(inceput_urma, len(urma)):
+            variabila = abs(urma[indice])
+            if not self.heap.contine(variabila):
+                self.heap.insereaza(variabila)
 
-    if not clauze_simplificate:
-        atribuire_finala = deepcopy(atribuire)
-        for variabila in range(1, numar_variabile + 1):
-            if variabila not in atribuire_finala:
-                atribuire_finala[variabila] = True
-        return atribuire_finala
 
-    if any(not c for c in clauze_simplificate):
+class EuristicaMoms(EuristicaNumarare):
+    """MOMs: aparitii maxime in clauzele nesatisfacute de dimensiune minima.
+
+    Clauzele nesatisfacute sunt tinute in galeti dupa numarul de literali neatribuiti,
+    actualizati incremental; la selectie se numara doar clauzele din galeata minima.
+    """
+
+    nume = 'moms'
+
+    def __init__(self, motor, k=10):
+        super().__init__(motor)
+        self.k = k
+        dimensiune_maxima = max((len(c) for c in self.clauze), default=0)
+        self.galeti = [set() for _ in range(dimensiune_maxima + 1)]
+        for indice, clauza in enumerate(self.clauze):
+            self.galeti[len(clauza)].add(indice)
+
+    def la_satisfacere(self, indice):
+        self.galeti[self.neatribuiti[indice]].discard(indice)
+
+    def la_nesatisfacere(self, indice):
+        self.galeti[self.neatribuiti[indice]].add(indice)
+
+    def la_scurtare(self, indice, dimensiune_veche):
+        self.galeti[dimensiune_veche].discard(indice)
+        self.galeti[self.neatribuiti[indice]].add(indice)
+
+    def selecteaza(self):
+        self.sincronizeaza()
+        n = self.numar_variabile
+        valoare = self.motor.valoare
+        for galeata in self.galeti[1:]:
+            if galeata:
+                break
+        else:
+            galeata = None
+
+        if galeata:
+            aparitii = {}
+            for indice in galeata:
+                for literal in self.clauze[indice]:
+                    if valoare[literal + n] == 0:
+                        aparitii[literal] = aparitii.get(literal, 0) + 1
+            cel_mai_bun, scor_maxim = None, -1
+            for literal, numar in aparitii.items():
+                opus = aparitii.get(-literal, 0)
+                scor = (numar + opus) * (1 << self.k) + numar * opus
+                if scor > scor_maxim:
+                    cel_mai_bun, scor_maxim = literal, scor
+            if cel_mai_bun is not None:
+                if aparitii.get(-cel_mai_bun, 0) > aparitii[cel_mai_bun]:
+                    return -cel_mai_bun
+                return cel_mai_bun
+
+        for variabila in range(1, n + 1):
+            if valoare[variabila + n] == 0:
+                return variabila
         return None
 
-    variabila_de_ramificat = selecteaza_variabila_ramificare(atribuire, numar_variabile)
 
-    if variabila_de_ramificat is None:
+EURISTICI_RAMIFICARE = {
+    'ordine': EuristicaOrdine,
+    'vsids': EuristicaVsids,
+    'dlis': EuristicaDlis,
+    'moms': EuristicaMoms,
+}
+
+
+def creeaza_euristica(nume, motor):
+    """Construieste euristica de ramificare ceruta si o inregistreaza la motor."""
+    if nume not in EURISTICI_RAMIFICARE:
+        raise ValueError(f"Euristica de ramificare necunoscuta: {nume} (disponibile: {', '.join(EURISTICI_RAMIFICARE)})")
+    euristica = EURISTICI_RAMIFICARE[nume](motor)
+    motor.euristica = euristica
+    return euristica
+
+
+# --- Politici de restart ---
+def luby(i):
+    """Al i-lea termen (de la 1) al secventei Luby: 1, 1, 2, 1, 1, 2, 4, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class PoliticaRestart:
+    """Decide, dupa fiecare conflict, daca cautarea trebuie reluata de la nivelul 0."""
+
+    nume = None
+
+    def la_conflict(self, lbd):
+        pass
+
+    def trebuie_restart(self):
+        raise NotImplementedError
+
+    def la_restart(self):
+        pass
+
+
+class RestartLuby(PoliticaRestart):
+    """Restart dupa unitate * luby(i) conflicte."""
+
+    nume = 'luby'
+
+    def __init__(self, unitate=100):
+        self.unitate = unitate
+        self.indice = 1
+        self.conflicte = 0
+
+    def la_conflict(self, lbd):
+        self.conflicte += 1
+
+    def trebuie_restart(self):
+        return self.conflicte >= self.unitate * luby(self.indice)
+
+    def la_restart(self):
+        self.indice += 1
+        self.conflicte = 0
+
+
+class RestartGeometric(PoliticaRestart):
+    """Restart dupa un numar de conflicte care creste geometric."""
+
+    nume = 'geometric'
+
+    def __init__(self, prim=100, factor=1.5):
+        self.limita = prim
+        self.factor = factor
+        self.conflicte = 0
+
+    def la_conflict(self, lbd):
+        self.conflicte += 1
+
+    def trebuie_restart(self):
+        return self.conflicte >= self.limita
+
+    def la_restart(self):
+        self.limita *= self.factor
+        self.conflicte = 0
+
+
+class RestartGlucose(PoliticaRestart):
+    """Restart in stil Glucose: media LBD recenta depaseste media globala."""
+
+    nume = 'glucose'
+
+    def __init__(self, fereastra=50, k=0.8):
+        self.fereastra = fereastra
+        self.k = k
+        self.recente = deque(maxlen=fereastra)
+        self.suma_recente = 0
+        self.suma_totala = 0
+        self.conflicte = 0
+
+    def la_conflict(self, lbd):
+        if len(self.recente) == self.fereastra:
+            self.suma_recente -= self.recente[0]
+        self.recente.append(lbd)
+        self.suma_recente += lbd
+        self.suma_totala += lbd
+        self.conflicte += 1
+
+    def trebuie_restart(self):
+        if len(self.recente) < self.fereastra:
+            return False
+        return self.suma_recente / self.fereastra * self.k > self.suma_totala / self.conflicte
+
+    def la_restart(self):
+        self.recente.clear()
+        self.suma_recente = 0
+
+
+POLITICI_RESTART = {
+    'luby': RestartLuby,
+    'geometric': RestartGeometric,
+    'glucose': RestartGlucose,
+}
+# In DPLL conflictele sunt pe clauze originale, cu LBD aproape constant, deci politica Glucose nu ar
+# declansa niciodata; raman doar politicile cu limite crescatoare, care pastreaza completitudinea
+RESTARTURI_DPLL = ('luby', 'geometric')
+
+
+def verifica_restart_dpll(nume):
+    if nume is not None and nume not in RESTARTURI_DPLL:
+        raise ValueError(f"Politica de restart {nume} nu este disponibila pentru DPLL "
+                         f"(disponibile: {', '.join(RESTARTURI_DPLL)})")
+
+
+def creeaza_politica_restart(nume):
+    """Construieste politica de restart ceruta (None inseamna fara restarturi)."""
+    if nume is None:
         return None
+    if nume not in POLITICI_RESTART:
+        raise ValueError(f"Politica de restart necunoscuta: {nume} (disponibile: {', '.join(POLITICI_RESTART)})")
+    return POLITICI_RESTART[nume]()
 
-    statistici.decizii += 1
 
-    copie_atribuire_adevarat = deepcopy(atribuire)
-    copie_atribuire_adevarat[variabila_de_ramificat] = True
-    copie_clauze_adevarat = deepcopy(clauze_simplificate)
-    rezultat = dpll_recursiv(copie_clauze_adevarat, copie_atribuire_adevarat, numar_variabile, statistici, timp_start,
-                             timp_maxim)
-    if rezultat is not None:
-        return rezultat
+def dpll_iterativ(motor, euristica, statistici, timp_start, timp_maxim, politica_restart=None, oprire=None,
+                  profil=None, guvernator=None):
+    """Solver-ul DPLL iterativ: stiva explicita de decizii, revenirea anuleaza urma motorului.
+
+    Cu o politica de restart, cautarea este reluata de la nivelul 0. Ramurile deja refutate nu
+    sunt memorate, deci completitudinea cere o limita de conflicte intre restarturi care creste
+    nemarginit: doar politicile din RESTARTURI_DPLL (Luby, geometrica) sunt acceptate.
+    Profilul (optional) masoara propagarea, revenirea si ramificarea si adancimea deciziilor.
+    Bugetele sunt verificate amortizat de guvernator (implicit doar timp_maxim si oprire).
+    """
+    stiva_decizii = []  # (literal decis, daca ramura opusa a fost deja incercata)
+    if guvernator is None:
+        guvernator = GuvernatorResurse(timp_maxim, oprire=oprire, inceput=timp_start)
 
-    statistici.reveniri += 1
+    while True:
+        guvernator.verifica()
+        if profil is not None:
+            acum = time.perf_counter()
+            if acum >= profil.urmatorul_instantaneu:
+                profil.progres(acum, decizii=statistici.decizii, propagari=statistici.propagari_unitare,
+                               reveniri=statistici.reveniri, restarturi=statistici.restarturi,
+                               nivel=len(stiva_decizii))
+
+        indice_conflict = motor.propaga()
+        if profil is not None:
+            acum = profil.adauga_timp('propagare', acum)
+        if indice_conflict is not None:
+            euristica.la_conflict([abs(literal) for literal in motor.clauze[indice_conflict]])
+            while stiva_decizii and stiva_decizii[-1][1]:
+                stiva_decizii.pop()
+            if not stiva_decizii:
+                return None
+
+            if politica_restart is not None:
+                nivel = motor.nivel
+                politica_restart.la_conflict(len({nivel[abs(l)] for l in motor.clauze[indice_conflict]}))
+                if politica_restart.trebuie_restart():
+                    politica_restart.la_restart()
+                    statistici.restarturi += 1
+                    motor.anuleaza_pana_la(0)
+                    stiva_decizii.clear()
+                    if profil is not None:
+                        profil.adauga_timp('restart', acum)
+                    continue
 
-    copie_atribuire_fals = deepcopy(atribuire)
-    copie_atribuire_fals[variabila_de_ramificat] = False
-    copie_clauze_fals = deepcopy(clauze_simplificate)
-    rezultat = dpll_recursiv(copie_clauze_fals, copie_atribuire_fals, numar_variabile, statistici, timp_start,
-                             timp_maxim)
+            literal, _ = stiva_decizii.pop()
+            statistici.reveniri += 1
+            motor.anuleaza_pana_la(len(stiva_decizii))
+            stiva_decizii.append((-literal, True))
+            motor.decide(-literal)
+            if profil is not None:
+                profil.adauga_timp('revenire', acum)
+            continue
 
-    return rezultat
+        literal_de_ramificat = euristica.selecteaza()
+        if literal_de_ramificat is None:
+            return motor.model()
+
+        statistici.decizii += 1
+        stiva_decizii.append((literal_de_ramificat, False))
+        motor.decide(literal_de_ramificat)
+        if profil is not None:
+            profil.adauga_timp('ramificare', acum)
+            profil.inregistreaza('adancime_decizie', len(stiva_decizii))
 
 
-def rezolva_dpll(clauze_intrare, numar_variabile, timp_maxim):
-    """Punctul principal de intrare pentru solver-ul DPLL."""
+def rezolva_dpll(clauze_intrare, numar_variabile, timp_maxim, euristica='ordine', restart=None,
+                 salvare_faza=False, oprire=None, profil=None,
+                 timp_cpu_maxim=None, memorie_maxima_mb=None):
+    """Punctul principal de intrare pentru solver-ul DPLL.
+
+    timp_cpu_maxim si memorie_maxima_mb (RSS) sunt bugete optionale, verificate de un GuvernatorResurse
+    impreuna cu timp_maxim si oprire; la depasire rularea se incheie cu statisticile partiale.
+    """
     timp_start = time.perf_counter()
+    guvernator = GuvernatorResurse(timp_maxim, timp_cpu_maxim, memorie_maxima_mb, oprire, timp_start)
     statistici_dpll = StatisticiDpll()
-    atribuire_initiala = {}
+    statistici_dpll.euristica = euristica
+    statistici_dpll.politica_restart = restart
+    verifica_restart_dpll(restart)
 
     if any(not c for c in clauze_intrare):
         print("DPLL: Formula initiala contine o clauza goala.")
         return "UNSAT", None, statistici_dpll.__dict__
 
-    clauze_curente = deepcopy(clauze_intrare)
-    clauze_dupa_bcp, conflict = propaga_unitar(clauze_curente, atribuire_initiala, statistici_dpll)
-    if conflict:
+    motor = MotorPropagare(clauze_intrare, numar_variabile, statistici_dpll)
+    motor.salvare_faza = salvare_faza
+    if motor.conflict_initial or motor.propaga() is not None:
         print("DPLL: Conflict detectat in timpul BCP initial.")
         return "UNSAT", None, statistici_dpll.__dict__
 
-    clauze_simplificate = clauze_dupa_bcp
-
-    if not clauze_simplificate:
-        print("DPLL: Formula satisfacuta dupa propagarea initiala.")
-        atribuire_finala = deepcopy(atribuire_initiala)
-        for variabila in range(1, numar_variabile + 1):
-            if variabila not in atribuire_finala:
-                atribuire_finala[variabila] = True
-        return "SAT", atribuire_finala, statistici_dpll.__dict__
-
     try:
-        atribuire_finala = dpll_recursiv(clauze_simplificate, atribuire_initiala, numar_variabile, statistici_dpll,
-                                         timp_start, timp_maxim)
+        atribuire_finala = dpll_iterativ(motor, creeaza_euristica(euristica, motor), statistici_dpll,
+                                         timp_start, timp_maxim, creeaza_politica_restart(restart), oprire,
+                                         profil, guvernator)
         if atribuire_finala is not None:
-            for variabila in range(1, numar_variabile + 1):
-                if variabila not in atribuire_finala:
-                    atribuire_finala[variabila] = True
             return "SAT", atribuire_finala, statistici_dpll.__dict__
         else:
             return "UNSAT", None, statistici_dpll.__dict__
-    except TimeoutError:
-        return "TIMP_DEPASIT", None, statistici_dpll.__dict__
-    except RecursionError:
-        print("\nEROARE: Adancimea maxima de recursivitate depasita in DPLL!")
-        print(f"Adancimea curenta a atribuirii: {len(atribuire_initiala)} variabile atribuite inainte de eroare.")
-        print("Sau problema ar putea fi prea complexa / implementarea necesita optimizare (DPLL iterativ).")
-        return "EROARE (Recursivitate)", None, statistici_dpll.__dict__
+    except (TimeoutError, RulareAnulata, MemorieEpuizata):
+        statistici_dpll.__dict__.update(guvernator.rezumat())
+        return guvernator.stare, None, statistici_dpll.__dict__
+    except MemoryError:
+        raise  # lasata apelantului (ex. rularea in lot cu limita de memorie)
     except Exception as e:
         print(f"\nA aparut o eroare neasteptata in DPLL: {e}")
         import traceback
@@ -580,6 +3037,1319 @@ def rezolva_dpll(clauze_intrare, numar_variabile, timp_maxim):
         return "EROARE (Exceptie)", None, statistici_dpll.__dict__
 
 
+# --- Algoritmul CDCL (Conflict-Driven Clause Learning) ---
+class StatisticiCdcl(StatisticiDpll):
+    """Statistici DPLL extinse cu invatarea clauzelor si salturile inapoi."""
+
+    def __init__(self):
+        super().__init__()
+        self.conflicte = 0
+        self.clauze_invatate = 0
+        self.clauze_sterse = 0
+        self.salturi_netriviale = 0  # Salturi peste mai mult de un nivel
+        self.lungime_maxima_salt = 0
+        self.lungime_medie_salt = 0.0
+
+
+def analizeaza_conflict(motor, indice_conflict):
+    """Analiza First-UIP: intoarce clauza invatata (literalul asertiv primul), nivelul de revenire si LBD-ul."""
+    nivel = motor.nivel
+    motiv = motor.motiv
+    urma = motor.urma
+    clauze = motor.clauze
+    nivel_curent = motor.nivel_decizie()
+
+    vazut = set()
+    implicate = []
+    invatata = [0]
+    de_rezolvat = 0
+    literal = None
+    indice_urma = len(urma) - 1
+    clauza = clauze[indice_conflict]
+
+    while True:
+        for q in (clauza if literal is None else clauza[1:]):
+            variabila = abs(q)
+            if variabila not in vazut and nivel[variabila] > 0:
+                vazut.add(variabila)
+                implicate.append(variabila)
+                if nivel[variabila] >= nivel_curent:
+                    de_rezolvat += 1
+                else:
+                    invatata.append(q)
+
+        while abs(urma[indice_urma]) not in vazut:
+            indice_urma -= 1
+        literal = urma[indice_urma]
+        indice_urma -= 1
+        vazut.discard(abs(literal))
+        de_rezolvat -= 1
+        if de_rezolvat == 0:
+            break
+        clauza = clauze[motiv[abs(literal)]]
+
+    invatata[0] = -literal
+
+    # Minimizare locala: un literal este redundant daca motivul lui contine doar literali deja in clauza
+    minimizata = [invatata[0]]
+    for q in invatata[1:]:
+        indice_motiv = motiv[abs(q)]
+        if indice_motiv is None or any(abs(r) not in vazut and nivel[abs(r)] > 0
+                                       for r in clauze[indice_motiv][1:]):
+            minimizata.append(q)
+
+    nivel_revenire = 0
+    if len(minimizata) > 1:
+        pozitie_max = max(range(1, len(minimizata)), key=lambda i: nivel[abs(minimizata[i])])
+        minimizata[1], minimizata[pozitie_max] = minimizata[pozitie_max], minimizata[1]
+        nivel_revenire = nivel[abs(minimizata[1])]
+
+    lbd = len({nivel[abs(q)] for q in minimizata})
+    return minimizata, nivel_revenire, lbd, implicate
+
+
+def analizeaza_asumptii(motor, literal_fals):
+    """Asumptiile (literali adevarati pe urma) care, impreuna cu literal_fals, nu pot fi satisfacute."""
+    nivel = motor.nivel
+    motiv = motor.motiv
+    nucleu = [literal_fals]
+    if nivel[abs(literal_fals)] == 0:
+        return nucleu
+    vazut = {abs(literal_fals)}
+    for literal in reversed(motor.urma[motor.limite_nivel[0]:]):
+        variabila = abs(literal)
+        if variabila not in vazut:
+            continue
+        if motiv[variabila] is None:
+            nucleu.append(literal)  # Sub nivelurile asumptiilor, singurele decizii sunt asumptiile
+        else:
+            for q in motor.clauze[motiv[variabila]][1:]:
+                if nivel[abs(q)] > 0:
+                    vazut.add(abs(q))
+    return nucleu
+
+
+def cautare_cdcl(motor, euristica, statistici, timp_start, timp_maxim, politica_restart=None, oprire=None,
+                 asumptii=(), profil=None, guvernator=None):
+    """Bucla CDCL: propagare, analiza conflictului, invatare si salt inapoi ne-cronologic.
+
+    Asumptiile sunt decise primele, cate una pe nivel (un nivel gol daca sunt deja adevarate);
+    daca una devine falsa, cautarea se opreste cu motor.nucleu = asumptiile responsabile.
+    Profilul (optional) masoara propagarea, analiza, reducerea si ramificarea, plus histogramele
+    adancimii deciziilor, lungimii si LBD-ului clauzelor invatate si lungimii salturilor.
+    Bugetele sunt verificate amortizat de guvernator (implicit doar timp_maxim si oprire).
+    """
+    interval_reducere = 2000
+    urmatoarea_reducere = statistici.conflicte + interval_reducere
+    suma_salturi = statistici.lungime_medie_salt * statistici.reveniri
+    n = motor.numar_variabile
+    motor.nucleu = None
+    if guvernator is None:
+        guvernator = GuvernatorResurse(timp_maxim, oprire=oprire, inceput=timp_start)
+
+    try:
+        while True:
+            guvernator.verifica()
+            if profil is not None:
+                acum = time.perf_counter()
+                if acum >= profil.urmatorul_instantaneu:
+                    profil.progres(acum, decizii=statistici.decizii, propagari=statistici.propagari_unitare,
+                                   conflicte=statistici.conflicte, restarturi=statistici.restarturi,
+                                   clauze_invatate=len(motor.invatate), nivel=motor.nivel_decizie())
+
+            indice_conflict = motor.propaga()
+            if profil is not None:
+                acum = profil.adauga_timp('propagare', acum)
+            if indice_conflict is not None:
+                statistici.conflicte += 1
+                nivel_curent = motor.nivel_decizie()
+                if nivel_curent == 0:
+                    return None
+
+                clauza_invatata, nivel_revenire, lbd, implicate = analizeaza_conflict(motor, indice_conflict)
+                euristica.la_conflict(implicate)
+                lungime_salt = nivel_curent - nivel_revenire
+                statistici.reveniri += 1
+                suma_salturi += lungime_salt
+                if lungime_salt > 1:
+                    statistici.salturi_netriviale += 1
+                statistici.lungime_maxima_salt = max(statistici.lungime_maxima_salt, lungime_salt)
+
+                motor.anuleaza_pana_la(nivel_revenire)
+                motor.adauga_clauza_invatata(clauza_invatata, lbd)
+                statistici.clauze_invatate += 1
+
+                if politica_restart is not None:
+                    politica_restart.la_conflict(lbd)
+                    if politica_restart.trebuie_restart():
+                        politica_restart.la_restart()
+                        statistici.restarturi += 1
+                        motor.anuleaza_pana_la(0)
+                if profil is not None:
+                    profil.adauga_timp('analiza', acum)
+                    profil.inregistreaza('lungime_invatata', len(clauza_invatata))
+                    profil.inregistreaza('lbd', lbd)
+                    profil.inregistreaza('lungime_salt', lungime_salt)
+                continue
+
+            if statistici.conflicte >= urmatoarea_reducere:
+                interval_reducere += 300
+                urmatoarea_reducere = statistici.conflicte + interval_reducere
+                statistici.clauze_sterse += motor.reduce_clauze_invatate()
+                if profil is not None:
+                    acum = profil.adauga_timp('reducere', acum)
+
+            literal_de_ramificat = None
+            while motor.nivel_decizie() < len(asumptii):
+                asumptie = asumptii[motor.nivel_decizie()]
+                valoare_asumptie = motor.valoare[asumptie + n]
+                if valoare_asumptie == 1:
+                    motor.limite_nivel.append(len(motor.urma))  # nivel gol, pastreaza corespondenta nivel-asumptie
+                elif valoare_asumptie == -1:
+                    motor.nucleu = analizeaza_asumptii(motor, asumptie)
+                    return None
+                else:
+                    literal_de_ramificat = asumptie
+                    break
+            if literal_de_ramificat is not None:
+                motor.decide(literal_de_ramificat)
+                continue
+
+            literal_de_ramificat = euristica.selecteaza()
+            if literal_de_ramificat is None:
+                return motor.model()
+
+            statistici.decizii += 1
+            motor.decide(literal_de_ramificat)
+            if profil is not None:
+                profil.adauga_timp('ramificare', acum)
+                profil.inregistreaza('adancime_decizie', motor.nivel_decizie())
+    finally:
+        if statistici.reveniri:
+            statistici.lungime_medie_salt = round(suma_salturi / statistici.reveniri, 3)
+
+
+def rezolva_cdcl(clauze_intrare, numar_variabile, timp_maxim, euristica='vsids', restart='luby',
+                 salvare_faza=True, oprire=None, profil=None,
+                 timp_cpu_maxim=None, memorie_maxima_mb=None):
+    """Punctul principal de intrare pentru solver-ul CDCL.
+
+    timp_cpu_maxim si memorie_maxima_mb (RSS) sunt bugete optionale, verificate de un GuvernatorResurse
+    impreuna cu timp_maxim si oprire; la depasire rularea se incheie cu statisticile partiale.
+    """
+    timp_start = time.perf_counter()
+    guvernator = GuvernatorResurse(timp_maxim, timp_cpu_maxim, memorie_maxima_mb, oprire, timp_start)
+    statistici_cdcl = StatisticiCdcl()
+    statistici_cdcl.euristica = euristica
+    statistici_cdcl.politica_restart = restart
+
+    if any(not c for c in clauze_intrare):
+        print("CDCL: Formula initiala contine o clauza goala.")
+        return "UNSAT", None, statistici_cdcl.__dict__
+
+    motor = MotorPropagare(clauze_intrare, numar_variabile, statistici_cdcl)
+    motor.salvare_faza = salvare_faza
+    if motor.conflict_initial or motor.propaga() is not None:
+        print("CDCL: Conflict detectat in timpul BCP initial.")
+        return "UNSAT", None, statistici_cdcl.__dict__
+
+    try:
+        atribuire_finala = cautare_cdcl(motor, creeaza_euristica(euristica, motor), statistici_cdcl,
+                                        timp_start, timp_maxim, creeaza_politica_restart(restart), oprire,
+                                        profil=profil, guvernator=guvernator)
+        if atribuire_finala is not None:
+            return "SAT", atribuire_finala, statistici_cdcl.__dict__
+        else:
+            return "UNSAT", None, statistici_cdcl.__dict__
+    except (TimeoutError, RulareAnulata, MemorieEpuizata):
+        statistici_cdcl.__dict__.update(guvernator.rezumat())
+        return guvernator.stare, None, statistici_cdcl.__dict__
+    except MemoryError:
+        raise  # lasata apelantului (ex. rularea in lot cu limita de memorie)
+    except Exception as e:
+        print(f"\nA aparut o eroare neasteptata in CDCL: {e}")
+        import traceback
+        traceback.print_exc()
+        return "EROARE (Exceptie)", None, statistici_cdcl.__dict__
+
+
+class SolverIncremental:
+    """Solver CDCL incremental: formula se incarca o singura data si se pot adauga clauze intre apeluri.
+
+    rezolva(asumptii) pastreaza intre apeluri clauzele invatate, activitatile, fazele si atribuirile
+    de la nivelul 0; asumptiile sunt decizii, deci clauzele invatate raman valabile fara ele.
+    Intoarce (stare, atribuire, nucleu): la UNSAT nucleu este submultimea asumptiilor care nu pot fi
+    satisfacute impreuna (lista goala daca formula insasi este nesatisfiabila).
+    """
+
+    def __init__(self, clauze=(), numar_variabile=0, euristica='vsids', restart='luby', salvare_faza=True):
+        self.statistici = StatisticiCdcl()
+        self.statistici.euristica = euristica
+        self.statistici.politica_restart = restart
+        self.nume_euristica = euristica
+        self.motor = MotorPropagare([], numar_variabile, self.statistici)
+        self.motor.salvare_faza = salvare_faza
+        self.euristica = creeaza_euristica(euristica, self.motor)
+        self.politica_restart = creeaza_politica_restart(restart)
+        self.euristica_invechita = False
+        self.nesatisfiabil = False
+        for clauza in clauze:
+            self.adauga_clauza(clauza)
+
+    def asigura_variabile(self, literali):
+        numar_necesar = max((abs(literal) for literal in literali), default=0)
+        if numar_necesar > self.motor.numar_variabile:
+            self.motor.anuleaza_pana_la(0)
+            self.motor.mareste(numar_necesar)
+            self.euristica_invechita = True
+
+    def adauga_clauza(self, clauza):
+        """Adauga o clauza permanenta (solverul revine la nivelul 0)."""
+        if self.nesatisfiabil:
+            return
+        self.motor.anuleaza_pana_la(0)
+        self.asigura_variabile(clauza)
+        self.motor.adauga_clauza(clauza)
+        if self.motor.conflict_initial:
+            self.nesatisfiabil = True
+        # Euristicile bazate pe numarare (DLIS/MOMs) isi construiesc contoarele din clauzele motorului
+        if isinstance(self.euristica, EuristicaNumarare):
+            self.euristica_invechita = True
+
+    def reconstruieste_euristica(self):
+        vechea = self.euristica
+        self.euristica = creeaza_euristica(self.nume_euristica, self.motor)
+        if isinstance(vechea, EuristicaVsids):
+            # Activitatile acumulate raman valabile pentru variabilele existente
+            self.euristica.activitate[:len(vechea.activitate)] = vechea.activitate
+            self.euristica.increment = vechea.increment
+            for variabila in range(1, len(vechea.activitate)):
+                self.euristica.heap.actualizeaza(variabila)
+        self.euristica_invechita = False
+
+    def rezolva(self, asumptii=(), timp_maxim=None):
+        """Rezolva formula curenta sub asumptiile date; intoarce (stare, atribuire, nucleu)."""
+        if self.nesatisfiabil:
+            return "UNSAT", None, []
+        motor = self.motor
+        motor.anuleaza_pana_la(0)
+        asumptii = list(asumptii)
+        self.asigura_variabile(asumptii)
+        if self.euristica_invechita:
+            self.reconstruieste_euristica()
+        if motor.propaga() is not None:
+            self.nesatisfiabil = True
+            return "UNSAT", None, []
+
+        timp_maxim = float('inf') if timp_maxim is None else timp_maxim
+        try:
+            atribuire = cautare_cdcl(motor, self.euristica, self.statistici, time.perf_counter(), timp_maxim,
+                                     self.politica_restart, asumptii=asumptii)
+        except TimeoutError:
+            return "TIMP_DEPASIT", None, None
+        if atribuire is not None:
+            return "SAT", atribuire, None
+        if motor.nucleu is None:  # conflict la nivelul 0: nesatisfiabila independent de asumptii
+            self.nesatisfiabil = True
+            return "UNSAT", None, []
+        return "UNSAT", None, motor.nucleu
+
+    # Denumiri in engleza pentru codul client care foloseste interfata obisnuita a solverelor incrementale
+    add_clause = adauga_clauza
+
+    def solve(self, assumptions=(), timp_maxim=None):
+        return self.rezolva(assumptions, timp_maxim)
+
+
+# --- Cautare locala stocastica (WalkSAT / probSAT) ---
+# Incompleta: gaseste repede modele pentru instante aleatoare satisfiabile, dar nu poate dovedi UNSAT.
+# Fiecare plimbare pastreaza pentru fiecare clauza numarul de literali adevarati si suma variabilelor
+# lor (cand clauza are un singur literal adevarat, suma este chiar variabila critica), iar pentru
+# fiecare variabila numerele break (clauze pe care le-ar strica) si make (clauze pe care le-ar repara).
+METODE_CAUTARE_LOCALA = ('probsat', 'walksat')
+
+
+def plimbare_locala(clauze, numar_variabile, samanta, termen, metoda='probsat', zgomot=0.567, cb=2.06,
+                    eps=0.9, oprire=None):
+    """O plimbare WalkSAT/probSAT pornita dintr-o atribuire aleatoare, pana la model, termen sau oprire.
+
+    Intoarce un dict cu atribuirea gasita (sau None), numarul de pasi si minimul de clauze nesatisfacute.
+    """
+    generator = random.Random(samanta)
+    n = numar_variabile
+    valoare = [False] + [generator.random() < 0.5 for _ in range(n)]
+    aparitii = [[] for _ in range(2 * n + 1)]  # indexat prin literal + n
+    for indice, clauza in enumerate(clauze):
+        for literal in clauza:
+            aparitii[literal + n].append(indice)
+
+    numar_adevarati = array('i', bytes(4 * len(clauze)))
+    suma_critica = array('q', bytes(8 * len(clauze)))
+    spargeri = array('i', bytes(4 * (n + 1)))
+    reparari = array('i', bytes(4 * (n + 1)))
+    nesatisfacute = array('i')  # multimea clauzelor nesatisfacute: vector + pozitii, inserare/stergere O(1)
+    pozitie = array('i', [-1]) * len(clauze)
+    for indice, clauza in enumerate(clauze):
+        for literal in clauza:
+            if valoare[abs(literal)] == (literal > 0):
+                numar_adevarati[indice] += 1
+                suma_critica[indice] += abs(literal)
+        if numar_adevarati[indice] == 1:
+            spargeri[suma_critica[indice]] += 1
+        elif numar_adevarati[indice] == 0:
+            pozitie[indice] = len(nesatisfacute)
+            nesatisfacute.append(indice)
+            for literal in clauza:
+                reparari[abs(literal)] += 1
+
+    # probSAT alege variabila cu probabilitate (eps + break)^-cb; valorile sunt tabelate
+    limita_tabel = max(map(len, aparitii), default=0) + 1
+    tabel = [(eps + spargere) ** -cb for spargere in range(limita_tabel)]
+    pasi = 0
+    minim_nesatisfacute = len(nesatisfacute)
+    while nesatisfacute:
+        if pasi & 1023 == 0:
+            if time.perf_counter() > termen or (oprire is not None and oprire.is_set()):
+                break
+        clauza = clauze[nesatisfacute[generator.randrange(len(nesatisfacute))]]
+        if metoda == 'probsat':
+            ponderi = [tabel[spargeri[abs(literal)]] for literal in clauza]
+            variabila = abs(generator.choices(clauza, ponderi)[0])
+        else:
+            # WalkSAT/SKC: un pas "liber" (break 0) are prioritate, altfel zgomot sau break minim
+            variabila = min((abs(literal) for literal in clauza),
+                            key=lambda v: (spargeri[v], -reparari[v]))
+            if spargeri[variabila] and generator.random() < zgomot:
+                variabila = abs(generator.choice(clauza))
+
+        valoare[variabila] = not valoare[variabila]
+        adevarat = variabila if valoare[variabila] else -variabila
+        for indice in aparitii[adevarat + n]:
+            numar_adevarati[indice] += 1
+            if numar_adevarati[indice] == 1:
+                ultima = nesatisfacute.pop()
+                if ultima != indice:
+                    nesatisfacute[pozitie[indice]] = ultima
+                    pozitie[ultima] = pozitie[indice]
+                pozitie[indice] = -1
+                for literal in clauze[indice]:
+                    reparari[abs(literal)] -= 1
+                spargeri[variabila] += 1
+            elif numar_adevarati[indice] == 2:
+                spargeri[suma_critica[indice]] -= 1
+            suma_critica[indice] += variabila
+        for indice in aparitii[n - adevarat]:
+            numar_adevarati[indice] -= 1
+            suma_critica[indice] -= variabila
+            if numar_adevarati[indice] == 0:
+                pozitie[indice] = len(nesatisfacute)
+                nesatisfacute.append(indice)
+                for literal in clauze[indice]:
+                    reparari[abs(literal)] += 1
+                spargeri[variabila] -= 1
+            elif numar_adevarati[indice] == 1:
+                spargeri[suma_critica[indice]] += 1
+        pasi += 1
+        if len(nesatisfacute) < minim_nesatisfacute:
+            minim_nesatisfacute = len(nesatisfacute)
+
+    atribuire = {v: valoare[v] for v in range(1, n + 1)} if not nesatisfacute else None
+    return {'samanta': samanta, 'atribuire': atribuire, 'pasi': pasi, 'minim_nesatisfacute': minim_nesatisfacute}
+
+
+_context_cautare_locala = None  # (clauze, numar_variabile, oprire) in procesele de lucru ale cautarii locale
+
+
+def initializeaza_proces_cautare_locala(clauze, numar_variabile, oprire):
+    """Formula si evenimentul de oprire ajung o singura data in fiecare proces, nu cu fiecare plimbare."""
+    global _context_cautare_locala
+    _context_cautare_locala = (clauze, numar_variabile, oprire)
+
+
+def ruleaza_plimbare_locala(samanta, termen_ramas, parametri):
+    clauze, numar_variabile, oprire = _context_cautare_locala
+    return plimbare_locala(clauze, numar_variabile, samanta, time.perf_counter() + termen_ramas,
+                           oprire=oprire, **parametri)
+
+
+def rezolva_cautare_locala(clauze_intrare, numar_variabile, timp_maxim, metoda='probsat', numar_plimbari=None,
+                           samanta=None, oprire=None, **parametri):
+    """Plimbari WalkSAT/probSAT independente (seminte diferite) rulate in paralel intr-un pool de procese.
+
+    Prima plimbare care gaseste un model opreste restul; modelul este verificat inainte de a fi intors.
+    Cu numar_plimbari=1 plimbarea ruleaza in procesul curent (ex. in portofoliu, unde procesele nu pot
+    avea copii). Intoarce "SAT", "NECUNOSCUT" (timp expirat) sau "ANULAT"; UNSAT doar pentru clauza goala.
+    """
+    timp_start = time.perf_counter()
+    if metoda not in METODE_CAUTARE_LOCALA:
+        raise ValueError(f"Metoda de cautare locala necunoscuta: {metoda}")
+    statistici = {'metoda': metoda, 'plimbari': 0, 'pasi': 0, 'minim_nesatisfacute': None,
+                  'samanta_castigatoare': None, 'pasi_pe_secunda': 0.0}
+    clauze = [tuple(set(clauza)) for clauza in clauze_intrare]  # literalii repetati ar strica variabila critica
+    if any(not clauza for clauza in clauze):
+        return "UNSAT", None, statistici
+    numar_variabile = max([numar_variabile] + [abs(literal) for clauza in clauze for literal in clauza])
+    numar_plimbari = numar_plimbari or os.cpu_count() or 1
+    samanta = random.randrange(1 << 30) if samanta is None else samanta
+    seminte = [samanta + i for i in range(numar_plimbari)]
+    termen = timp_start + timp_maxim
+    parametri['metoda'] = metoda
+
+    rezultate = []
+    if numar_plimbari == 1:
+        rezultate.append(plimbare_locala(clauze, numar_variabile, seminte[0], termen, oprire=oprire, **parametri))
+    else:
+        oprire_plimbari = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=numar_plimbari, initializer=initializeaza_proces_cautare_locala,
+                                 initargs=(clauze, numar_variabile, oprire_plimbari)) as executor:
+            viitoare = [executor.submit(ruleaza_plimbare_locala, s, termen - time.perf_counter(), parametri)
+                        for s in seminte]
+            ramase = set(viitoare)
+            while ramase:
+                for viitor in list(ramase):
+                    if viitor.done():
+                        ramase.discard(viitor)
+                        rezultate.append(viitor.result())
+                        if rezultate[-1]['atribuire'] is not None:
+                            oprire_plimbari.set()
+                if oprire is not None and oprire.is_set():
+                    oprire_plimbari.set()  # anularea din afara se transmite plimbarilor
+                if ramase:
+                    time.sleep(0.01)
+
+    durata = time.perf_counter() - timp_start
+    statistici['plimbari'] = len(rezultate)
+    statistici['pasi'] = sum(r['pasi'] for r in rezultate)
+    statistici['minim_nesatisfacute'] = min(r['minim_nesatisfacute'] for r in rezultate)
+    statistici['pasi_pe_secunda'] = round(statistici['pasi'] / durata, 1) if durata > 0 else 0.0
+    for rezultat in rezultate:
+        atribuire = rezultat['atribuire']
+        if atribuire is not None and all(any(atribuire[abs(literal)] == (literal > 0) for literal in clauza)
+                                         for clauza in clauze):
+            statistici['samanta_castigatoare'] = rezultat['samanta']
+            return "SAT", atribuire, statistici
+    if oprire is not None and oprire.is_set():
+        return "ANULAT", None, statistici
+    return "NECUNOSCUT", None, statistici
+
+
+# --- Cube-and-conquer (DPLL paralel pe cuburi) ---
+# Faza de lookahead imparte formula in cuburi (conjunctii de literali) care acopera impreuna tot spatiul de
+# cautare; fiecare cub este rezolvat independent de DPLL intr-un proces de lucru. Formula este UNSAT daca
+# toate cuburile sunt UNSAT si SAT de indata ce un cub are model.
+def alege_variabila_lookahead(motor, aparitii, candidati_maxim=64):
+    """Variabila de ramificare prin lookahead pe starea curenta a motorului (fara conflict).
+
+    Pentru cele mai frecvente candidati_maxim variabile libere se propaga ambele polaritati si se alege
+    variabila cu produsul maxim al numarului de implicatii (euristica march). Intoarce (literal, None)
+    pentru o ramificare, (None, literal_fortat) daca o polaritate da conflict (literal esuat),
+    (None, None) daca ambele dau conflict (cubul este refutat) si None daca nu mai exista variabile libere.
+    """
+    n = motor.numar_variabile
+    valoare = motor.valoare
+    libere = [variabila for variabila in range(1, n + 1) if valoare[variabila + n] == 0]
+    if not libere:
+        return None
+    if len(libere) > candidati_maxim:
+        libere.sort(key=lambda variabila: aparitii[variabila], reverse=True)
+        del libere[candidati_maxim:]
+
+    nivel = motor.nivel_decizie()
+    cel_mai_bun, scor_maxim = None, -1
+    for variabila in libere:
+        implicatii = []
+        for literal in (variabila, -variabila):
+            inceput = len(motor.urma)
+            motor.decide(literal)
+            conflict = motor.propaga()
+            implicatii.append(None if conflict is not None else len(motor.urma) - inceput)
+            motor.anuleaza_pana_la(nivel)
+        pozitive, negative = implicatii
+        if pozitive is None and negative is None:
+            return None, None
+        if pozitive is None or negative is None:
+            return None, -variabila if pozitive is None else variabila
+        scor = pozitive * negative + pozitive + negative
+        if scor > scor_maxim:
+            cel_mai_bun, scor_maxim = variabila, scor
+    return cel_mai_bun if motor.faza[cel_mai_bun] else -cel_mai_bun, None
+
+
+def aplica_cub(motor, cub):
+    """Decide literalii cubului cu propagare; intoarce False daca apare un conflict (motorul ramane la nivelul 0)."""
+    n = motor.numar_variabile
+    for literal in cub:
+        if motor.valoare[literal + n] == 1:
+            continue
+        if motor.valoare[literal + n] == -1:
+            motor.anuleaza_pana_la(0)
+            return False
+        motor.decide(literal)
+        if motor.propaga() is not None:
+            motor.anuleaza_pana_la(0)
+            return False
+    return True
+
+
+def genereaza_cuburi(clauze, numar_variabile, numar_cuburi, termen, candidati_maxim=64):
+    """Imparte formula in (cel mult aproximativ) numar_cuburi cuburi, in latime, prin lookahead.
+
+    Intoarce (cuburi, model, refutate): model este o atribuire completa daca lookahead-ul a gasit
+    deja una (cuburi este atunci gol), iar refutate numara cuburile eliminate prin conflict.
+    Lista de cuburi goala si model None inseamna ca formula este UNSAT.
+    """
+    motor = MotorPropagare(clauze, numar_variabile, StatisticiDpll())
+    if motor.conflict_initial or motor.propaga() is not None:
+        return [], None, 0
+    aparitii = [0] * (numar_variabile + 1)
+    for clauza in motor.clauze:
+        for literal in clauza:
+            aparitii[abs(literal)] += 1
+
+    de_impartit = deque([[]])
+    refutate = 0
+    while de_impartit and len(de_impartit) < numar_cuburi and time.perf_counter() < termen:
+        cub = de_impartit.popleft()
+        if not aplica_cub(motor, cub):
+            refutate += 1
+            continue
+        alegere = alege_variabila_lookahead(motor, aparitii, candidati_maxim)
+        if alegere is None:
+            return [], motor.model(), refutate
+        motor.anuleaza_pana_la(0)
+        literal, literal_fortat = alegere
+        if literal is not None:
+            de_impartit.append(cub + [literal])
+            de_impartit.append(cub + [-literal])
+        elif literal_fortat is not None:
+            de_impartit.appendleft(cub + [literal_fortat])
+        else:
+            refutate += 1
+    return list(de_impartit), None, refutate
+
+
+def initializeaza_proces_cuburi(clauze, numar_variabile, oprire, parametri):
+    """Formula, evenimentul de oprire si parametrii DPLL ajung o singura data in fiecare proces."""
+    global _context_cuburi
+    _context_cuburi = (clauze, numar_variabile, oprire, parametri)
+
+
+def rezolva_cub(cub, felie, termen):
+    """Rezolva formula restransa la cub cu DPLL, cel mult felie secunde.
+
+    termen este termenul global in time.monotonic() (vezi termen_intre_procese), deci cuburile care
+    au asteptat in coada nu il depasesc. Daca felia expira inainte de termen, cubul este impartit in
+    doua (prin lookahead) si rezultatul are stare 'IMPARTIT' si lista 'cuburi'; cuburile noi sunt puse
+    inapoi in coada comuna, de unde le iau procesele libere.
+    """
+    clauze, numar_variabile, oprire, parametri = _context_cuburi
+    timp_start = time.perf_counter()
+    timp_ramas = termen_local(termen) - timp_start
+    statistici = StatisticiDpll()
+    rezultat = {'cub': cub, 'stare': 'UNSAT', 'atribuire': None, 'cuburi': None, 'statistici': statistici.__dict__}
+    if timp_ramas <= 0:
+        rezultat['stare'] = 'TIMP_DEPASIT'
+        return rezultat
+    motor = MotorPropagare(clauze, numar_variabile, statistici)
+    motor.salvare_faza = parametri.get('salvare_faza', False)
+    for literal in cub:
+        motor.adauga_clauza([literal])
+    if motor.conflict_initial or motor.propaga() is not None:
+        return rezultat
+    try:
+        atribuire = dpll_iterativ(motor, creeaza_euristica(parametri.get('euristica', 'ordine'), motor), statistici,
+                                  timp_start, min(felie, timp_ramas), creeaza_politica_restart(parametri.get('restart')),
+                                  oprire)
+    except RulareAnulata:
+        rezultat['stare'] = 'ANULAT'
+        return rezultat
+    except TimeoutError:
+        if felie >= timp_ramas:
+            rezultat['stare'] = 'TIMP_DEPASIT'
+            return rezultat
+        motor.anuleaza_pana_la(0)
+        aparitii = [0] * (numar_variabile + 1)
+        for clauza in motor.clauze:
+            for literal in clauza:
+                aparitii[abs(literal)] += 1
+        alegere = alege_variabila_lookahead(motor, aparitii)
+        if alegere is None:
+            rezultat.update(stare='SAT', atribuire=motor.model())
+            return rezultat
+        literal, literal_fortat = alegere
+        if literal is not None:
+            rezultat.update(stare='IMPARTIT', cuburi=[cub + [literal], cub + [-literal]])
+        elif literal_fortat is not None:
+            rezultat.update(stare='IMPARTIT', cuburi=[cub + [literal_fortat]])
+        return rezultat
+    if atribuire is not None:
+        rezultat.update(stare='SAT', atribuire=atribuire)
+    return rezultat
+
+
+def rezolva_cub_si_cucerire(clauze_intrare, numar_variabile, timp_maxim, numar_procese=None, cuburi_per_proces=16,
+                            felie_initiala=2.0, euristica='ordine', restart=None, salvare_faza=False, oprire=None):
+    """Cube-and-conquer: lookahead in procesul curent, apoi cuburile sunt rezolvate de DPLL intr-un pool de procese.
+
+    Cuburile stau intr-o coada comuna din care fiecare proces liber ia urmatorul cub, deci incarcarea se
+    echilibreaza singura; un cub care nu se termina in felia lui este impartit in doua, iar bucatile sunt
+    preluate de procesele libere (felia se dubleaza la fiecare impartire, ca munca pierduta sa ramana
+    marginita). Primul model gasit opreste toate procesele. Cu numar_procese=1 cuburile se rezolva in
+    procesul curent (ex. in portofoliu sau in lot, unde procesele nu pot avea copii).
+    """
+    verifica_restart_dpll(restart)
+    timp_start = time.perf_counter()
+    numar_procese = numar_procese or os.cpu_count() or 1
+    statistici = {'procese': numar_procese, 'cuburi_initiale': 0, 'cuburi_refutate_lookahead': 0,
+                  'cuburi_rezolvate': 0, 'cuburi_impartite': 0, 'decizii': 0, 'propagari_unitare': 0,
+                  'reveniri': 0, 'timp_lookahead': 0.0, 'euristica': euristica}
+    if any(not c for c in clauze_intrare):
+        return "UNSAT", None, statistici
+    clauze = [list(c) for c in clauze_intrare]
+    numar_variabile = max([numar_variabile] + [abs(literal) for clauza in clauze for literal in clauza])
+    termen = timp_start + timp_maxim
+
+    cuburi, model, refutate = genereaza_cuburi(clauze, numar_variabile, numar_procese * cuburi_per_proces, termen)
+    statistici['timp_lookahead'] = round(time.perf_counter() - timp_start, 6)
+    statistici['cuburi_initiale'] = len(cuburi)
+    statistici['cuburi_refutate_lookahead'] = refutate
+    if model is not None:
+        return "SAT", model, statistici
+    if not cuburi:
+        return "UNSAT", None, statistici
+
+    parametri = {'euristica': euristica, 'restart': restart, 'salvare_faza': salvare_faza}
+    stare_finala = "UNSAT"
+    atribuire_finala = None
+
+    def inregistreaza(rezultat):
+        """Actualizeaza statisticile; intoarce cuburile de retrimis (sau None) si starea definitiva, daca exista."""
+        for camp in ('decizii', 'propagari_unitare', 'reveniri'):
+            statistici[camp] += rezultat['statistici'][camp]
+        if rezultat['stare'] == 'IMPARTIT':
+            statistici['cuburi_impartite'] += 1
+            return rezultat['cuburi'], None
+        statistici['cuburi_rezolvate'] += 1
+        if rezultat['stare'] == 'UNSAT':
+            return None, None
+        return None, rezultat['stare']
+
+    if numar_procese == 1:
+        initializeaza_proces_cuburi(clauze, numar_variabile, oprire, parametri)
+        coada_cuburi = deque((cub, felie_initiala) for cub in cuburi)
+        while coada_cuburi:
+            cub, felie = coada_cuburi.popleft()
+            rezultat = rezolva_cub(cub, felie, termen_intre_procese(termen))
+            noi, stare = inregistreaza(rezultat)
+            if noi:
+                coada_cuburi.extend((cub_nou, 2 * felie) for cub_nou in noi)
+            elif stare is not None:
+                stare_finala, atribuire_finala = stare, rezultat['atribuire']
+                break
+    else:
+        oprire_cuburi = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=numar_procese, initializer=initializeaza_proces_cuburi,
+                                 initargs=(clauze, numar_variabile, oprire_cuburi, parametri)) as executor:
+            ramase = {executor.submit(rezolva_cub, cub, felie_initiala, termen_intre_procese(termen)): felie_initiala
+                      for cub in cuburi}
+            while ramase and stare_finala == "UNSAT":
+                if oprire is not None and oprire.is_set():
+                    stare_finala = "ANULAT"
+                    break
+                terminate, _ = wait(ramase, timeout=0.05, return_when=FIRST_COMPLETED)
+                for viitor in terminate:
+                    felie = ramase.pop(viitor)
+                    rezultat = viitor.result()
+                    noi, stare = inregistreaza(rezultat)
+                    if noi:
+                        for cub_nou in noi:
+                            ramase[executor.submit(rezolva_cub, cub_nou, 2 * felie,
+                                                   termen_intre_procese(termen))] = 2 * felie
+                    elif stare is not None:
+                        stare_finala, atribuire_finala = stare, rezultat['atribuire']
+                        break
+            # Cuburile neincepute sunt anulate, iar cele in lucru se opresc la urmatoarea verificare
+            oprire_cuburi.set()
+            for viitor in ramase:
+                viitor.cancel()
+
+    if stare_finala == "SAT" and atribuire_finala is not None:
+        for variabila in range(1, numar_variabile + 1):
+            atribuire_finala.setdefault(variabila, True)
+    return stare_finala, atribuire_finala, statistici
+
+
+# --- Descompunere in componente conexe (subformule independente) ---
+# Doua clauze sunt in aceeasi componenta daca au (tranzitiv) o variabila comuna; componentele nu
+# impart variabile, deci formula este SAT exact cand fiecare componenta este SAT, iar modelul
+# formulei este reuniunea modelelor lor.
+SOLVERE_COMPONENTE = {
+    'DPLL': rezolva_dpll,
+    'CDCL': rezolva_cdcl,
+}
+
+
+def componente_conexe(clauze, numar_variabile):
+    """Imparte clauzele (nevide) in componente prin union-find pe variabile; cele mai mari primele."""
+    parinte = list(range(numar_variabile + 1))
+    dimensiune = [1] * (numar_variabile + 1)
+
+    def radacina(variabila):
+        while parinte[variabila] != variabila:
+            parinte[variabila] = parinte[parinte[variabila]]  # injumatatirea drumului
+            variabila = parinte[variabila]
+        return variabila
+
+    for clauza in clauze:
+        prima = radacina(abs(clauza[0]))
+        for literal in clauza[1:]:
+            alta = radacina(abs(literal))
+            if alta != prima:
+                if dimensiune[prima] < dimensiune[alta]:
+                    prima, alta = alta, prima
+                parinte[alta] = prima
+                dimensiune[prima] += dimensiune[alta]
+
+    grupuri = {}
+    for clauza in clauze:
+        grupuri.setdefault(radacina(abs(clauza[0])), []).append(clauza)
+    return sorted(grupuri.values(), key=len, reverse=True)
+
+
+def renumeroteaza_variabile(clauze):
+    """Renumeroteaza variabilele clauzelor 1..k; intoarce (clauze_noi, k, variabile_originale)."""
+    variabile_originale = [0] + sorted({abs(literal) for clauza in clauze for literal in clauza})
+    variabila_noua = {variabila: i for i, variabila in enumerate(variabile_originale)}
+    clauze_noi = [[variabila_noua[literal] if literal > 0 else -variabila_noua[-literal] for literal in clauza]
+                  for clauza in clauze]
+    return clauze_noi, len(variabile_originale) - 1, variabile_originale
+
+
+def propaga_si_descompune(clauze, numar_variabile):
+    """Propagare unitara la nivelul 0, apoi impartirea formulei ramase in componente.
+
+    Intoarce (fixate, componente), cu fixate dict variabila -> valoare, sau None la conflict.
+    """
+    motor = MotorPropagare(clauze, numar_variabile, StatisticiDpll())
+    if motor.conflict_initial or motor.propaga() is not None:
+        return None
+    n = numar_variabile
+    valoare = motor.valoare
+    ramase = [[literal for literal in clauza if valoare[literal + n] == 0]
+              for clauza in clauze if not any(valoare[literal + n] == 1 for literal in clauza)]
+    return {abs(literal): literal > 0 for literal in motor.urma}, componente_conexe(ramase, n)
+
+
+def rezolva_descompus(clauze, numar_variabile, termen, adancime, parametri, statistici, oprire=None):
+    """Propaga, imparte in componente si rezolva fiecare componenta separat (cele mici intai, esec rapid)."""
+    rezultat = propaga_si_descompune(clauze, numar_variabile)
+    if rezultat is None:
+        return "UNSAT", None
+    atribuire, componente = rezultat
+    if adancime > 0 and len(componente) > 1:
+        statistici['divizari_dinamice'] += 1
+    for componenta in reversed(componente):
+        if oprire is not None and oprire.is_set():
+            return "ANULAT", None
+        clauze_componenta, k, variabile_originale = renumeroteaza_variabile(componenta)
+        stare, atribuire_componenta = ramifica_componenta(clauze_componenta, k, termen, adancime, parametri,
+                                                          statistici, oprire)
+        if stare != "SAT":
+            return stare, None
+        for variabila, valoare in atribuire_componenta.items():
+            atribuire[variabile_originale[variabila]] = valoare
+    for variabila in range(1, numar_variabile + 1):
+        atribuire.setdefault(variabila, True)
+    return "SAT", atribuire
+
+
+def ramifica_componenta(clauze, numar_variabile, termen, adancime, parametri, statistici, oprire=None):
+    """Rezolva o componenta conexa (variabile 1..k).
+
+    In primele adancime_divizare niveluri se ramifica pe variabila cea mai frecventa si fiecare ramura
+    este propagata si descompusa din nou (o decizie poate rupe componenta in bucati independente);
+    mai jos, sau pentru componente mici, componenta este data solverului ales.
+    """
+    timp_ramas = termen - time.perf_counter()
+    if timp_ramas <= 0:
+        return "TIMP_DEPASIT", None
+    if adancime >= parametri['adancime_divizare'] or len(clauze) < parametri['prag_ramificare']:
+        statistici['frunze'] += 1
+        stare, atribuire, statistici_solver = SOLVERE_COMPONENTE[parametri['solver']](
+            clauze, numar_variabile, timp_ramas, oprire=oprire, **parametri['optiuni_solver'])
+        statistici['decizii'] += statistici_solver.get('decizii', 0)
+        return stare, atribuire
+
+    statistici['ramificari'] += 1
+    aparitii = [0] * (2 * numar_variabile + 1)
+    for clauza in clauze:
+        for literal in clauza:
+            aparitii[literal + numar_variabile] += 1
+    variabila = max(range(1, numar_variabile + 1),
+                    key=lambda v: aparitii[v + numar_variabile] + aparitii[-v + numar_variabile])
+    literal = variabila if aparitii[variabila + numar_variabile] >= aparitii[-variabila + numar_variabile] \
+        else -variabila
+    for ramura in (literal, -literal):
+        stare, atribuire = rezolva_descompus(clauze + [[ramura]], numar_variabile, termen, adancime + 1, parametri,
+                                             statistici, oprire)
+        if stare != "UNSAT":
+            return stare, atribuire
+    return "UNSAT", None
+
+
+def initializeaza_proces_componente(oprire):
+    """Evenimentul de oprire ajunge in procese la pornire (nu poate fi trimis ca argument al unei sarcini)."""
+    global _oprire_componente
+    _oprire_componente = oprire
+
+
+def rezolva_componenta_proces(clauze, numar_variabile, termen, parametri):
+    """Corpul unei sarcini din pool: o componenta de nivel superior, cu statisticile ei.
+
+    termen este in time.monotonic() (vezi termen_intre_procese), valabil si dupa asteptarea in coada.
+    """
+    statistici = dict.fromkeys(('divizari_dinamice', 'ramificari', 'frunze', 'decizii'), 0)
+    stare, atribuire = ramifica_componenta(clauze, numar_variabile, termen_local(termen), 0,
+                                           parametri, statistici, _oprire_componente)
+    return stare, atribuire, statistici
+
+
+def rezolva_pe_componente(clauze_intrare, numar_variabile, timp_maxim, solver='DPLL', numar_procese=None,
+                          prag_paralel=2000, adancime_divizare=4, prag_ramificare=200, oprire=None,
+                          **optiuni_solver):
+    """Rezolva formula pe componente conexe, fiecare cu solverul ales ('DPLL' sau 'CDCL').
+
+    Dupa propagarea unitatilor, formula ramasa este impartita prin union-find; componentele sunt
+    rezolvate in paralel (ProcessPoolExecutor) cand exista cel putin doua si toate in afara celei mai
+    mari au impreuna cel putin prag_paralel clauze, altfel in procesul curent. Primul UNSAT opreste
+    restul. Modelele componentelor sunt reunite intr-o atribuire a formulei intregi.
+    """
+    timp_start = time.perf_counter()
+    if solver not in SOLVERE_COMPONENTE:
+        raise ValueError(f"Solver necunoscut pentru componente: {solver} (disponibile: {', '.join(SOLVERE_COMPONENTE)})")
+    statistici = {'solver': solver, 'componente': 0, 'clauze_componenta_maxima': 0, 'paralel': False,
+                  'divizari_dinamice': 0, 'ramificari': 0, 'frunze': 0, 'decizii': 0}
+    if any(not c for c in clauze_intrare):
+        return "UNSAT", None, statistici
+    clauze = [list(c) for c in clauze_intrare]
+    numar_variabile = max([numar_variabile] + [abs(literal) for clauza in clauze for literal in clauza])
+    termen = timp_start + timp_maxim
+    parametri = {'solver': solver, 'adancime_divizare': adancime_divizare, 'prag_ramificare': prag_ramificare,
+                 'optiuni_solver': optiuni_solver}
+
+    rezultat = propaga_si_descompune(clauze, numar_variabile)
+    if rezultat is None:
+        return "UNSAT", None, statistici
+    atribuire, componente = rezultat
+    statistici['componente'] = len(componente)
+    statistici['clauze_componenta_maxima'] = len(componente[0]) if componente else 0
+    numar_procese = min(numar_procese or os.cpu_count() or 1, len(componente))
+    sarcini = [renumeroteaza_variabile(componenta) for componenta in componente]
+
+    stare = "SAT"
+    if numar_procese > 1 and sum(len(componenta) for componenta in componente[1:]) >= prag_paralel:
+        statistici['paralel'] = True
+        oprire_componente = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=numar_procese, initializer=initializeaza_proces_componente,
+                                 initargs=(oprire_componente,)) as executor:
+            viitoare = {executor.submit(rezolva_componenta_proces, clauze_componenta, k,
+                                        termen_intre_procese(termen), parametri): variabile_originale
+                        for clauze_componenta, k, variabile_originale in sarcini}
+            ramase = set(viitoare)
+            while ramase and stare == "SAT":
+                if oprire is not None and oprire.is_set():
+                    stare = "ANULAT"
+                    break
+                terminate, ramase = wait(ramase, timeout=0.05, return_when=FIRST_COMPLETED)
+                for viitor in terminate:
+                    stare_componenta, atribuire_componenta, statistici_componenta = viitor.result()
+                    for camp, valoare in statistici_componenta.items():
+                        statistici[camp] += valoare
+                    if stare_componenta != "SAT":
+                        stare = stare_componenta
+                        break
+                    for variabila, valoare in atribuire_componenta.items():
+                        atribuire[viitoare[viitor][variabila]] = valoare
+            oprire_componente.set()  # componentele in lucru se opresc, cele neincepute sunt anulate
+            for viitor in ramase:
+                viitor.cancel()
+    else:
+        for clauze_componenta, k, variabile_originale in reversed(sarcini):
+            stare, atribuire_componenta = ramifica_componenta(clauze_componenta, k, termen, 0, parametri,
+                                                              statistici, oprire)
+            if stare != "SAT":
+                break
+            for variabila, valoare in atribuire_componenta.items():
+                atribuire[variabile_originale[variabila]] = valoare
+
+    if stare != "SAT":
+        return stare, None, statistici
+    for variabila in range(1, numar_variabile + 1):
+        atribuire.setdefault(variabila, True)
+    return "SAT", atribuire, statistici
+
+
+# --- Evaluare vectorizata (NumPy, optional) ---
+# Formula devine o matrice int32 m x k completata cu 0 (la 3-SAT uniform nu exista completare),
+# iar atribuirea un vector int8 indexat prin literal + n: 1 adevarat, -1 fals, 0 neatribuit.
+# Pozitia n (literalul 0, adica completarea) este mereu -1, deci nu satisface si nu e libera.
+prag_vectorizare = 100000  # De la cate clauze merita costul conversiei la NumPy
+
+
+def matrice_clauze(clauze):
+    """Matricea int32 completata cu 0 a unei formule (ArenaClauze sau colectie de clauze)."""
+    if isinstance(clauze, ArenaClauze):
+        literali = np.frombuffer(clauze.literali, dtype=np.int32) if len(clauze.literali) \
+            else np.zeros(0, dtype=np.int32)
+        lungimi = np.diff(np.frombuffer(clauze.inceputuri, dtype=np.int64))
+    else:
+        if not isinstance(clauze, list):
+            clauze = list(clauze)
+        lungimi = np.fromiter(map(len, clauze), dtype=np.int64, count=len(clauze))
+        literali = np.fromiter(chain.from_iterable(clauze), dtype=np.int32, count=int(lungimi.sum()))
+    numar_clauze = len(lungimi)
+    latime = int(lungimi.max()) if numar_clauze else 0
+    if numar_clauze and np.all(lungimi == latime):
+        return literali.reshape(numar_clauze, latime)
+    matrice = np.zeros((numar_clauze, latime), dtype=np.int32)
+    randuri = np.repeat(np.arange(numar_clauze), lungimi)
+    inceputuri = np.cumsum(lungimi) - lungimi
+    coloane = np.arange(len(literali)) - np.repeat(inceputuri, lungimi)
+    matrice[randuri, coloane] = literali
+    return matrice
+
+
+def valori_literali(atribuire, numar_variabile):
+    """Vectorul de valori indexat prin literal + n pentru o atribuire {variabila: bool}."""
+    valori = np.zeros(2 * numar_variabile + 1, dtype=np.int8)
+    if atribuire:
+        variabile = np.fromiter(atribuire.keys(), dtype=np.int64, count=len(atribuire))
+        semne = np.where(np.fromiter(atribuire.values(), dtype=bool, count=len(atribuire)), 1, -1)
+        valori[variabile + numar_variabile] = semne
+        valori[numar_variabile - variabile] = -semne
+    valori[numar_variabile] = -1
+    return valori
+
+
+def stare_clauze(matrice, valori, numar_variabile):
+    """Mastile (satisfacute, unitare, in_conflict) ale clauzelor, calculate pe toata matricea."""
+    valori_matrice = valori[matrice + numar_variabile]
+    satisfacute = (valori_matrice == 1).any(axis=1)
+    libere = (valori_matrice == 0).sum(axis=1)
+    nesatisfacute = ~satisfacute
+    return satisfacute, nesatisfacute & (libere == 1), nesatisfacute & (libere == 0)
+
+
+def propaga_unitar_vectorizat(matrice, valori, numar_variabile):
+    """Propagare unitara la nivelul 0 pe matrice; toate unitatile unei runde se atribuie deodata.
+
+    Modifica valori pe loc si intoarce (matrice_redusa, unitati): clauzele satisfacute sunt scoase,
+    literalii falsi devin 0. La conflict matrice_redusa este None.
+    """
+    n = numar_variabile
+    unitati = []
+    while True:
+        satisfacute, unitare, in_conflict = stare_clauze(matrice, valori, n)
+        if in_conflict.any():
+            return None, unitati
+        if satisfacute.any():
+            # Clauzele satisfacute raman satisfacute; rundele urmatoare lucreaza doar pe rest
+            pastrate = ~satisfacute
+            matrice, unitare = matrice[pastrate], unitare[pastrate]
+        if not unitare.any():
+            break
+        randuri = matrice[unitare]
+        coloane = (valori[randuri + n] == 0).argmax(axis=1)
+        literali = np.unique(randuri[np.arange(len(randuri)), coloane])
+        if np.isin(-literali, literali).any():
+            return None, unitati
+        valori[literali + n] = 1
+        valori[n - literali] = -1
+        unitati.extend(literali.tolist())
+    return np.where(valori[matrice + n] == -1, 0, matrice), unitati
+
+
+def verifica_vectorizat(clauze, atribuire):
+    """True daca atribuirea satisface toate clauzele si atinge toate variabilele lor, altfel False."""
+    matrice = matrice_clauze(clauze)
+    if not matrice.size:
+        return not len(matrice)
+    numar_variabile = max(int(np.abs(matrice).max()), max(atribuire, default=0))
+    valori_matrice = valori_literali(atribuire, numar_variabile)[matrice + numar_variabile]
+    return bool((valori_matrice == 1).any(axis=1).all() and not (valori_matrice == 0).any())
+
+
+# --- Preprocesare (simplificarea formulei inaintea solverelor) ---
+def sondeaza_literali_esuati(motor, candidati, limita_propagari):
+    """Failed-literal probing: un literal a carui propagare duce la conflict este fixat la opusul lui.
+
+    Lucreaza pe un MotorPropagare aflat la nivelul 0; intoarce numarul de literali esuati gasiti
+    sau None daca formula s-a dovedit nesatisfiabila.
+    """
+    n = motor.numar_variabile
+    statistici = motor.statistici
+    limita = statistici.propagari_unitare + limita_propagari
+    esuati = 0
+    for literal in candidati:
+        if statistici.propagari_unitare > limita:
+            break
+        if motor.valoare[literal + n] != 0:
+            continue
+        motor.decide(literal)
+        conflict = motor.propaga()
+        motor.anuleaza_pana_la(0)
+        if conflict is not None:
+            esuati += 1
+            motor.atribuie(-literal, None)
+            if motor.propaga() is not None:
+                return None
+    return esuati
+
+
+def componente_tare_conexe(graf):
+    """Componentele tare conexe (Tarjan iterativ) ale unui graf dat ca dict nod -> lista de succesori."""
+    index, minim, pe_stiva = {}, {}, set()
+    stiva, componente = [], []
+    contor = 0
+    for radacina in graf:
+        if radacina in index:
+            continue
+        index[radacina] = minim[radacina] = contor
+        contor += 1
+        stiva.append(radacina)
+        pe_stiva.add(radacina)
+        drum = [(radacina, iter(graf[radacina]))]
+        while drum:
+            nod, succesori = drum[-1]
+            for urmator in succesori:
+                if urmator not in index:
+                    index[urmator] = minim[urmator] = contor
+                    contor += 1
+                    stiva.append(urmator)
+                    pe_stiva.add(urmator)
+                    drum.append((urmator, iter(graf.get(urmator, ()))))
+                    break
+                if urmator in pe_stiva:
+                    minim[nod] = min(minim[nod], index[urmator])
+            else:
+                drum.pop()
+                if drum:
+                    parinte = drum[-1][0]
+                    minim[parinte] = min(minim[parinte], minim[nod])
+                if minim[nod] == index[nod]:
+                    componenta = []
+                    while True:
+                        membru = stiva.pop()
+                        pe_stiva.discard(membru)
+                        componenta.append(membru)
+                        if membru == nod:
+                            break
+                    componente.append(componenta)
+    return componente
+
+
+def substituie_literali_echivalenti(clauze, stiva):
+    """Inlocuieste literalii echivalenti (aceeasi componenta in graful implicatiilor binare) cu un reprezentant.
+
+    Intoarce (clauze_noi, numar_variabile_substituite) sau (None, 0) daca un literal este
+    echivalent cu negatia lui (formula nesatisfiabila).
+    """
+    graf = {}
+    for clauza in clauze:
+        if len(clauza) == 2:
+            a, b = clauza
+            graf.setdefault(-a, []).append(b)
+            graf.setdefault(-b, []).append(a)
+            graf.setdefault(a, [])
+            graf.setdefault(b, [])
+
+    reprezentant = {}
+    for componenta in componente_tare_conexe(graf):
+        if len(componenta) < 2:
+            continue
+        membri = set(componenta)
+        if any(-literal in membri for literal in membri):
+            return None, 0
+        # Minimul dupa variabila alege si in componenta complementara negatia aceluiasi reprezentant
+        ales = min(componenta, key=abs)
+        for literal in componenta:
+            if literal != ales:
+                reprezentant[literal] = ales
+
+    if not reprezentant:
+        return clauze, 0
+    substituite = 0
+    for literal, ales in reprezentant.items():
+        if literal > 0:
+            substituite += 1
+            stiva.adauga_clauza(literal, (literal, -ales))
+            stiva.adauga_clauza(-literal, (-literal, ales))
+
+    clauze_noi = set()
+    for clauza in clauze:
+        set_clauza = {reprezentant.get(literal, literal) for literal in clauza}
+        if not any(-literal in set_clauza for literal in set_clauza):
+            clauze_noi.add(tuple(sorted(set_clauza)))
+    return clauze_noi, substituite
+
+
+def elimina_clauze_blocate(clauze, stiva, limita_verificari):
+    """Blocked clause elimination: scoate clauzele C cu un literal l pentru care orice rezolvent pe l e tautologie.
+
+    Clauzele scoase intra pe stiva cu martorul l. Intoarce (clauze_ramase, numar_eliminate).
+    """
+    lista = list(clauze)
+    aparitii = {}
+    for indice, clauza in enumerate(lista):
+        for literal in clauza:
+            aparitii.setdefault(literal, set()).add(indice)
+
+    vii = set(range(len(lista)))
+    coada = deque(range(len(lista)))
+    in_coada = set(vii)
+    verificari = eliminate = 0
+    while coada and verificari < limita_verificari:
+        indice = coada.popleft()
+        in_coada.discard(indice)
+        if indice not in vii:
+            continue
+        clauza = lista[indice]
+        set_clauza = set(clauza)
+        for literal in clauza:
+            blocata = True
+            for alt_indice in aparitii.get(-literal, ()):
+                verificari += 1
+                if not any(-x in set_clauza for x in lista[alt_indice] if x != -literal):
+                    blocata = False
+                    break
+            if not blocata:
+                continue
+
+            vii.discard(indice)
+            eliminate += 1
+            stiva.adauga_clauza(literal, clauza)
+            for x in clauza:
+                aparitii[x].discard(indice)
+            # Clauzele cu -x (x din clauza scoasa) pot deveni blocate pe -x
+            for x in clauza:
+                for alt_indice in aparitii.get(-x, ()):
+                    if alt_indice not in in_coada:
+                        in_coada.add(alt_indice)
+                        coada.append(alt_indice)
+            break
+
+    return [lista[indice] for indice in sorted(vii)], eliminate
+
+
+def preproceseaza(clauze_intrare, numar_variabile, sondare=True, echivalente=True, clauze_blocate=True,
+                  limita_propagari=2000000, limita_verificari=2000000):
+    """Simplifica formula inaintea solverelor si intoarce (clauze_reduse, numar_variabile_redus, stiva, statistici).
+
+    Pasi: literali si clauze duplicate, tautologii, unitati propagate la nivelul 0, literali esuati,
+    substitutia literalilor echivalenti (componente tare conexe) si eliminarea clauzelor blocate.
+    Variabilele ramase sunt renumerotate 1..k; stiva.extinde_model traduce un model al formulei
+    reduse intr-unul al formulei originale. Daca preprocesarea gaseste UNSAT, formula redusa este [[]].
+    """
+    timp_start = time.perf_counter()
+    statistici = {'clauze_initiale': len(clauze_intrare), 'variabile_initiale': numar_variabile,
+                  'literali_initiali': sum(len(c) for c in clauze_intrare), 'literali_duplicati': 0,
+                  'clauze_duplicate': 0, 'tautologii': 0, 'unitati': 0, 'literali_esuati': 0,
+                  'variabile_echivalente': 0, 'clauze_blocate': 0}
+    stiva = StivaReconstructie()
+    stiva.numar_variabile_original = numar_variabile
+
+    def incheie(clauze_reduse, numar_variabile_redus):
+        statistici['clauze_finale'] = len(clauze_reduse)
+        statistici['variabile_finale'] = numar_variabile_redus
+        statistici['literali_finali'] = sum(len(c) for c in clauze_reduse)
+        for cheie, initial, final in (('clauze', 'clauze_initiale', 'clauze_finale'),
+                                      ('variabile', 'variabile_initiale', 'variabile_finale'),
+                                      ('literali', 'literali_initiali', 'literali_finali')):
+            statistici[f'reducere_{cheie}'] = round(1 - statistici[final] / statistici[initial], 4) \
+                if statistici[initial] else 0.0
+        statistici['timp'] = time.perf_counter() - timp_start
+        return clauze_reduse, numar_variabile_redus, stiva, statistici
+
+    clauze = set()
+    for c in clauze_intrare:
+        set_clauza = set(c)
+        if set_clauza:
+            numar_variabile = max(numar_variabile, max(map(abs, set_clauza)))
+        statistici['literali_duplicati'] += len(c) - len(set_clauza)
+        if any(-literal in set_clauza for literal in set_clauza):
+            statistici['tautologii'] += 1
+            continue
+        tuplu = tuple(sorted(set_clauza))
+        if tuplu in clauze:
+            statistici['clauze_duplicate'] += 1
+        clauze.add(tuplu)
+    if () in clauze:
+        statistici['rezultat'] = 'UNSAT'
+        return incheie([[]], 0)
+
+    while True:
+        if np is not None and len(clauze) >= prag_vectorizare and any(len(clauza) == 1 for clauza in clauze):
+            # Formula mare cu unitati: propagarea pe matrice evita construirea listelor de supraveghere
+            n = numar_variabile
+            valori = valori_literali(None, n)
+            matrice, unitati = propaga_unitar_vectorizat(matrice_clauze(clauze), valori, n)
+            if matrice is None:
+                statistici['rezultat'] = 'UNSAT'
+                return incheie([[]], 0)
+            stiva.fixate.extend(unitati)
+            statistici['unitati'] += len(unitati)
+            if unitati:
+                clauze = {tuple(literal for literal in rand if literal) for rand in matrice.tolist()}
+        motor = MotorPropagare(clauze, numar_variabile, StatisticiDpll())
+        if motor.conflict_initial or motor.propaga() is not None:
+            statistici['rezultat'] = 'UNSAT'
+            return incheie([[]], 0)
+        if sondare:
+            candidati = sorted({-literal for clauza in clauze if len(clauza) == 2 for literal in clauza})
+            esuati = sondeaza_literali_esuati(motor, candidati, limita_propagari)
+            if esuati is None:
+                statistici['rezultat'] = 'UNSAT'
+                return incheie([[]], 0)
+            statistici['literali_esuati'] += esuati
+
+        n = numar_variabile
+        valoare = motor.valoare
+        stiva.fixate.extend(motor.urma)
+        statistici['unitati'] += len(motor.urma)
+        clauze = {tuple(literal for literal in clauza if valoare[literal + n] == 0)
+                  for clauza in clauze if not any(valoare[literal + n] == 1 for literal in clauza)}
+
+        substituite = 0
+        if echivalente:
+            clauze, substituite = substituie_literali_echivalenti(clauze, stiva)
+            if clauze is None:
+                statistici['rezultat'] = 'UNSAT'
+                return incheie([[]], 0)
+            statistici['variabile_echivalente'] += substituite
+        # Substitutia poate produce unitati noi; altfel s-a atins punctul fix
+        if not substituite or not any(len(clauza) == 1 for clauza in clauze):
+            break
+
+    if clauze_blocate:
+        clauze, eliminate = elimina_clauze_blocate(clauze, stiva, limita_verificari)
+        statistici['clauze_blocate'] = eliminate
+
+    variabile = sorted({abs(literal) for clauza in clauze for literal in clauza})
+    variabila_noua = {variabila: i for i, variabila in enumerate(variabile, 1)}
+    stiva.variabile_originale = [0] + variabile
+    clauze_reduse = [[variabila_noua[abs(literal)] if literal > 0 else -variabila_noua[abs(literal)]
+                      for literal in clauza] for clauza in sorted(clauze)]
+    statistici['rezultat'] = 'SAT' if not clauze_reduse else 'NECUNOSCUT'
+    return incheie(clauze_reduse, len(variabile))
+
+
+def extinde_model(stiva, atribuire):
+    """Modelul formulei originale dintr-un model al formulei preprocesate (stiva None = fara preprocesare)."""
+    if stiva is None or atribuire is None:
+        return atribuire
+    return stiva.extinde_model(atribuire)
+
+
 # --- Functie de Verificare (Optional) ---
 def verifica_atribuirea(clauze, atribuire):
     """Verifica daca o atribuire data satisface toate clauzele."""
@@ -587,6 +4357,11 @@ def verifica_atribuirea(clauze, atribuire):
         print("Verificare: Nu a fost furnizata nicio atribuire.")
         return False
 
+    # Pe formule mari verificarea in bloc ajunge; doar un esec reface bucla pentru mesajele detaliate
+    if np is not None and len(clauze) >= prag_vectorizare and verifica_vectorizat(clauze, atribuire):
+        print("Verificare Reusita: Atribuirea satisface toate clauzele.")
+        return True
+
     toate_satisfacute = True
     for i, clauza in enumerate(clauze):
         clauza_satisfacuta = False
@@ -620,36 +4395,441 @@ def verifica_atribuirea(clauze, atribuire):
         return False
 
 
+def afiseaza_atribuirea(nume_algoritm, clauze, atribuire, numar_variabile, verifica):
+    """Afiseaza primele variabile ale unui model si, optional, il verifica."""
+    if not atribuire:
+        print(f"Avertisment: {nume_algoritm} a returnat SAT dar atribuirea este goala/None.")
+        return
+
+    limita_afisare = 20
+    atribuire_limitata = dict(sorted(atribuire.items())[:limita_afisare])
+    sir_atribuire_lim = ", ".join(
+        f"x{v}={('A' if val else 'F')}" for v, val in
+        atribuire_limitata.items())
+    print(
+        f"Atribuire Satisfacatoare (primele {min(limita_afisare, numar_variabile)} variabile afisate):")
+    print(f"  {{{sir_atribuire_lim}{'...' if numar_variabile > limita_afisare else ''}}}")
+
+    if verifica:
+        print("-" * 10 + f" Verificare Atribuire {nume_algoritm} " + "-" * 10)
+        verifica_atribuirea(clauze, atribuire)
+        print("-" * 40)
+
+
+# --- Rulare in lot (benchmark pe directoare de instante) ---
+ALGORITMI_LOT = {
+    'Rezolutie': rezolva_prin_rezolutie,
+    'DP': rezolva_dp,
+    'DPLL': rezolva_dpll,
+    'CDCL': rezolva_cdcl,
+    'CautareLocala': rezolva_cautare_locala,
+    'CubSiCucerire': rezolva_cub_si_cucerire,
+    'Componente': rezolva_pe_componente,
+}
+
+CAMPURI_REZULTATE_LOT = ('instanta', 'algoritm', 'stare', 'timp', 'model_verificat', 'statistici')
+
+
+class LimitaDuraDepasita(BaseException):
+    """Semnalata de alarma procesului de lucru; derivata din BaseException ca sa nu fie prinsa de solvere."""
+
+
+def este_fisier_cnf(nume):
+    """True pentru fisierele .cnf, eventual comprimate (.cnf.gz, .cnf.xz, .cnf.bz2)."""
+    baza, extensie = os.path.splitext(nume.lower())
+    if extensie in DECOMPRESOARE:
+        baza, extensie = os.path.splitext(baza)
+    return extensie == '.cnf'
+
+
+def enumera_instante(sursa):
+    """Lista sortata a instantelor CNF dintr-un director (recursiv), o arhiva .zip sau un tipar glob.
+
+    Pentru arhive se poate da si un subdirector, de exemplu 'Teste.zip/Teste/CBS_k3_n100_m403_b10';
+    membrii sunt intorsi in forma 'arhiva.zip/membru' acceptata de deschide_sursa_cnf.
+    """
+    if os.path.isdir(sursa):
+        return sorted(os.path.join(director, nume)
+                      for director, _, fisiere in os.walk(sursa)
+                      for nume in fisiere if este_fisier_cnf(nume))
+
+    arhiva, prefix = imparte_cale_zip(sursa)
+    if arhiva is not None:
+        prefix = prefix.rstrip('/') + '/' if prefix else ''
+        with zipfile.ZipFile(arhiva) as z:
+            return sorted(f"{arhiva}/{membru}" for membru in z.namelist()
+                          if membru.startswith(prefix) and este_fisier_cnf(membru))
+
+    return sorted(cale for cale in glob.glob(sursa, recursive=True)
+                  if os.path.isfile(cale) and este_fisier_cnf(cale))
+
+
+def _alarma_lot(semnal, cadru):
+    raise LimitaDuraDepasita()
+
+
+def initializeaza_proces_lot(memorie_maxima_mb):
+    """Initializeaza un proces de lucru: limita de memorie, alarma si iesirea standard redusa la tacere."""
+    if memorie_maxima_mb and resource is not None:
+        octeti = int(memorie_maxima_mb) * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (octeti, octeti))
+        except (ValueError, OSError) as e:
+            warnings.warn(f"Limita de memorie nu a putut fi aplicata: {e}")
+    if hasattr(signal, 'SIGALRM'):
+        signal.signal(signal.SIGALRM, _alarma_lot)
+    sys.stdout = open(os.devnull, 'w')  # mesajele solverelor ar amesteca iesirea procesului principal
+
+
+def ruleaza_instanta_lot(cale, algoritmi, timpi_maximi, parametri, marja_limita_dura, preprocesare=False,
+                         cache=None):
+    """Ruleaza algoritmii selectati pe o instanta si intoarce cate un rand de rezultate pentru fiecare.
+
+    Limita moale este timpul maxim al fiecarui solver; limita dura (timp maxim + marja) este impusa
+    prin SIGALRM pentru solverele care nu verifica ceasul suficient de des (ex. DP intr-o eliminare).
+    Cu preprocesare, formula este redusa o singura data si impartita de toti algoritmii; modelele
+    sunt extinse si verificate pe formula originala. Cu cache (director, dimensiune_maxima_mb), formula
+    parsata si cea preprocesata sunt citite din / scrise in CacheFormule.
+    """
+    cache = CacheFormule(*cache) if cache is not None else None
+    cheie = None
+    try:
+        if cache is not None:
+            clauze, numar_variabile, cheie = cache.parseaza_dimacs(cale)
+        else:
+            clauze, numar_variabile = parseaza_dimacs(cale)
+    except MemoryError:
+        clauze, numar_variabile = None, 0
+    if clauze is None:
+        return [{'instanta': cale, 'algoritm': nume, 'stare': 'EROARE (Parsare)', 'timp': 0.0,
+                 'model_verificat': None, 'statistici': {}} for nume in algoritmi]
+
+    clauze_solver, variabile_solver, stiva = clauze, numar_variabile, None
+    timp_preprocesare = 0.0
+    if preprocesare and clauze:
+        if cache is not None:
+            clauze_solver, variabile_solver, stiva, statistici_preprocesare = \
+                cache.preproceseaza(cheie, clauze, numar_variabile)
+        else:
+            clauze_solver, variabile_solver, stiva, statistici_preprocesare = preproceseaza(clauze, numar_variabile)
+        timp_preprocesare = statistici_preprocesare['timp']
+
+    randuri = []
+    for nume in algoritmi:
+        timp_maxim = timpi_maximi[nume]
+        statistici_rulare, model_verificat = {}, None
+        timp_s = time.perf_counter()
+        try:
+            if hasattr(signal, 'setitimer'):
+                signal.setitimer(signal.ITIMER_REAL, timp_maxim + marja_limita_dura)
+            stare, atribuire, statistici_rulare = ALGORITMI_LOT[nume](clauze_solver, variabile_solver, timp_maxim,
+                                                                      **parametri.get(nume, {}))
+            if stare == 'SAT' and atribuire is not None:
+                model_verificat = verifica_atribuirea(clauze, extinde_model(stiva, atribuire))
+        except LimitaDuraDepasita:
+            stare = 'TIMP_DEPASIT (Limita dura)'
+        except MemoryError:
+            stare = 'MEMORIE_DEPASITA'
+        finally:
+            if hasattr(signal, 'setitimer'):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        randuri.append({'instanta': cale, 'algoritm': nume, 'stare': stare,
+                        'timp': time.perf_counter() - timp_s + timp_preprocesare, 'model_verificat': model_verificat,
+                        'statistici': statistici_rulare})
+    return randuri
+
+
+class ScriitorRezultate:
+    """Scrie randurile de rezultate pe masura ce sosesc, in format CSV sau JSONL (dupa extensie)."""
+
+    def __init__(self, fisier):
+        self.fisier = fisier
+        self.este_csv = fisier.lower().endswith('.csv')
+        self.flux = open(fisier, 'w', newline='' if self.este_csv else None)
+        if self.este_csv:
+            self.scriitor = csv.DictWriter(self.flux, fieldnames=CAMPURI_REZULTATE_LOT)
+            self.scriitor.writeheader()
+
+    def scrie(self, rand):
+        if self.este_csv:
+            self.scriitor.writerow(dict(rand, statistici=json.dumps(rand['statistici'])))
+        else:
+            self.flux.write(json.dumps(rand) + "\n")
+        self.flux.flush()
+
+    def inchide(self):
+        self.flux.close()
+
+
+def ruleaza_lot(sursa, fisier_rezultate, algoritmi=('DPLL',), timpi_maximi=None, parametri=None,
+                memorie_maxima_mb=None, numar_procese=None, marja_limita_dura=5.0, preprocesare=False,
+                cache=None):
+    """Distribuie instantele din sursa pe un ProcessPoolExecutor (implicit un proces per nucleu).
+
+    cache = (director, dimensiune_maxima_mb) activeaza CacheFormule in procesele de lucru.
+
+    Intoarce un sumar {algoritm: {stare: numar}}; randurile complete ajung in fisier_rezultate.
+    """
+    instante = enumera_instante(sursa)
+    if not instante:
+        print(f"Lot: nicio instanta CNF gasita in {sursa}")
+        return {}
+    timpi_maximi = timpi_maximi or {}
+    timpi_maximi = {nume: timpi_maximi.get(nume, 60) for nume in algoritmi}
+    parametri = parametri or {}
+    numar_procese = numar_procese or os.cpu_count() or 1
+
+    print(f"Lot: {len(instante)} instante, algoritmi {list(algoritmi)}, {numar_procese} procese, "
+          f"rezultate in {fisier_rezultate}")
+    sumar = {nume: {} for nume in algoritmi}
+    scriitor = ScriitorRezultate(fisier_rezultate)
+    timp_s = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=numar_procese, initializer=initializeaza_proces_lot,
+                                 initargs=(memorie_maxima_mb,)) as executor:
+            viitoare = {executor.submit(ruleaza_instanta_lot, cale, tuple(algoritmi), timpi_maximi,
+                                        parametri, marja_limita_dura, preprocesare, cache): cale
+                        for cale in instante}
+            for terminate, viitor in enumerate(as_completed(viitoare), 1):
+                cale = viitoare[viitor]
+                try:
+                    randuri = viitor.result()
+                except Exception as e:  # procesul de lucru a murit (ex. ucis de sistem)
+                    randuri = [{'instanta': cale, 'algoritm': nume, 'stare': f"EROARE ({type(e).__name__})",
+                                'timp': 0.0, 'model_verificat': None, 'statistici': {}}
+                               for nume in algoritmi]
+                for rand in randuri:
+                    scriitor.scrie(rand)
+                    stari = sumar[rand['algoritm']]
+                    stari[rand['stare']] = stari.get(rand['stare'], 0) + 1
+                if terminate % 50 == 0 or terminate == len(instante):
+                    print(f"Lot: {terminate}/{len(instante)} instante ({time.perf_counter() - timp_s:.1f}s)")
+    finally:
+        scriitor.inchide()
+
+    print("\n" + "=" * 20 + " Sumar Lot " + "=" * 20)
+    for nume, stari in sumar.items():
+        print(f"- {nume:<13}: " + ", ".join(f"{stare}={numar}" for stare, numar in sorted(stari.items())))
+    print("=" * 51)
+    return sumar
+
+
+# --- Portofoliu (algoritmi rulati in paralel, primul raspuns castiga) ---
+CONFIGURATII_PORTOFOLIU = (
+    ('Rezolutie', 'Rezolutie', {}),
+    ('DP', 'DP', {}),
+    ('DPLL-ordine', 'DPLL', {'euristica': 'ordine'}),
+    ('DPLL-vsids', 'DPLL', {'euristica': 'vsids', 'restart': 'luby', 'salvare_faza': True}),
+    ('DPLL-dlis', 'DPLL', {'euristica': 'dlis'}),
+    ('DPLL-moms', 'DPLL', {'euristica': 'moms'}),
+    ('CDCL', 'CDCL', {}),
+    ('CautareLocala', 'CautareLocala', {'numar_plimbari': 1}),  # procesele portofoliului nu pot avea copii
+)
+
+
+def ruleaza_motor_portofoliu(nume, algoritm, parametri, clauze, numar_variabile, timp_maxim, oprire, coada):
+    """Corpul unui proces din portofoliu: ruleaza un solver si trimite rezultatul prin coada."""
+    sys.stdout = open(os.devnull, 'w')
+    timp_s = time.perf_counter()
+    atribuire, statistici_rulare = None, {}
+    try:
+        stare, atribuire, statistici_rulare = ALGORITMI_LOT[algoritm](clauze, numar_variabile, timp_maxim,
+                                                                      oprire=oprire, **parametri)
+    except MemoryError:
+        stare = 'MEMORIE_DEPASITA'
+    except Exception as e:
+        stare = f"EROARE ({type(e).__name__})"
+    coada.put({'motor': nume, 'stare': stare, 'timp': time.perf_counter() - timp_s,
+               'atribuire': atribuire, 'statistici_rulare': statistici_rulare})
+
+
+def rezolva_portofoliu(clauze, numar_variabile, timp_maxim, configuratii=CONFIGURATII_PORTOFOLIU,
+                       timp_gratie=2.0):
+    """Porneste fiecare configuratie intr-un proces separat si intoarce primul raspuns SAT/UNSAT.
+
+    Dupa primul raspuns definitiv, celelalte procese sunt anuntate prin evenimentul de oprire si
+    au timp_gratie secunde sa-si trimita statisticile partiale (stare "ANULAT"); cele care nu
+    raspund (ex. DP blocat intr-o eliminare mare) sunt terminate fortat.
+    Intoarce (stare, atribuire, statistici) cu statistici = {'castigator': ..., 'motoare': {...}}.
+    """
+    oprire = multiprocessing.Event()
+    coada = multiprocessing.Queue()
+    procese = {}
+    for nume, algoritm, parametri in configuratii:
+        proces = multiprocessing.Process(target=ruleaza_motor_portofoliu, daemon=True,
+                                         args=(nume, algoritm, parametri, clauze, numar_variabile,
+                                               timp_maxim, oprire, coada))
+        proces.start()
+        procese[nume] = proces
+
+    rezultate_motoare = {}
+    castigator = None
+    termen = time.perf_counter() + timp_maxim + timp_gratie
+    while len(rezultate_motoare) < len(procese):
+        if time.perf_counter() > termen:
+            if oprire.is_set():
+                break  # timpul de gratie a expirat
+            oprire.set()  # limita globala: motoarele ramase se opresc cu statisticile lor partiale
+            termen = time.perf_counter() + timp_gratie
+        try:
+            rezultat = coada.get(timeout=0.05)
+        except queue.Empty:
+            if coada.empty() and not any(proces.is_alive() for nume, proces in procese.items()
+                                         if nume not in rezultate_motoare):
+                break  # procesele ramase au murit fara sa raspunda
+            continue
+        rezultate_motoare[rezultat['motor']] = rezultat
+        if castigator is None and rezultat['stare'] in ('SAT', 'UNSAT'):
+            castigator = rezultat
+            oprire.set()
+            termen = time.perf_counter() + timp_gratie
+
+    for nume, proces in procese.items():
+        if nume not in rezultate_motoare:
+            if proces.is_alive():
+                proces.terminate()
+            rezultate_motoare[nume] = {'motor': nume, 'stare': 'ANULAT (Fortat)', 'timp': None,
+                                       'atribuire': None, 'statistici_rulare': {}}
+        proces.join()
+
+    statistici = {'castigator': castigator['motor'] if castigator else None,
+                  'motoare': {nume: {'stare': rez['stare'], 'timp': rez['timp'],
+                                     'statistici': rez['statistici_rulare']}
+                              for nume, rez in rezultate_motoare.items()}}
+    if castigator is None:
+        return "NECUNOSCUT", None, statistici
+    return castigator['stare'], castigator['atribuire'], statistici
+
+
 def main():
 
 
     FOLOSESTE_FISIER = True  # Seteaza FOLOSESTE_FISIER = True si CALE_FISIER cu numele fisierului (Daca e False se genereaza un test aleatoriu)
-    CALE_FISIER = 'test.cnf'  # Exemplu: 'uf20-01.cnf' sau 'uuf50-01.cnf'
+    CALE_FISIER = 'test.cnf'  # Exemplu: 'uf20-01.cnf', 'uuf50-01.cnf.gz' sau 'Teste.zip/Teste/pigeon-hole/hole6.cnf'
 
     # Parametri pentru generarea FNC daca FOLOSESTE_FISIER este False
     GEN_NUMAR_VARIABILE = 5
     GEN_NUMAR_CLAUZE = 10
     GEN_K = 3
     GEN_ASIGURA_SATISFIABILITATE = False
+    GEN_SAMANTA = None  # Intreg pentru instante reproductibile (generatorul NumPy); None = aleatoare
 
     # Timpi maximi in secunde pentru fiecare algoritm
     TIMP_MAXIM_REZOLUTIE = 30
     TIMP_MAXIM_DP = 30
     TIMP_MAXIM_DPLL = 3600
-
+    TIMP_MAXIM_CDCL = 3600
+    TIMP_MAXIM_CAUTARE_LOCALA = 60
+    TIMP_MAXIM_CUB_SI_CUCERIRE = 3600
+    TIMP_MAXIM_COMPONENTE = 3600
+
+    # Ordinea de eliminare DP: 'secventiala' (1..n), 'min_produs' (|poz|*|neg|) sau 'min_crestere'
+    ORDINE_ELIMINARE_DP = 'min_crestere'
+
+    # Procese pentru generarea rezolventilor in rundele mari de Rezolutie / eliminarile mari DP (None = os.cpu_count())
+    NUMAR_PROCESE_REZOLVENTI = None
+
+    # Buget de memorie (MB) pentru clauzele Rezolutiei / DP; peste el clauzele sunt descarcate pe disc in
+    # DIRECTOR_DESCARCARE (None = directorul temporar al sistemului). None = limita fixa de clauze, cu oprire
+    BUGET_MEMORIE_CLAUZE_MB = None
+    DIRECTOR_DESCARCARE = None
+
+    # Bugete suplimentare pentru Rezolutie / DP / DPLL / CDCL, verificate cooperativ din buclele interioare
+    # (GuvernatorResurse): timp CPU in secunde si memorie rezidenta (RSS) in MB. None = fara limita
+    TIMP_CPU_MAXIM = None
+    MEMORIE_MAXIMA_RSS_MB = None
+
+    # Euristici de ramificare: 'ordine' (prima variabila libera), 'vsids', 'dlis' sau 'moms'
+    EURISTICA_DPLL = 'ordine'
+    EURISTICA_CDCL = 'vsids'
+
+    # Politici de restart: None, 'luby', 'geometric' sau 'glucose' (doar CDCL); salvarea fazei pastreaza polaritatile
+    RESTART_DPLL = None
+    RESTART_CDCL = 'luby'
+    SALVARE_FAZA_DPLL = False
+    SALVARE_FAZA_CDCL = True
+
+    # Cautare locala (incompleta, doar SAT): 'probsat' sau 'walksat'; plimbari paralele cu seminte diferite
+    METODA_CAUTARE_LOCALA = 'probsat'
+    NUMAR_PLIMBARI = None  # None = os.cpu_count()
+
+    # Cube-and-conquer: lookahead-ul imparte formula in cuburi rezolvate de DPLL in paralel (EURISTICA_DPLL)
+    NUMAR_PROCESE_CUBURI = None  # None = os.cpu_count()
+    CUBURI_PER_PROCES = 16
+
+    # Descompunere in componente conexe, rezolvate separat ('DPLL' sau 'CDCL'), in paralel cand merita
+    SOLVER_COMPONENTE = 'DPLL'
+    ADANCIME_DIVIZARE_COMPONENTE = 4  # Niveluri de decizie dupa care componentele mai sunt redescompuse
+
+    # Preprocesare inaintea solverelor: duplicate, tautologii, unitati, literali esuati,
+    # literali echivalenti si clauze blocate; modelele sunt reconstruite pentru formula originala
+    PREPROCESARE = True
+
+    # Cache pe disc al formulelor parsate si preprocesate, dupa hash-ul continutului (evacuare LRU)
+    CACHE_FORMULE = True
+    DIRECTOR_CACHE = '.cache_cnf'
+    DIMENSIUNE_MAXIMA_CACHE_MB = 512
+
+    # Profilare: timp pe faze (propagare, ramificare, analiza, generare...), histograme si progres periodic
+    # in FISIER_PROFIL (JSONL); rezumatul apare si in statistici. Fara profilare costul este neglijabil.
+    PROFILARE = False
+    FISIER_PROFIL = 'profil.jsonl'
+    INTERVAL_PROFIL = 1.0  # Secunde intre instantaneele de progres
 
     # Selecteaza algoritmii de rulat
     RULEAZA_REZOLUTIE = True
     RULEAZA_DP = True
     RULEAZA_DPLL = True
-    VERIFICA_DPLL_SAT = True  # Daca True si DPLL returneaza SAT, ruleaza o verificare
+    RULEAZA_CDCL = True
+    RULEAZA_CAUTARE_LOCALA = False  # Pe formule UNSAT consuma tot timpul maxim si raspunde NECUNOSCUT
+    RULEAZA_CUB_SI_CUCERIRE = False
+    RULEAZA_COMPONENTE = False
+    VERIFICA_DPLL_SAT = True  # Daca True si DP/DPLL/CDCL/cautarea locala returneaza SAT, ruleaza o verificare
+
+    # Portofoliu: algoritmii selectati (si variante DPLL) ruleaza in paralel, primul raspuns SAT/UNSAT castiga
+    MOD_PORTOFOLIU = False
+    TIMP_MAXIM_PORTOFOLIU = 3600
+
+    # Rulare in lot: toate instantele dintr-un director, tipar glob sau arhiva .zip, cate un proces per nucleu
+    MOD_LOT = False
+    SURSA_LOT = 'Teste.zip/Teste/CBS_k3_n100_m403_b10'  # Exemplu: 'Teste/pigeon-hole', 'teste/**/*.cnf'
+    FISIER_REZULTATE_LOT = 'rezultate_lot.csv'  # .csv sau .jsonl
+    MEMORIE_MAXIMA_LOT_MB = 2048  # Limita de memorie per proces (None = fara limita)
+    NUMAR_PROCESE_LOT = None  # None = os.cpu_count()
 
     # --- Sfarsit Configurare ---
 
+    if MOD_LOT:
+        algoritmi_lot = [nume for nume, ruleaza in (('Rezolutie', RULEAZA_REZOLUTIE), ('DP', RULEAZA_DP),
+                                                   ('DPLL', RULEAZA_DPLL), ('CDCL', RULEAZA_CDCL),
+                                                   ('CautareLocala', RULEAZA_CAUTARE_LOCALA),
+                                                   ('CubSiCucerire', RULEAZA_CUB_SI_CUCERIRE),
+                                                   ('Componente', RULEAZA_COMPONENTE)) if ruleaza]
+        ruleaza_lot(SURSA_LOT, FISIER_REZULTATE_LOT, algoritmi_lot,
+                    timpi_maximi={'Rezolutie': TIMP_MAXIM_REZOLUTIE, 'DP': TIMP_MAXIM_DP,
+                                  'DPLL': TIMP_MAXIM_DPLL, 'CDCL': TIMP_MAXIM_CDCL,
+                                  'CautareLocala': TIMP_MAXIM_CAUTARE_LOCALA,
+                                  'CubSiCucerire': TIMP_MAXIM_CUB_SI_CUCERIRE,
+                                  'Componente': TIMP_MAXIM_COMPONENTE},
+                    parametri={'DP': {'ordine': ORDINE_ELIMINARE_DP},
+                               'DPLL': {'euristica': EURISTICA_DPLL, 'restart': RESTART_DPLL,
+                                        'salvare_faza': SALVARE_FAZA_DPLL},
+                               'CDCL': {'euristica': EURISTICA_CDCL, 'restart': RESTART_CDCL,
+                                        'salvare_faza': SALVARE_FAZA_CDCL},
+                               # lotul ruleaza deja cate o instanta per nucleu
+                               'CautareLocala': {'metoda': METODA_CAUTARE_LOCALA, 'numar_plimbari': 1},
+                               'CubSiCucerire': {'numar_procese': 1, 'euristica': EURISTICA_DPLL},
+                               'Componente': {'numar_procese': 1, 'solver': SOLVER_COMPONENTE,
+                                              'adancime_divizare': ADANCIME_DIVIZARE_COMPONENTE}},
+                    memorie_maxima_mb=MEMORIE_MAXIMA_LOT_MB, numar_procese=NUMAR_PROCESE_LOT,
+                    preprocesare=PREPROCESARE,
+                    cache=(DIRECTOR_CACHE, DIMENSIUNE_MAXIMA_CACHE_MB) if CACHE_FORMULE else None)
+        return
+
+    cache = cheie_cache = None  # formulele generate nu trec prin cache
     if FOLOSESTE_FISIER:
         print(f"Se incearca incarcarea FNC din: {CALE_FISIER}")
-        import os
-        if not os.path.exists(CALE_FISIER):
+        if not sursa_cnf_exista(CALE_FISIER):
             print(f"Eroare: Fisierul nu a fost gasit la {CALE_FISIER}")
             if CALE_FISIER == 'example.cnf':
                 print("Se creeaza un fisier exemplu mic 'example.cnf'.")
@@ -668,7 +4848,12 @@ def main():
             else:
                 return
 
-        rezultat_parsare = parseaza_dimacs(CALE_FISIER)
+        if CACHE_FORMULE:
+            cache = CacheFormule(DIRECTOR_CACHE, DIMENSIUNE_MAXIMA_CACHE_MB)
+            clauze, numar_variabile, cheie_cache = cache.parseaza_dimacs(CALE_FISIER)
+            rezultat_parsare = (clauze, numar_variabile)
+        else:
+            rezultat_parsare = parseaza_dimacs(CALE_FISIER)
         if rezultat_parsare is not None and rezultat_parsare[0] is not None:
             clauze, numar_variabile = rezultat_parsare
         else:
@@ -677,19 +4862,27 @@ def main():
     else:
         print(f"Se genereaza FNC-{GEN_K} aleatoriu cu {GEN_NUMAR_VARIABILE} variabile si {GEN_NUMAR_CLAUZE} clauze...")
         try:
-            clauze, numar_variabile = genereaza_fnc(GEN_NUMAR_VARIABILE, GEN_NUMAR_CLAUZE, GEN_K,
-                                                    GEN_ASIGURA_SATISFIABILITATE)
-            nume_fisier_generat = f"generat_{numar_variabile}v_{len(clauze)}c_{GEN_K}k.cnf"
-            try:
-                with open(nume_fisier_generat, "w") as f:
-                    f.write(f"c FNC-{GEN_K} generat aleatoriu\n")
-                    f.write(f"p cnf {numar_variabile} {len(clauze)}\n")
-                    for clauza_item in clauze:
-                        f.write(" ".join(map(str, clauza_item)) + " 0\n")
+            if np is not None:
+                # Generatorul vectorizat scrie fisierul direct, pe masura ce trage clauzele
+                nume_fisier_generat = f"generat_{GEN_NUMAR_VARIABILE}v_{GEN_NUMAR_CLAUZE}c_{GEN_K}k.cnf"
+                clauze, numar_variabile = genereaza_fnc_vectorizat(GEN_NUMAR_VARIABILE, GEN_NUMAR_CLAUZE, GEN_K,
+                                                                   GEN_ASIGURA_SATISFIABILITATE, GEN_SAMANTA,
+                                                                   cale_iesire=nume_fisier_generat)
                 print(f"FNC generat salvat in {nume_fisier_generat}")
-            except Exception as e:
-                print(f"Eroare la salvarea fisierului generat: {e}")
-        except ValueError as e:
+            else:
+                clauze, numar_variabile = genereaza_fnc(GEN_NUMAR_VARIABILE, GEN_NUMAR_CLAUZE, GEN_K,
+                                                        GEN_ASIGURA_SATISFIABILITATE)
+                nume_fisier_generat = f"generat_{numar_variabile}v_{len(clauze)}c_{GEN_K}k.cnf"
+                try:
+                    with open(nume_fisier_generat, "w") as f:
+                        f.write(f"c FNC-{GEN_K} generat aleatoriu\n")
+                        f.write(f"p cnf {numar_variabile} {len(clauze)}\n")
+                        for clauza_item in clauze:
+                            f.write(" ".join(map(str, clauza_item)) + " 0\n")
+                    print(f"FNC generat salvat in {nume_fisier_generat}")
+                except Exception as e:
+                    print(f"Eroare la salvarea fisierului generat: {e}")
+        except (ValueError, OSError) as e:
             print(f"Eroare in timpul generarii: {e}")
             return
 
@@ -697,48 +4890,116 @@ def main():
         print("Nicio formula FNC valida nu a fost incarcata sau generata. Programul se opreste.")
         return
 
+    # Solverele primesc formula (eventual) preprocesata; modelele sunt extinse la formula originala
+    clauze_solver, variabile_solver = clauze, numar_variabile
+    stiva_preprocesare = statistici_preprocesare = None
+    if PREPROCESARE and clauze:
+        print("\n" + "=" * 15 + " Preprocesare " + "=" * 15)
+        if cache is not None:
+            clauze_solver, variabile_solver, stiva_preprocesare, statistici_preprocesare = \
+                cache.preproceseaza(cheie_cache, clauze, numar_variabile)
+        else:
+            clauze_solver, variabile_solver, stiva_preprocesare, statistici_preprocesare = \
+                preproceseaza(clauze, numar_variabile)
+        print(f"Formula redusa: {variabile_solver} variabile, {len(clauze_solver)} clauze "
+              f"(rezultat preprocesare: {statistici_preprocesare['rezultat']})")
+        print(f"Timp: {statistici_preprocesare['timp']:.4f} secunde")
+        print(f"Statistici: {statistici_preprocesare}")
+
+    profil = Profilator(FISIER_PROFIL, INTERVAL_PROFIL) if PROFILARE else None
+
+    def ruleaza_solver(nume, solver, *argumente, **optiuni):
+        optiuni.update(timp_cpu_maxim=TIMP_CPU_MAXIM, memorie_maxima_mb=MEMORIE_MAXIMA_RSS_MB)
+        if profil is None:
+            return solver(*argumente, **optiuni)
+        return profil.ruleaza(nume, solver, *argumente, **optiuni)
+
     rezultate = {}
-    if numar_variabile == 0 and not clauze:
+    if variabile_solver == 0 and not clauze_solver:
         print("Formula este goala (0 variabile, 0 clauze). Rezultat: SAT")
+        atribuire = extinde_model(stiva_preprocesare, {})
         rezultate = {'Rezolutie': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}},
-                     'DP': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}},
-                     'DPLL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': {}}}
-    elif numar_variabile > 0 and not clauze:
+                     'DP': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire},
+                     'DPLL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire},
+                     'CDCL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire}}
+    elif variabile_solver > 0 and not clauze_solver:
         print("Formula are variabile dar nu are clauze. Rezultat: SAT")
-        atribuire = {v: True for v in range(1, numar_variabile + 1)}
+        atribuire = extinde_model(stiva_preprocesare, {v: True for v in range(1, variabile_solver + 1)})
         rezultate = {'Rezolutie': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}},
-                     'DP': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}},
-                     'DPLL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire}}
+                     'DP': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire},
+                     'DPLL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire},
+                     'CDCL': {'stare': 'SAT', 'timp': 0.0, 'statistici_rulare': {}, 'atribuire': atribuire}}
+    elif MOD_PORTOFOLIU:
+        print(f"\nFormula incarcata/generata: {variabile_solver} variabile, {len(clauze_solver)} clauze.")
+        selectati = {'Rezolutie': RULEAZA_REZOLUTIE, 'DP': RULEAZA_DP, 'DPLL': RULEAZA_DPLL, 'CDCL': RULEAZA_CDCL,
+                     'CautareLocala': RULEAZA_CAUTARE_LOCALA, 'CubSiCucerire': RULEAZA_CUB_SI_CUCERIRE,
+                     'Componente': RULEAZA_COMPONENTE}
+        configuratii = [c for c in CONFIGURATII_PORTOFOLIU if selectati[c[1]]]
+        print("\n" + "=" * 15 + f" Rulare Portofoliu ({len(configuratii)} motoare) " + "=" * 15)
+        timp_s = time.perf_counter()
+        stare, atribuire, statistici_rulare = rezolva_portofoliu(clauze_solver, variabile_solver,
+                                                                 TIMP_MAXIM_PORTOFOLIU, configuratii)
+        durata = time.perf_counter() - timp_s
+        atribuire = extinde_model(stiva_preprocesare, atribuire)
+        rezultate['Portofoliu'] = {'stare': stare, 'timp': durata, 'atribuire': atribuire,
+                                   'statistici_rulare': {'castigator': statistici_rulare['castigator']}}
+        print(f"Rezultat: {stare} (castigator: {statistici_rulare['castigator']})")
+        print(f"Timp: {durata:.4f} secunde")
+        for nume, rez in statistici_rulare['motoare'].items():
+            sir_timp = f"{rez['timp']:.4f}s" if rez['timp'] is not None else "-"
+            print(f"  {nume:<13}: Stare={rez['stare']:<16} Timp={sir_timp:<10} Statistici={rez['statistici']}")
+        if stare == "SAT" and atribuire:
+            afiseaza_atribuirea('Portofoliu', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
     else:
-        print(f"\nFormula incarcata/generata: {numar_variabile} variabile, {len(clauze)} clauze.")
+        print(f"\nFormula incarcata/generata: {variabile_solver} variabile, {len(clauze_solver)} clauze.")
 
         if RULEAZA_REZOLUTIE:
             print("\n" + "=" * 15 + " Rulare Rezolutie " + "=" * 15)
             timp_s = time.perf_counter()
-            stare, _, statistici_rulare = rezolva_prin_rezolutie(clauze, numar_variabile, TIMP_MAXIM_REZOLUTIE)
+            stare, atribuire, statistici_rulare = ruleaza_solver('Rezolutie', rezolva_prin_rezolutie,
+                                                                 clauze_solver, variabile_solver, TIMP_MAXIM_REZOLUTIE,
+                                                                 numar_procese=NUMAR_PROCESE_REZOLVENTI,
+                                                                 buget_memorie_mb=BUGET_MEMORIE_CLAUZE_MB,
+                                                                 director_descarcare=DIRECTOR_DESCARCARE)
             timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
             durata = timp_e - timp_s
-            rezultate['Rezolutie'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare}
+            rezultate['Rezolutie'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                                      'atribuire': atribuire}
             print(f"Rezultat: {stare}")
             print(f"Timp: {durata:.4f} secunde")
             print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('Rezolutie', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
 
         if RULEAZA_DP:
             print("\n" + "=" * 15 + " Rulare Davis-Putnam (Original) " + "=" * 15)
             timp_s = time.perf_counter()
-            stare, _, statistici_rulare = rezolva_dp(clauze, numar_variabile, TIMP_MAXIM_DP)
+            stare, atribuire, statistici_rulare = ruleaza_solver('DP', rezolva_dp, clauze_solver, variabile_solver,
+                                                                 TIMP_MAXIM_DP, ordine=ORDINE_ELIMINARE_DP,
+                                                                 numar_procese=NUMAR_PROCESE_REZOLVENTI,
+                                                                 buget_memorie_mb=BUGET_MEMORIE_CLAUZE_MB,
+                                                                 director_descarcare=DIRECTOR_DESCARCARE)
             timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
             durata = timp_e - timp_s
-            rezultate['DP'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare}
-            print(f"Rezultat: {stare} (Nota: DP nu furnizeaza un model)")
+            rezultate['DP'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                               'atribuire': atribuire}
+            print(f"Rezultat: {stare}")
             print(f"Timp: {durata:.4f} secunde")
             print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('DP', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
 
         if RULEAZA_DPLL:
             print("\n" + "=" * 15 + " Rulare DPLL " + "=" * 15)
             timp_s = time.perf_counter()
-            stare, atribuire, statistici_rulare = rezolva_dpll(clauze, numar_variabile, TIMP_MAXIM_DPLL)
+            stare, atribuire, statistici_rulare = ruleaza_solver('DPLL', rezolva_dpll, clauze_solver,
+                                                                 variabile_solver, TIMP_MAXIM_DPLL,
+                                                                 euristica=EURISTICA_DPLL, restart=RESTART_DPLL,
+                                                                 salvare_faza=SALVARE_FAZA_DPLL)
             timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
             durata = timp_e - timp_s
             rezultate['DPLL'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
                                  'atribuire': atribuire}
@@ -746,34 +5007,104 @@ def main():
             print(f"Timp: {durata:.4f} secunde")
             print(f"Statistici: {statistici_rulare}")
             if stare == "SAT":
-                if atribuire:
-                    limita_afisare = 20
-                    atribuire_limitata = dict(sorted(atribuire.items())[:limita_afisare])
-                    sir_atribuire_lim = ", ".join(
-                        f"x{v}={('A' if val else 'F')}" for v, val in
-                        atribuire_limitata.items())
-                    print(
-                        f"Atribuire Satisfacatoare (primele {min(limita_afisare, numar_variabile)} variabile afisate):")
-                    print(f"  {{{sir_atribuire_lim}{'...' if numar_variabile > limita_afisare else ''}}}")
-
-                    if VERIFICA_DPLL_SAT:
-                        print("-" * 10 + " Verificare Atribuire DPLL " + "-" * 10)
-                        verifica_atribuirea(clauze, atribuire)
-                        print("-" * 40)
-                else:
-                    print("Avertisment: DPLL a returnat SAT dar atribuirea este goala/None.")
+                afiseaza_atribuirea('DPLL', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
+
+        if RULEAZA_CDCL:
+            print("\n" + "=" * 15 + " Rulare CDCL " + "=" * 15)
+            timp_s = time.perf_counter()
+            stare, atribuire, statistici_rulare = ruleaza_solver('CDCL', rezolva_cdcl, clauze_solver,
+                                                                 variabile_solver, TIMP_MAXIM_CDCL,
+                                                                 euristica=EURISTICA_CDCL, restart=RESTART_CDCL,
+                                                                 salvare_faza=SALVARE_FAZA_CDCL)
+            timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
+            durata = timp_e - timp_s
+            rezultate['CDCL'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                                 'atribuire': atribuire}
+            print(f"Rezultat: {stare}")
+            print(f"Timp: {durata:.4f} secunde")
+            print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('CDCL', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
+
+        if RULEAZA_CAUTARE_LOCALA:
+            print("\n" + "=" * 15 + f" Rulare Cautare Locala ({METODA_CAUTARE_LOCALA}) " + "=" * 15)
+            timp_s = time.perf_counter()
+            stare, atribuire, statistici_rulare = rezolva_cautare_locala(clauze_solver, variabile_solver,
+                                                                         TIMP_MAXIM_CAUTARE_LOCALA,
+                                                                         metoda=METODA_CAUTARE_LOCALA,
+                                                                         numar_plimbari=NUMAR_PLIMBARI)
+            timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
+            durata = timp_e - timp_s
+            rezultate['CautareLocala'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                                          'atribuire': atribuire}
+            print(f"Rezultat: {stare}")
+            print(f"Timp: {durata:.4f} secunde")
+            print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('CautareLocala', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
+
+        if RULEAZA_CUB_SI_CUCERIRE:
+            print("\n" + "=" * 15 + " Rulare Cube-and-Conquer " + "=" * 15)
+            timp_s = time.perf_counter()
+            stare, atribuire, statistici_rulare = rezolva_cub_si_cucerire(clauze_solver, variabile_solver,
+                                                                          TIMP_MAXIM_CUB_SI_CUCERIRE,
+                                                                          numar_procese=NUMAR_PROCESE_CUBURI,
+                                                                          cuburi_per_proces=CUBURI_PER_PROCES,
+                                                                          euristica=EURISTICA_DPLL)
+            timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
+            durata = timp_e - timp_s
+            rezultate['CubSiCucerire'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                                          'atribuire': atribuire}
+            print(f"Rezultat: {stare}")
+            print(f"Timp: {durata:.4f} secunde")
+            print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('CubSiCucerire', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
+
+        if RULEAZA_COMPONENTE:
+            print("\n" + "=" * 15 + f" Rulare pe Componente ({SOLVER_COMPONENTE}) " + "=" * 15)
+            timp_s = time.perf_counter()
+            stare, atribuire, statistici_rulare = rezolva_pe_componente(clauze_solver, variabile_solver,
+                                                                        TIMP_MAXIM_COMPONENTE, solver=SOLVER_COMPONENTE,
+                                                                        adancime_divizare=ADANCIME_DIVIZARE_COMPONENTE)
+            timp_e = time.perf_counter()
+            atribuire = extinde_model(stiva_preprocesare, atribuire)
+            durata = timp_e - timp_s
+            rezultate['Componente'] = {'stare': stare, 'timp': durata, 'statistici_rulare': statistici_rulare,
+                                       'atribuire': atribuire}
+            print(f"Rezultat: {stare}")
+            print(f"Timp: {durata:.4f} secunde")
+            print(f"Statistici: {statistici_rulare}")
+            if stare == "SAT":
+                afiseaza_atribuirea('Componente', clauze, atribuire, numar_variabile, VERIFICA_DPLL_SAT)
+
+    if profil is not None:
+        profil.inchide()
+        print(f"\nProfilul rularilor a fost scris in {FISIER_PROFIL}")
 
     print("\n" + "=" * 20 + " Sumar " + "=" * 20)
+    if statistici_preprocesare is not None:
+        print(f"- {'Preprocesare':<13}: Timp={statistici_preprocesare['timp']:.4f}s "
+              f"Clauze={statistici_preprocesare['clauze_initiale']}->{statistici_preprocesare['clauze_finale']} "
+              f"(-{statistici_preprocesare['reducere_clauze']:.1%}) "
+              f"Variabile={statistici_preprocesare['variabile_initiale']}->{statistici_preprocesare['variabile_finale']} "
+              f"(-{statistici_preprocesare['reducere_variabile']:.1%}) "
+              f"Literali={statistici_preprocesare['literali_initiali']}->{statistici_preprocesare['literali_finali']} "
+              f"(-{statistici_preprocesare['reducere_literali']:.1%})")
     for algoritm, rez in rezultate.items():
         sir_timp = f"{rez['timp']:.4f}s"
         sir_stare = rez['stare']
         sir_statistici = f"Statistici={rez['statistici_rulare']}" if rez.get('statistici_rulare') else ""
 
         info_atribuire = ""
-        if algoritm == 'DPLL' and rez['stare'] == 'SAT':
+        if algoritm in ('DP', 'DPLL', 'CDCL', 'CautareLocala', 'CubSiCucerire', 'Componente', 'Portofoliu') \
+                and rez['stare'] == 'SAT':
             info_atribuire = f"(Atribuire {'gasita' if rez.get('atribuire') else 'lipsa'})"
 
-        print(f"- {algoritm:<12}: Stare={sir_stare:<28} Timp={sir_timp:<10} {sir_statistici} {info_atribuire}")
+        print(f"- {algoritm:<13}: Stare={sir_stare:<28} Timp={sir_timp:<10} {sir_statistici} {info_atribuire}")
     print("=" * 50)
 
 